@@ -0,0 +1,99 @@
+"""Measures the injection throughput of many threads sharing an injector.
+
+Two scenarios are measured:
+- cached: all threads inject targets whose providers are already created
+- resolution: each thread resolves its own chains of classes with auto bindings, so that threads resolve disjoint
+  subgraphs
+
+Usage: PYTHONPATH=. python benchmarks/contention.py [--threads 32] [--runs 5]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from opyoid import Injector, InjectorOptions
+
+CHAIN_LENGTH = 10
+
+
+def create_chain(prefix: str, length: int) -> type:
+    """Returns the last class of a chain of classes, each one depending on the previous one."""
+    dependency: Optional[type] = None
+    for index in range(length):
+        namespace = {}
+        if dependency is not None:
+
+            def __init__(self: Any, dependency_arg: Any) -> None:
+                self.dependency = dependency_arg
+
+            __init__.__annotations__ = {"dependency_arg": dependency, "return": None}
+            namespace["__init__"] = __init__
+        dependency = type(f"{prefix}Class{index}", (), namespace)
+    assert dependency is not None
+    return dependency
+
+
+def run_threads(thread_count: int, target: Callable[[int], None]) -> float:
+    """Returns the duration in milliseconds of running target in thread_count threads started together."""
+    barrier = threading.Barrier(thread_count + 1)
+
+    def wait_and_run(thread_index: int) -> None:
+        barrier.wait()
+        target(thread_index)
+
+    threads = [threading.Thread(target=wait_and_run, args=(index,)) for index in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_cached(thread_count: int) -> float:
+    chain_ends = [create_chain(f"Cached{index}", CHAIN_LENGTH) for index in range(thread_count)]
+    injector = Injector(options=InjectorOptions(auto_bindings=True))
+    for chain_end in chain_ends:
+        injector.inject(chain_end)
+
+    def inject(thread_index: int) -> None:
+        for _ in range(2000):
+            injector.inject(chain_ends[thread_index])
+
+    return run_threads(thread_count, inject)
+
+
+def measure_resolution(thread_count: int) -> float:
+    chain_ends_by_thread: List[List[type]] = [
+        [create_chain(f"Thread{thread_index}Chain{index}", CHAIN_LENGTH) for index in range(20)]
+        for thread_index in range(thread_count)
+    ]
+    injector = Injector(options=InjectorOptions(auto_bindings=True))
+
+    def inject(thread_index: int) -> None:
+        for chain_end in chain_ends_by_thread[thread_index]:
+            injector.inject(chain_end)
+
+    return run_threads(thread_count, inject)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, measure in [("cached", measure_cached), ("resolution", measure_resolution)]:
+        durations = [measure(args.threads) for _ in range(args.runs)]
+        print(
+            f"{name} with {args.threads} threads: median {statistics.median(durations):.1f} ms,"
+            f" min {min(durations):.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
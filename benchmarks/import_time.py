@@ -0,0 +1,48 @@
+"""Measures the import time of opyoid, each import runs in a new interpreter.
+
+The time of an empty interpreter is subtracted, so the result includes the standard library modules and dependencies
+imported by opyoid.
+
+Usage: python benchmarks/import_time.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+STATEMENTS = [
+    "import opyoid",
+    "from opyoid import Injector, Module, SelfBinding",
+    "import opyoid; opyoid.Injector()",
+]
+
+
+def measure(statement: str, runs: int) -> List[float]:
+    """Returns the durations in milliseconds of running the statement in a new interpreter."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("pass", args.runs))
+    for statement in STATEMENTS:
+        durations = measure(statement, args.runs)
+        print(
+            f"{statement!r}: median {statistics.median(durations) - baseline:.1f} ms,"
+            f" min {min(durations) - baseline:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
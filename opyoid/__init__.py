@@ -1,20 +1,92 @@
-from .bindings import (
-    AbstractModule,
-    ClassBinding,
-    InstanceBinding,
-    ItemBinding,
-    Module,
-    MultiBinding,
-    PrivateModule,
-    ProviderBinding,
-    SelfBinding,
-)
-from .conditions import conditional_on_env_var
-from .exceptions import BindingError, InjectException, NamedError, NoBindingFound, NonInjectableTypeError
-from .injector import Injector
-from .injector_options import InjectorOptions
-from .named import named_arg
-from .provider import Provider
-from .scopes import ContextScope, ImmediateScope, PerLookupScope, SingletonScope, ThreadScope
-from .target import Target
-from .utils import InjectedT
+from importlib import import_module
+
+# typing.TYPE_CHECKING is not used as importing typing is a large part of the import time
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from .assisted_factory import AssistedFactory
+    from .bindings import (
+        AbstractModule,
+        ClassBinding,
+        InstanceBinding,
+        ItemBinding,
+        MapBinding,
+        Module,
+        MultiBinding,
+        PrivateModule,
+        ProviderBinding,
+        SelfBinding,
+    )
+    from .conditions import conditional_on_env_var
+    from .config_sources import ConfigSource, DictConfigSource, EnvConfigSource, FileConfigSource
+    from .exceptions import BindingError, InjectException, NamedError, NoBindingFound, NonInjectableTypeError
+    from .injector import Injector
+    from .injector_options import InjectorOptions
+    from .lazy import Lazy
+    from .named import named_arg
+    from .provider import Provider
+    from .scopes import ContextScope, ImmediateScope, PerLookupScope, SingletonScope, ThreadScope
+    from .target import Target
+    from .utils import InjectedT
+
+# Submodules are imported on first access so that importing opyoid stays cheap
+_MODULE_BY_NAME = {
+    "AssistedFactory": ".assisted_factory",
+    "AbstractModule": ".bindings",
+    "ClassBinding": ".bindings",
+    "InstanceBinding": ".bindings",
+    "ItemBinding": ".bindings",
+    "MapBinding": ".bindings",
+    "Module": ".bindings",
+    "MultiBinding": ".bindings",
+    "PrivateModule": ".bindings",
+    "ProviderBinding": ".bindings",
+    "SelfBinding": ".bindings",
+    "conditional_on_env_var": ".conditions",
+    "ConfigSource": ".config_sources",
+    "DictConfigSource": ".config_sources",
+    "EnvConfigSource": ".config_sources",
+    "FileConfigSource": ".config_sources",
+    "BindingError": ".exceptions",
+    "InjectException": ".exceptions",
+    "NamedError": ".exceptions",
+    "NoBindingFound": ".exceptions",
+    "NonInjectableTypeError": ".exceptions",
+    "Injector": ".injector",
+    "InjectorOptions": ".injector_options",
+    "Lazy": ".lazy",
+    "named_arg": ".named",
+    "Provider": ".provider",
+    "ContextScope": ".scopes",
+    "ImmediateScope": ".scopes",
+    "PerLookupScope": ".scopes",
+    "SingletonScope": ".scopes",
+    "ThreadScope": ".scopes",
+    "Target": ".target",
+    "InjectedT": ".utils",
+}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+def __getattr__(name: str) -> "Any":
+    if name not in _MODULE_BY_NAME:
+        return _import_submodule(name)
+    value = getattr(import_module(_MODULE_BY_NAME[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> "Any":
+    """Submodules such as opyoid.exceptions can be accessed as attributes, as when they were imported eagerly."""
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,81 @@
+import argparse
+import importlib
+import logging
+import sys
+from typing import Any, List, Optional, Sequence, Type, Union
+
+from .bindings import AbstractModule, Binding
+from .exceptions import InjectException
+from .graph_checker import GraphChecker
+from .injector_options import InjectorOptions
+
+
+def _load_object(path: str) -> Any:
+    module_name, _, attribute_name = path.partition(":")
+    if not attribute_name:
+        raise ValueError(f"{path!r} should be formatted as 'package.module:Attribute'")
+    value: Any = importlib.import_module(module_name)
+    for name in attribute_name.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def _add_object(
+    value: Any, modules: List[Union[AbstractModule, Type[AbstractModule]]], bindings: List[Binding[Any]]
+) -> None:
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _add_object(item, modules, bindings)
+    elif isinstance(value, AbstractModule) or (isinstance(value, type) and issubclass(value, AbstractModule)):
+        modules.append(value)
+    elif isinstance(value, Binding):
+        bindings.append(value)
+    else:
+        raise ValueError(f"{value!r} is not a module, a binding or a list of them")
+
+
+def check(paths: Sequence[str], auto_bindings: bool, use_env_vars: bool) -> int:
+    modules: List[Union[AbstractModule, Type[AbstractModule]]] = []
+    bindings: List[Binding[Any]] = []
+    try:
+        for path in paths:
+            _add_object(_load_object(path), modules, bindings)
+        error_messages = GraphChecker(
+            modules, bindings, InjectorOptions(auto_bindings=auto_bindings, use_env_vars=use_env_vars)
+        ).check()
+    except (ImportError, AttributeError, ValueError, InjectException) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    for error_message in error_messages:
+        print(f"error: {error_message}", file=sys.stderr)
+    if error_messages:
+        print(f"{len(error_messages)} error(s) found", file=sys.stderr)
+        return 1
+    print("No errors found")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m opyoid", description="opyoid command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser(
+        "check",
+        help="check that all bindings can be injected, without instantiating anything",
+        description="Resolves the whole injection graph without calling any constructor or provider, "
+        "and reports all missing bindings and cyclic dependencies.",
+    )
+    check_parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="module, binding or list of them, e.g. my_app.modules:AppModule"
+    )
+    check_parser.add_argument("--auto-bindings", action="store_true", help="same as InjectorOptions.auto_bindings")
+    check_parser.add_argument(
+        "--no-env-vars", dest="use_env_vars", action="store_false", help="same as InjectorOptions(use_env_vars=False)"
+    )
+    arguments = parser.parse_args(argv)
+    return check(arguments.paths, arguments.auto_bindings, arguments.use_env_vars)
+
+
+if __name__ == "__main__":
+    # Errors are already reported by the command
+    logging.getLogger("opyoid").setLevel(logging.CRITICAL)
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from typing import Any, Callable, FrozenSet, Generic, Tuple
+
+from opyoid.provider import Provider
+from opyoid.utils import get_class_full_name, InjectedT
+
+
+class AssistedFactory(Generic[InjectedT]):
+    """Injected as AssistedFactory[<class>], creates instances of the class when called.
+
+    Parameters with a binding are injected, the other ones are given as keyword arguments when calling the factory.
+    Injected parameters can also be given to override the injected value.
+    """
+
+    def __init__(
+        self,
+        injected_class: Callable[..., InjectedT],
+        parameter_providers: Tuple[Tuple[str, Provider[Any]], ...],
+        assisted_parameter_names: FrozenSet[str],
+    ) -> None:
+        self._injected_class = injected_class
+        self._parameter_providers = parameter_providers
+        self._assisted_parameter_names = assisted_parameter_names
+
+    @property
+    def assisted_parameter_names(self) -> FrozenSet[str]:
+        return self._assisted_parameter_names
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({get_class_full_name(self._injected_class)})"  # type: ignore[arg-type]
+
+    def __call__(self, **kwargs: Any) -> InjectedT:
+        if not self._assisted_parameter_names <= kwargs.keys():
+            missing_names = ", ".join(sorted(self._assisted_parameter_names - kwargs.keys()))
+            raise TypeError(f"{self!r} missing required keyword arguments: {missing_names}")
+        for parameter_name, provider in self._parameter_providers:
+            if parameter_name not in kwargs:
+                kwargs[parameter_name] = provider.get()
+        return self._injected_class(**kwargs)
@@ -5,9 +5,26 @@ from .binding_to_provider_adapter import BindingToProviderAdapter
 from .class_binding import ClassBinding, ClassBindingToProviderAdapter
 from .condition import Condition
 from .instance_binding import FromInstanceProvider, InstanceBinding, InstanceBindingToProviderAdapter
+from .items_binding_to_provider_adapter import ItemsBindingToProviderAdapter
+from .map_binding import (
+    DictProvider,
+    LazyMapping,
+    LazyMappingProvider,
+    MapBinding,
+    MapBindingToProviderAdapter,
+)
 from .module import Module
-from .multi_binding import ItemBinding, ListProvider, MultiBinding, MultiBindingToProviderAdapter
+from .multi_binding import (
+    ItemBinding,
+    LazyIterable,
+    LazyIterableProvider,
+    ListProvider,
+    MultiBinding,
+    MultiBindingToProviderAdapter,
+    ParallelListProvider,
+)
 from .private_module import PrivateModule
 from .provider_binding import FromProviderProvider, ProviderBinding, ProviderBindingToProviderAdapter
+from .provider_cache_key import ProviderCacheKey
 from .registered_binding import RegisteredBinding
 from .self_binding import FromCallableProvider, SelfBinding, SelfBindingToProviderAdapter
@@ -9,9 +9,11 @@ from .binding_registry import BindingRegistry
 from .class_binding import ClassBinding
 from .condition import Condition
 from .instance_binding import InstanceBinding
+from .map_binding import MapBinding
 from .multi_binding import ItemBinding, MultiBinding
 from .provider_binding import ProviderBinding
 from .registered_binding import RegisteredBinding
+from .registered_map_binding import RegisteredMapBinding
 from .registered_multi_binding import RegisteredMultiBinding
 from .self_binding import SelfBinding
 
@@ -27,6 +29,7 @@ class AbstractModule:
         shared_modules: Optional[Dict[Type["AbstractModule"], "AbstractModule"]] = None,
     ):
         self._is_configured = False
+        self._is_configuring = False
         self._binding_registry = BindingRegistry(log_bindings)
         self._module_instances = shared_modules if shared_modules is not None else {}
 
@@ -57,30 +60,13 @@ class AbstractModule:
         module_instance = self._get_module_instance(module)
 
         module_instance.configure_once()
-        for binding in module_instance.binding_registry.get_bindings_by_target().values():
-            if isinstance(module_instance, PrivateModule):
-                if not module_instance.is_exposed(binding.target):
-                    continue
-                if isinstance(binding, RegisteredMultiBinding):
-                    binding = RegisteredMultiBinding(
-                        binding.raw_binding,
-                        module_instance,
-                        item_bindings=[
-                            RegisteredBinding(
-                                registered_item_binding.raw_binding,
-                                module_instance,
-                                (module_instance,) + binding.source_path,
-                            )
-                            for registered_item_binding in binding.item_bindings
-                        ],
-                    )
-                else:
-                    binding = RegisteredBinding(
-                        binding.raw_binding,
-                        module_instance,
-                        (module_instance,) + binding.source_path,
-                    )
-            self._binding_registry.register(binding, add_self_binding=False)
+        self._binding_registry.install(
+            module_instance.binding_registry,
+            module_instance if isinstance(module_instance, PrivateModule) else None,
+            # A module installed while it is being configured installs this one, directly or not: its current bindings
+            # are copied instead of linking the registries in a cycle
+            copy_bindings=module_instance._is_configuring,  # pylint: disable=protected-access
+        )
 
     # pylint: disable=too-many-arguments
     def bind(
@@ -113,8 +99,13 @@ class AbstractModule:
         if not self._is_configured:
             self._is_configured = True
             if all(condition.is_valid() for condition in self.conditions):
-                self.configure()
+                self._is_configuring = True
+                try:
+                    self.configure()
+                finally:
+                    self._is_configuring = False
 
+    # pylint: disable=too-many-arguments
     def multi_bind(
         self,
         item_target_type: Any,
@@ -123,10 +114,33 @@ class AbstractModule:
         scope: Type[Scope] = SingletonScope,
         named: Optional[str] = None,
         override_bindings: bool = False,
+        parallel: bool = False,
     ) -> RegisteredMultiBinding[Any]:
         return self._register_multi_binding(
             MultiBinding(
-                item_target_type, item_bindings, scope=scope, named=named, override_bindings=override_bindings
+                item_target_type,
+                item_bindings,
+                scope=scope,
+                named=named,
+                override_bindings=override_bindings,
+                parallel=parallel,
+            ),
+        )
+
+    # pylint: disable=too-many-arguments
+    def map_bind(
+        self,
+        key_type: Any,
+        value_type: Any,
+        item_bindings: Dict[Any, ItemBinding[Any]],
+        *,
+        scope: Type[Scope] = SingletonScope,
+        named: Optional[str] = None,
+        override_bindings: bool = False,
+    ) -> RegisteredMapBinding[Any]:
+        return self._register_map_binding(
+            MapBinding(
+                key_type, value_type, item_bindings, scope=scope, named=named, override_bindings=override_bindings
             ),
         )
 
@@ -183,6 +197,8 @@ class AbstractModule:
     def _register(self, binding: Binding[Any]) -> RegisteredBinding[Any]:
         if isinstance(binding, MultiBinding):
             registered_binding: RegisteredBinding[Any] = self._register_multi_binding(binding)
+        elif isinstance(binding, MapBinding):
+            registered_binding = self._register_map_binding(binding)
         else:
             registered_binding = RegisteredBinding(binding, binding_source=self)
             self._binding_registry.register(registered_binding)
@@ -191,37 +207,57 @@ class AbstractModule:
     def _register_multi_binding(self, binding: MultiBinding[InjectedT]) -> RegisteredMultiBinding[InjectedT]:
         registered_binding = RegisteredMultiBinding(binding, binding_source=self)
         for source_item_binding in binding.item_bindings:
-            scope = cast(
-                Type[Scope], source_item_binding.scope if source_item_binding.scope is not EMPTY else binding.scope
-            )
-            named = cast(
-                Optional[str], source_item_binding.named if source_item_binding.named is not EMPTY else binding.named
+            item_binding = self._create_item_binding(
+                binding, binding.item_target_type, source_item_binding, binding.scope, binding.named
             )
-            if source_item_binding.bound_class is not EMPTY:
-                item_binding: Binding[InjectedT] = SelfBinding(
-                    cast(Type[InjectedT], source_item_binding.bound_class),
-                    scope=scope,
-                    named=named,
-                )
-            elif source_item_binding.bound_instance is not EMPTY:
-                item_binding = InstanceBinding(
-                    binding.item_target_type,
-                    cast(InjectedT, source_item_binding.bound_instance),
-                    named=named,
-                )
-            elif source_item_binding.bound_provider is not EMPTY:
-                item_binding = ProviderBinding(
-                    binding.item_target_type,
-                    cast(
-                        Union[Type[Provider[InjectedT]], Provider[InjectedT], Callable[..., InjectedT]],
-                        source_item_binding.bound_provider,
-                    ),
-                    scope=scope,
-                    named=named,
-                )
-            else:
-                raise BindingError(f"ItemBinding in {binding!r} has no instance, class or provider, one should be set")
-
             registered_binding.item_bindings.append(RegisteredBinding(item_binding, binding_source=self))
         self._binding_registry.register(registered_binding)
         return registered_binding
+
+    def _register_map_binding(self, binding: MapBinding[InjectedT]) -> RegisteredMapBinding[InjectedT]:
+        registered_binding = RegisteredMapBinding(binding, binding_source=self)
+        for key, source_item_binding in binding.item_bindings.items():
+            item_binding = self._create_item_binding(
+                binding, binding.value_type, source_item_binding, binding.scope, binding.named
+            )
+            registered_binding.item_bindings[key] = RegisteredBinding(item_binding, binding_source=self)
+        self._binding_registry.register(registered_binding)
+        return registered_binding
+
+    @staticmethod
+    def _create_item_binding(
+        binding: Binding[Any],
+        item_target_type: Any,
+        source_item_binding: ItemBinding[InjectedT],
+        default_scope: Type[Scope],
+        default_named: Optional[str],
+    ) -> Binding[InjectedT]:
+        scope = cast(
+            Type[Scope], source_item_binding.scope if source_item_binding.scope is not EMPTY else default_scope
+        )
+        named = cast(
+            Optional[str], source_item_binding.named if source_item_binding.named is not EMPTY else default_named
+        )
+        if source_item_binding.bound_class is not EMPTY:
+            return SelfBinding(
+                cast(Type[InjectedT], source_item_binding.bound_class),
+                scope=scope,
+                named=named,
+            )
+        if source_item_binding.bound_instance is not EMPTY:
+            return InstanceBinding(
+                item_target_type,
+                cast(InjectedT, source_item_binding.bound_instance),
+                named=named,
+            )
+        if source_item_binding.bound_provider is not EMPTY:
+            return ProviderBinding(
+                item_target_type,
+                cast(
+                    Union[Type[Provider[InjectedT]], Provider[InjectedT], Callable[..., InjectedT]],
+                    source_item_binding.bound_provider,
+                ),
+                scope=scope,
+                named=named,
+            )
+        raise BindingError(f"ItemBinding in {binding!r} has no instance, class or provider, one should be set")
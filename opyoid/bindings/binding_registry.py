@@ -1,5 +1,9 @@
 import logging
-from typing import Any, cast, Dict, Optional, Type, TypeVar, Union
+from itertools import count
+from threading import RLock
+from typing import Any, cast, Dict, List, Optional, Set, Tuple, Type, TYPE_CHECKING, TypeVar, Union
+
+import attr
 
 from opyoid.exceptions import NonInjectableTypeError
 from opyoid.frozen_target import FrozenTarget
@@ -8,37 +12,269 @@ from opyoid.utils import InjectedT
 from .binding import Binding
 from .class_binding import ClassBinding
 from .instance_binding import InstanceBinding
+from .map_binding import MapBinding
 from .multi_binding import MultiBinding
 from .provider_binding import ProviderBinding
 from .registered_binding import RegisteredBinding
+from .registered_map_binding import RegisteredMapBinding
 from .registered_multi_binding import RegisteredMultiBinding
 from .self_binding import SelfBinding
 
+if TYPE_CHECKING:
+    from .private_module import PrivateModule
+
 InjectedItemT = TypeVar("InjectedItemT", bound=Any)
 
 
+@attr.s(auto_attribs=True, frozen=True)
+class _DirectBinding:
+    """Binding registered directly in a registry, default bindings are only used if the target has no other binding."""
+
+    position: int
+    generation: int
+    binding: RegisteredBinding[Any]
+    is_default: bool = False
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class _InstalledRegistry:
+    """Binding registry of an installed module, only the exposed bindings of private modules are visible."""
+
+    position: int
+    generation: int
+    binding_registry: "BindingRegistry"
+    private_module: Optional["PrivateModule"]
+
+    def get_binding(self, target: FrozenTarget[InjectedT]) -> Optional[RegisteredBinding[InjectedT]]:
+        if self.private_module is not None and not self.private_module.is_exposed(target):
+            return None
+        binding = self.binding_registry.get_bindings_by_target().get(target)
+        if binding is None or self.private_module is None:
+            return binding
+        return self.wrap(binding)
+
+    def get_bindings_by_target(self) -> Dict[FrozenTarget[Any], RegisteredBinding[Any]]:
+        bindings_by_target = self.binding_registry.get_bindings_by_target()
+        if self.private_module is None:
+            return bindings_by_target
+        return {
+            target: self.wrap(binding)
+            for target, binding in bindings_by_target.items()
+            if self.private_module.is_exposed(target)
+        }
+
+    def get_targets_registered_since(self, generation: int) -> List[FrozenTarget[Any]]:
+        if self.generation > generation:
+            return list(self.get_bindings_by_target())
+        return [
+            target
+            for target in self.binding_registry.get_targets_registered_since(generation)
+            if self.private_module is None or self.private_module.is_exposed(target)
+        ]
+
+    def wrap(self, binding: RegisteredBinding[InjectedT]) -> RegisteredBinding[InjectedT]:
+        """Bindings exposed by a private module are provided from the state of the private module."""
+        private_module = cast("PrivateModule", self.private_module)
+        source_path = (private_module,) + binding.source_path
+        if isinstance(binding, RegisteredMultiBinding):
+            return cast(
+                RegisteredBinding[InjectedT],
+                RegisteredMultiBinding(
+                    binding.raw_binding,
+                    private_module,
+                    item_bindings=[
+                        RegisteredBinding(item_binding.raw_binding, private_module, source_path)
+                        for item_binding in binding.item_bindings
+                    ],
+                ),
+            )
+        if isinstance(binding, RegisteredMapBinding):
+            return cast(
+                RegisteredBinding[InjectedT],
+                RegisteredMapBinding(
+                    binding.raw_binding,
+                    private_module,
+                    item_bindings={
+                        key: RegisteredBinding(item_binding.raw_binding, private_module, source_path)
+                        for key, item_binding in binding.item_bindings.items()
+                    },
+                ),
+            )
+        return RegisteredBinding(binding.raw_binding, private_module, source_path)
+
+
+@attr.s(auto_attribs=True)
+class _CollectedBindings:
+    """Bindings of a registry and of all the registries installed in it, merged in a single pass."""
+
+    bindings_by_target: Dict[FrozenTarget[Any], RegisteredBinding[Any]] = attr.Factory(dict)
+    copied_targets: Set[FrozenTarget[Any]] = attr.Factory(set)
+    # Sequence number of the last binding of each target visible in all registries
+    sequence_by_target: Dict[FrozenTarget[Any], int] = attr.Factory(dict)
+    # Same for bindings of private modules that are not exposed, by the level of the private module registry
+    hidden_sequence_by_level_by_target: Dict[FrozenTarget[Any], Dict[int, int]] = attr.Factory(dict)
+    sequence: int = 0
+    # Private module registries being collected, with their level
+    private_registries: List[Tuple[int, _InstalledRegistry]] = attr.Factory(list)
+
+
+@attr.s(auto_attribs=True)
+class _LookupCache:
+    """Merged bindings of a registry, replaced when a binding is registered in the registry or in an installed one."""
+
+    # Number of the last registration in the registry or in an installed one
+    generation: int = 0
+    binding_by_target: Dict[FrozenTarget[Any], Optional[RegisteredBinding[Any]]] = attr.Factory(dict)
+    all_bindings_by_target: Optional[Dict[FrozenTarget[Any], RegisteredBinding[Any]]] = None
+
+
 class BindingRegistry:
-    """Contains all bindings from a Module."""
+    """Contains all bindings from a Module.
+
+    Installed registries are not copied, they are layered with the bindings registered directly in registration order:
+    the last registration of a target overrides the previous ones, or extends them for multi and map bindings.
+    Bindings are merged when they are looked up, and cached until a binding is registered in this registry or in an
+    installed one.
+    """
 
     logger = logging.getLogger(__name__)
+    # Registrations are numbered in order across all registries, so that the generations of a registry and of the
+    # registries installed in it can be compared
+    _registration_numbers = count(1)
 
     def __init__(self, log_bindings: bool = False):
-        self._bindings_by_target: Dict[FrozenTarget[Any], RegisteredBinding[Any]] = {}
+        # Only the direct bindings that can change the result of a lookup are kept
+        self._direct_bindings_by_target: Dict[FrozenTarget[Any], List[_DirectBinding]] = {}
+        self._installed_registries: List[_InstalledRegistry] = []
+        # Direct bindings and installed registries, in registration order
+        self._entries: List[Union[_DirectBinding, _InstalledRegistry]] = []
+        self._parent_registries: List[BindingRegistry] = []
         self._log_bindings = log_bindings
+        self._lock = RLock()
+        self._cache = _LookupCache()
+
+    @property
+    def generation(self) -> int:
+        """Number of the last registration in this registry or in an installed one, used to invalidate lookup caches."""
+        return self._cache.generation
 
     def __contains__(self, item: Union[Target[Any], FrozenTarget[Any]]) -> bool:
         return self.get_binding(item) is not None
 
     def register(self, registered_binding: RegisteredBinding[Any], add_self_binding: bool = True) -> None:
-        previous_binding = self._bindings_by_target.get(registered_binding.target)
-        if self._should_append_to_multi_binding(registered_binding, previous_binding):
-            previous_binding = cast(RegisteredMultiBinding[Any], previous_binding)
-            self._append_to_multi_binding(cast(RegisteredMultiBinding[Any], registered_binding), previous_binding)
-        else:
-            self._create_or_override_binding(registered_binding, previous_binding)
+        if self._log_bindings:
+            self._log_registration(registered_binding, self._get_frozen_binding(registered_binding.target))
+        self._add_direct_binding(registered_binding, is_default=False)
         if add_self_binding:
             self._register_self_binding(registered_binding)
 
+    def install(
+        self,
+        binding_registry: "BindingRegistry",
+        private_module: Optional["PrivateModule"] = None,
+        copy_bindings: bool = False,
+    ) -> None:
+        """Adds the bindings of another registry, only the exposed ones if it belongs to a private module.
+
+        The bindings are not copied, they are looked up in the installed registry, unless copy_bindings is True or the
+        installed registry contains this one: the bindings it has at this point are then registered directly, so that
+        installed registries never form a cycle.
+        """
+        if copy_bindings or binding_registry._contains(self):  # pylint: disable=protected-access
+            installed_registry = _InstalledRegistry(-1, 0, binding_registry, private_module)
+            for registered_binding in installed_registry.get_bindings_by_target().values():
+                self.register(registered_binding, add_self_binding=False)
+            return
+        generation = next(self._registration_numbers)
+        self._clear_cache(generation)
+        binding_registry._parent_registries.append(self)  # pylint: disable=protected-access
+        installed_registry = _InstalledRegistry(len(self._entries), generation, binding_registry, private_module)
+        self._installed_registries.append(installed_registry)
+        self._entries.append(installed_registry)
+
+    def _contains(self, binding_registry: "BindingRegistry") -> bool:
+        """Returns True if binding_registry is this registry or is installed in it, directly or not."""
+        visited_registries: Set[int] = set()
+        registries_to_visit = [self]
+        while registries_to_visit:
+            registry = registries_to_visit.pop()
+            if registry is binding_registry:
+                return True
+            if id(registry) not in visited_registries:
+                visited_registries.add(id(registry))
+                registries_to_visit.extend(
+                    installed_registry.binding_registry
+                    for installed_registry in registry._installed_registries  # pylint: disable=protected-access
+                )
+        return False
+
+    def _add_direct_binding(self, registered_binding: RegisteredBinding[Any], is_default: bool) -> None:
+        generation = next(self._registration_numbers)
+        self._clear_cache(generation)
+        direct_bindings = self._direct_bindings_by_target.setdefault(registered_binding.target, [])
+        if (
+            not is_default
+            and direct_bindings
+            and not direct_bindings[-1].is_default
+            and not self._is_installed_after(direct_bindings[-1].position)
+            and self._merge(direct_bindings[-1].binding, registered_binding, True) is direct_bindings[-1].binding
+        ):
+            # Extended in place, as nothing was installed since the last binding of this target
+            direct_binding = attr.evolve(direct_bindings[-1], generation=generation)
+            direct_bindings[-1] = direct_binding
+            self._entries[direct_binding.position] = direct_binding
+            return
+        direct_binding = _DirectBinding(len(self._entries), generation, registered_binding, is_default)
+        if not is_default and not self._extends_previous_binding(registered_binding):
+            direct_bindings.clear()
+        direct_bindings.append(direct_binding)
+        self._entries.append(direct_binding)
+
+    def _is_installed_after(self, position: int) -> bool:
+        return bool(self._installed_registries) and self._installed_registries[-1].position > position
+
+    def _log_registration(
+        self, registered_binding: RegisteredBinding[Any], previous_binding: Optional[RegisteredBinding[Any]]
+    ) -> None:
+        if self._should_append_to_multi_binding(
+            registered_binding, previous_binding
+        ) or self._should_append_to_map_binding(registered_binding, previous_binding):
+            self.logger.info(f"Adding {registered_binding.raw_binding} to previous binding")
+        elif previous_binding and previous_binding.raw_binding is not registered_binding.raw_binding:
+            self.logger.info(f"Overriding {previous_binding.raw_binding!r} with {registered_binding.raw_binding!r}")
+        elif not previous_binding:
+            self.logger.debug(f"Registering {registered_binding.raw_binding!r}")
+
+    @staticmethod
+    def _extends_previous_binding(registered_binding: RegisteredBinding[Any]) -> bool:
+        return (
+            isinstance(registered_binding, (RegisteredMultiBinding, RegisteredMapBinding))
+            and not cast(Union[MultiBinding[Any], MapBinding[Any]], registered_binding.raw_binding).override_bindings
+        )
+
+    def _merge(
+        self,
+        previous_binding: Optional[RegisteredBinding[Any]],
+        registered_binding: RegisteredBinding[Any],
+        in_place: bool,
+    ) -> RegisteredBinding[Any]:
+        """Returns the binding overriding or extending previous_binding, which is only modified if in_place is True."""
+        if previous_binding is None:
+            return registered_binding
+        if self._should_append_to_multi_binding(registered_binding, previous_binding):
+            previous_multi_binding = cast(RegisteredMultiBinding[Any], previous_binding)
+            if not in_place:
+                previous_multi_binding = self._copy_multi_binding(previous_multi_binding)
+            self._append_to_multi_binding(cast(RegisteredMultiBinding[Any], registered_binding), previous_multi_binding)
+            return previous_multi_binding
+        if self._should_append_to_map_binding(registered_binding, previous_binding):
+            previous_map_binding = cast(RegisteredMapBinding[Any], previous_binding)
+            if not in_place:
+                previous_map_binding = self._copy_map_binding(previous_map_binding)
+            self._append_to_map_binding(cast(RegisteredMapBinding[Any], registered_binding), previous_map_binding)
+            return previous_map_binding
+        return registered_binding
+
     @staticmethod
     def _should_append_to_multi_binding(
         new_binding: RegisteredBinding[InjectedItemT],
@@ -55,30 +291,61 @@ class BindingRegistry:
             and new_binding is not previous_binding
         )
 
+    @staticmethod
+    def _copy_multi_binding(binding: RegisteredMultiBinding[InjectedItemT]) -> RegisteredMultiBinding[InjectedItemT]:
+        raw_binding = cast(MultiBinding[InjectedItemT], binding.raw_binding)
+        return RegisteredMultiBinding(
+            attr.evolve(raw_binding, item_bindings=list(raw_binding.item_bindings)),
+            binding.binding_source,
+            binding.source_path,
+            item_bindings=list(binding.item_bindings),
+        )
+
+    @staticmethod
     def _append_to_multi_binding(
-        self,
         registered_binding: RegisteredMultiBinding[InjectedItemT],
         previous_binding: RegisteredMultiBinding[InjectedItemT],
     ) -> None:
-        if self._log_bindings:
-            self.logger.info(f"Adding {registered_binding.raw_binding} to previous binding")
-
         new_raw_binding = cast(MultiBinding[InjectedItemT], registered_binding.raw_binding)
         previous_raw_binding = cast(MultiBinding[InjectedItemT], previous_binding.raw_binding)
         for item_binding, raw_item_binding in zip(registered_binding.item_bindings, new_raw_binding.item_bindings):
-            if item_binding not in previous_binding.item_bindings:
+            if not previous_binding.has_item_binding(item_binding):
                 previous_binding.item_bindings.append(item_binding)
                 previous_raw_binding.item_bindings.append(raw_item_binding)
 
-    def _create_or_override_binding(
-        self, registered_binding: RegisteredBinding[InjectedT], previous_binding: Optional[RegisteredBinding[InjectedT]]
+    @staticmethod
+    def _should_append_to_map_binding(
+        new_binding: RegisteredBinding[Any],
+        previous_binding: Optional[RegisteredBinding[Any]],
+    ) -> bool:
+        return (
+            isinstance(new_binding, RegisteredMapBinding)
+            and previous_binding is not None
+            and isinstance(previous_binding, RegisteredMapBinding)
+            and not cast(MapBinding[Any], new_binding.raw_binding).override_bindings
+            and new_binding is not previous_binding
+        )
+
+    @staticmethod
+    def _copy_map_binding(binding: RegisteredMapBinding[InjectedItemT]) -> RegisteredMapBinding[InjectedItemT]:
+        raw_binding = cast(MapBinding[InjectedItemT], binding.raw_binding)
+        return RegisteredMapBinding(
+            attr.evolve(raw_binding, item_bindings=dict(raw_binding.item_bindings)),
+            binding.binding_source,
+            binding.source_path,
+            item_bindings=dict(binding.item_bindings),
+        )
+
+    @staticmethod
+    def _append_to_map_binding(
+        registered_binding: RegisteredMapBinding[InjectedItemT],
+        previous_binding: RegisteredMapBinding[InjectedItemT],
     ) -> None:
-        if self._log_bindings:
-            if previous_binding and previous_binding.raw_binding is not registered_binding.raw_binding:
-                self.logger.info(f"Overriding {previous_binding.raw_binding!r} with {registered_binding.raw_binding!r}")
-            elif not previous_binding:
-                self.logger.debug(f"Registering {registered_binding.raw_binding!r}")
-        self._bindings_by_target[registered_binding.target] = registered_binding
+        new_raw_binding = cast(MapBinding[InjectedItemT], registered_binding.raw_binding)
+        previous_raw_binding = cast(MapBinding[InjectedItemT], previous_binding.raw_binding)
+        for key, item_binding in registered_binding.item_bindings.items():
+            previous_binding.item_bindings[key] = item_binding
+            previous_raw_binding.item_bindings[key] = new_raw_binding.item_bindings[key]
 
     def _register_self_binding(self, registered_binding: RegisteredBinding[Any]) -> None:
         binding = registered_binding.raw_binding
@@ -99,16 +366,104 @@ class BindingRegistry:
         elif isinstance(registered_binding, RegisteredMultiBinding):
             for item_binding in registered_binding.item_bindings:
                 self._register_self_binding(item_binding)
+        elif isinstance(registered_binding, RegisteredMapBinding):
+            for item_binding in registered_binding.item_bindings.values():
+                self._register_self_binding(item_binding)
         elif isinstance(binding, SelfBinding):
             self_binding = binding
 
-        if self_binding is not None and self_binding.target not in self:
-            self.register(
-                RegisteredBinding(self_binding, registered_binding.binding_source, registered_binding.source_path)
+        if self_binding is not None and not self._has_direct_binding(self_binding.target):
+            # Only used if the target has no binding at this point, the installed registries are checked on lookup
+            self._add_direct_binding(
+                RegisteredBinding(self_binding, registered_binding.binding_source, registered_binding.source_path),
+                is_default=True,
             )
 
+    def _has_direct_binding(self, target: FrozenTarget[Any]) -> bool:
+        # Default bindings are never registered after other direct bindings
+        direct_bindings = self._direct_bindings_by_target.get(target)
+        return bool(direct_bindings) and not direct_bindings[-1].is_default  # type: ignore[index]
+
     def get_bindings_by_target(self) -> Dict[FrozenTarget[Any], RegisteredBinding[Any]]:
-        return self._bindings_by_target
+        """Returns the bindings of this registry and of the installed ones, in the order of their first registration."""
+        with self._lock:
+            cache = self._cache
+            if cache.all_bindings_by_target is None:
+                collected_bindings = _CollectedBindings()
+                self._collect_bindings(collected_bindings, 0)
+                cache.all_bindings_by_target = collected_bindings.bindings_by_target
+            return cache.all_bindings_by_target
+
+    def _collect_bindings(self, collected_bindings: _CollectedBindings, level: int) -> None:
+        """Adds the bindings of this registry, installed in level registries, to collected_bindings.
+
+        Installed registries are collected recursively in the same pass instead of being merged one by one.
+        """
+        start_sequence = collected_bindings.sequence
+        for entry in self._entries:
+            if isinstance(entry, _InstalledRegistry):
+                if entry.private_module is not None:
+                    collected_bindings.private_registries.append((level + 1, entry))
+                entry.binding_registry._collect_bindings(  # pylint: disable=protected-access
+                    collected_bindings, level + 1
+                )
+                if entry.private_module is not None:
+                    collected_bindings.private_registries.pop()
+            elif not entry.is_default or not self._is_collected_since(
+                collected_bindings, entry.binding.target, level, start_sequence
+            ):
+                self._add_collected_binding(collected_bindings, entry.binding)
+
+    @staticmethod
+    def _is_collected_since(
+        collected_bindings: _CollectedBindings, target: FrozenTarget[Any], level: int, sequence: int
+    ) -> bool:
+        """Returns True if a binding of target visible in the registry at this level was collected after sequence."""
+        if collected_bindings.sequence_by_target.get(target, 0) > sequence:
+            return True
+        hidden_sequence_by_level = collected_bindings.hidden_sequence_by_level_by_target.get(target, {})
+        return any(
+            visible_level <= level and binding_sequence > sequence
+            for visible_level, binding_sequence in hidden_sequence_by_level.items()
+        )
+
+    def _add_collected_binding(self, collected_bindings: _CollectedBindings, binding: RegisteredBinding[Any]) -> None:
+        target = binding.target
+        collected_bindings.sequence += 1
+        visible_level = 0
+        for private_level, installed_registry in reversed(collected_bindings.private_registries):
+            if not cast("PrivateModule", installed_registry.private_module).is_exposed(target):
+                visible_level = private_level
+                break
+        if visible_level > 0:
+            hidden_sequence_by_level = collected_bindings.hidden_sequence_by_level_by_target.setdefault(target, {})
+            hidden_sequence_by_level[visible_level] = collected_bindings.sequence
+            return
+        collected_bindings.sequence_by_target[target] = collected_bindings.sequence
+        for _, installed_registry in reversed(collected_bindings.private_registries):
+            binding = installed_registry.wrap(binding)
+        merged_binding = self._merge(
+            collected_bindings.bindings_by_target.get(target), binding, target in collected_bindings.copied_targets
+        )
+        collected_bindings.bindings_by_target[target] = merged_binding
+        if merged_binding is not binding:
+            collected_bindings.copied_targets.add(target)
+        elif collected_bindings.copied_targets:
+            collected_bindings.copied_targets.discard(target)
+
+    def get_targets_registered_since(self, generation: int) -> List[FrozenTarget[Any]]:
+        """Returns the targets whose binding was added, overridden or extended after this generation."""
+        targets = []
+        for target, direct_bindings in self._direct_bindings_by_target.items():
+            if any(
+                direct_binding.generation > generation
+                and (not direct_binding.is_default or self._get_frozen_binding(target) is direct_binding.binding)
+                for direct_binding in direct_bindings
+            ):
+                targets.append(target)
+        for installed_registry in self._installed_registries:
+            targets.extend(installed_registry.get_targets_registered_since(generation))
+        return list(dict.fromkeys(targets))
 
     def get_binding(
         self, target: Union[Target[InjectedT], FrozenTarget[InjectedT]]
@@ -117,22 +472,75 @@ class BindingRegistry:
             possible_target_types = list(
                 set(
                     cast(Type[InjectedT], available_target.type)
-                    for available_target in self._bindings_by_target
+                    for available_target in self.get_bindings_by_target()
                     if isinstance(available_target.type, type) and available_target.type.__name__ == target.type
                 )
             )
             if len(possible_target_types) == 1:
-                target.type = possible_target_types[0]
-                frozen_target = FrozenTarget(target.type, target.named)
+                if isinstance(target, Target):
+                    target.type = possible_target_types[0]
+                frozen_target = FrozenTarget(possible_target_types[0], target.named)
             elif possible_target_types:
                 raise NonInjectableTypeError(
                     f"Could not find binding for '{target.type}': multiple types with this name found"
                 )
             else:
                 return None
+        elif isinstance(target, FrozenTarget):
+            frozen_target = target
         else:
             frozen_target = FrozenTarget(target.type, target.named)
-        return self._bindings_by_target.get(frozen_target)
+        return self._get_frozen_binding(frozen_target)
+
+    def _get_frozen_binding(self, target: FrozenTarget[InjectedT]) -> Optional[RegisteredBinding[InjectedT]]:
+        with self._lock:
+            cache = self._cache
+            if cache.all_bindings_by_target is not None:
+                return cache.all_bindings_by_target.get(target)
+            if target not in cache.binding_by_target:
+                cache.binding_by_target[target] = self._find_binding(target)
+            return cache.binding_by_target[target]
+
+    def _find_binding(self, target: FrozenTarget[InjectedT]) -> Optional[RegisteredBinding[InjectedT]]:
+        """Merges the bindings registered or installed since the last direct binding overriding the previous ones."""
+        direct_bindings = self._direct_bindings_by_target.get(target, [])
+        start_position = -1
+        for direct_binding in direct_bindings:
+            if not direct_binding.is_default and not self._extends_previous_binding(direct_binding.binding):
+                start_position = direct_binding.position
+        entries: List[Union[_DirectBinding, _InstalledRegistry]] = [
+            direct_binding for direct_binding in direct_bindings if direct_binding.position >= start_position
+        ]
+        entries.extend(self._get_registries_installed_after(start_position))
+        entries.sort(key=lambda entry: entry.position)
+        binding: Optional[RegisteredBinding[InjectedT]] = None
+        # Registered bindings are copied before being extended, copies are then extended in place
+        is_copy = False
+        for entry in entries:
+            if isinstance(entry, _InstalledRegistry):
+                next_binding = entry.get_binding(target)
+            elif not entry.is_default or binding is None:
+                next_binding = entry.binding
+            else:
+                next_binding = None
+            if next_binding is not None:
+                binding = self._merge(binding, next_binding, is_copy)
+                is_copy = binding is not next_binding
+        return binding
+
+    def _get_registries_installed_after(self, position: int) -> List[_InstalledRegistry]:
+        installed_registries = []
+        for installed_registry in reversed(self._installed_registries):
+            if installed_registry.position < position:
+                break
+            installed_registries.append(installed_registry)
+        return installed_registries
+
+    def _clear_cache(self, generation: int) -> None:
+        """Clears the merged bindings of this registry and of the registries it is installed in."""
+        self._cache = _LookupCache(generation)
+        for parent_registry in self._parent_registries:
+            parent_registry._clear_cache(generation)  # pylint: disable=protected-access
 
     @staticmethod
     def _is_object_builtin(target: Any) -> bool:
@@ -0,0 +1,78 @@
+from typing import Any, cast, Type, TYPE_CHECKING, Union
+
+from opyoid.exceptions import IncompatibleAdapter, NoBindingFound, NonInjectableTypeError
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.scopes import Scope
+from opyoid.target import Target
+from opyoid.utils import InjectedT
+from .binding_to_provider_adapter import BindingToProviderAdapter
+from .provider_cache_key import ProviderCacheKey
+from .registered_binding import RegisteredBinding
+
+if TYPE_CHECKING:
+    from opyoid.providers.providers_factories.from_registered_binding_provider_factory import (
+        FromRegisteredBindingProviderFactory,
+    )
+    from .map_binding import MapBinding
+    from .multi_binding import MultiBinding
+
+
+class ItemsBindingToProviderAdapter(BindingToProviderAdapter):
+    """Base class of the adapters creating a Provider from a binding grouping item bindings.
+
+    The unscoped provider of the items is cached with ProviderCacheKey.ITEM_PROVIDERS and returned for this cache key,
+    the items keep their own scope. The other targets get it wrapped in the scope of the binding.
+    """
+
+    registered_binding_type: Type[RegisteredBinding[Any]]
+
+    def __init__(self, item_provider_factory: "FromRegisteredBindingProviderFactory") -> None:
+        self._item_provider_factory = item_provider_factory
+
+    def create(self, binding: RegisteredBinding[InjectedT], context: InjectionContext[InjectedT]) -> Provider[Any]:
+        if not isinstance(binding, self.registered_binding_type):
+            raise IncompatibleAdapter
+
+        unscoped_provider = self._get_unscoped_provider(binding, context)
+        if context.target.provider_cache_key is ProviderCacheKey.ITEM_PROVIDERS:
+            return unscoped_provider
+        scope = cast(Union["MapBinding[Any]", "MultiBinding[Any]"], binding.raw_binding).scope
+        scope_context: InjectionContext[Scope] = context.get_child_context(Target(scope))
+        try:
+            scope_provider = scope_context.get_provider()
+        except NoBindingFound:
+            raise NonInjectableTypeError(
+                f"Could not create a provider for {binding!r}: they are no bindings for {scope.__name__!r}"
+            ) from None
+        return scope_provider.get().get_scoped_provider(unscoped_provider)
+
+    def _get_unscoped_provider(
+        self, binding: RegisteredBinding[InjectedT], context: InjectionContext[InjectedT]
+    ) -> Provider[InjectedT]:
+        """Item providers are created once and shared by the scoped provider and the unscoped one."""
+        provider_registry = context.injection_state.provider_registry
+        items_target: Target[InjectedT] = Target(
+            context.target.type, context.target.named, provider_cache_key=ProviderCacheKey.ITEM_PROVIDERS
+        )
+        cached_provider = provider_registry.get_provider(items_target)
+        if cached_provider is not None:
+            return cached_provider
+        unscoped_provider = self._create_unscoped_provider(binding, context)
+        provider_registry.set_provider(items_target, unscoped_provider)
+        return unscoped_provider
+
+    def _create_unscoped_provider(
+        self, binding: RegisteredBinding[InjectedT], context: InjectionContext[InjectedT]
+    ) -> Provider[InjectedT]:
+        """Returns a provider grouping the providers of the item bindings, created with _create_item_provider."""
+        raise NotImplementedError
+
+    def _create_item_provider(
+        self, item_binding: RegisteredBinding[Any], context: InjectionContext[InjectedT]
+    ) -> Provider[Any]:
+        new_context: InjectionContext[Any] = context.get_child_context(
+            Target(item_binding.target.type, item_binding.target.named)
+        )
+        context.injection_state.provider_registry.add_dependency(context.target, new_context.target)
+        return self._item_provider_factory.create(item_binding, new_context, cache_provider=False)
@@ -0,0 +1,5 @@
+from .dict_provider import DictProvider
+from .lazy_mapping import LazyMapping
+from .lazy_mapping_provider import LazyMappingProvider
+from .map_binding import MapBinding
+from .map_binding_to_provider_adapter import MapBindingToProviderAdapter
@@ -0,0 +1,16 @@
+from typing import Any, Dict
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class DictProvider(Provider[Dict[Any, InjectedT]]):
+    def __init__(self, item_providers: Dict[Any, Provider[InjectedT]]) -> None:
+        self._item_providers = item_providers
+
+    @property
+    def item_providers(self) -> Dict[Any, Provider[InjectedT]]:
+        return self._item_providers
+
+    def get(self) -> Dict[Any, InjectedT]:
+        return {key: provider.get() for key, provider in self._item_providers.items()}
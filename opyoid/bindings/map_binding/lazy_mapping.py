@@ -0,0 +1,35 @@
+from threading import Lock
+from typing import Any, Dict, Iterator, Mapping
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class LazyMapping(Mapping[Any, InjectedT]):
+    """Mapping creating each value when its key is first accessed, each value is only created once."""
+
+    def __init__(self, item_providers: Dict[Any, Provider[InjectedT]]) -> None:
+        self._item_providers = item_providers
+        self._items: Dict[Any, InjectedT] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, key: Any) -> InjectedT:
+        if key in self._items:
+            return self._items[key]
+        provider = self._item_providers[key]
+        with self._lock:
+            if key not in self._items:
+                self._items[key] = provider.get()
+        return self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._item_providers
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._item_providers)
+
+    def __len__(self) -> int:
+        return len(self._item_providers)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._items)}/{len(self._item_providers)} values created)"
@@ -0,0 +1,12 @@
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .dict_provider import DictProvider
+from .lazy_mapping import LazyMapping
+
+
+class LazyMappingProvider(Provider[LazyMapping[InjectedT]]):
+    def __init__(self, dict_provider: DictProvider[InjectedT]) -> None:
+        self._dict_provider = dict_provider
+
+    def get(self) -> LazyMapping[InjectedT]:
+        return LazyMapping(self._dict_provider.item_providers)
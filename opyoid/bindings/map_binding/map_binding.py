@@ -0,0 +1,31 @@
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+import attr
+
+from opyoid.bindings.binding import Binding
+from opyoid.bindings.multi_binding.item_binding import ItemBinding
+from opyoid.scopes import Scope, SingletonScope
+from opyoid.utils import InjectedT
+
+
+@attr.s(auto_attribs=True, frozen=True, repr=False)
+class MapBinding(Binding[Dict[Any, InjectedT]]):
+    key_type: Any
+    value_type: Union[Type[InjectedT], TypeVar]
+    item_bindings: Dict[Any, ItemBinding[InjectedT]]
+    scope: Type[Scope] = attr.ib(default=SingletonScope, kw_only=True)
+    _named: Optional[str] = attr.ib(default=None, kw_only=True)
+    override_bindings: bool = attr.ib(default=False, kw_only=True)
+
+    @property
+    def target_type(self) -> Any:
+        return Dict[self.key_type, self.value_type]  # type: ignore[name-defined]
+
+    @property
+    def named(self) -> Optional[str]:
+        return self._named
+
+    def __repr__(self) -> str:
+        items_string = ", ".join(f"{key!r}: {item!r}" for key, item in self.item_bindings.items())
+        scope_string = f", scope={self.scope}" if self.scope != SingletonScope else ""
+        return f"{self.__class__.__name__}({self.target!r} -> {{{items_string}}}{scope_string})"
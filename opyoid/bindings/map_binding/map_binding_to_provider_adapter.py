@@ -0,0 +1,25 @@
+from typing import Any, cast, Dict
+
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .dict_provider import DictProvider
+from ..items_binding_to_provider_adapter import ItemsBindingToProviderAdapter
+from ..registered_binding import RegisteredBinding
+from ..registered_map_binding import RegisteredMapBinding
+
+
+class MapBindingToProviderAdapter(ItemsBindingToProviderAdapter):
+    """Creates a Provider from a MapBinding."""
+
+    registered_binding_type = RegisteredMapBinding
+
+    def _create_unscoped_provider(
+        self, binding: RegisteredBinding[InjectedT], context: InjectionContext[InjectedT]
+    ) -> Provider[InjectedT]:
+        map_binding = cast(RegisteredMapBinding[Any], binding)
+        item_providers: Dict[Any, Provider[Any]] = {
+            key: self._create_item_provider(item_binding, context)
+            for key, item_binding in map_binding.item_bindings.items()
+        }
+        return cast(Provider[InjectedT], DictProvider(item_providers))
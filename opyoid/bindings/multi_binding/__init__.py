@@ -1,4 +1,7 @@
 from .item_binding import ItemBinding
+from .lazy_iterable import LazyIterable
+from .lazy_iterable_provider import LazyIterableProvider
 from .list_provider import ListProvider
 from .multi_binding import MultiBinding
 from .multi_binding_to_provider_adapter import MultiBindingToProviderAdapter
+from .parallel_list_provider import ParallelListProvider
@@ -0,0 +1,32 @@
+from threading import Lock
+from typing import Iterable, Iterator, List
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class LazyIterable(Iterable[InjectedT]):
+    """Iterable creating its items on demand and in order, each item is only created once."""
+
+    def __init__(self, item_providers: List[Provider[InjectedT]]) -> None:
+        self._item_providers = item_providers
+        self._items: List[InjectedT] = []
+        self._lock = Lock()
+
+    def __iter__(self) -> Iterator[InjectedT]:
+        for index in range(len(self._item_providers)):
+            yield self._get_item(index)
+
+    def __len__(self) -> int:
+        return len(self._item_providers)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._items)}/{len(self._item_providers)} items created)"
+
+    def _get_item(self, index: int) -> InjectedT:
+        if index < len(self._items):
+            return self._items[index]
+        with self._lock:
+            while len(self._items) <= index:
+                self._items.append(self._item_providers[len(self._items)].get())
+        return self._items[index]
@@ -0,0 +1,12 @@
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .lazy_iterable import LazyIterable
+from .list_provider import ListProvider
+
+
+class LazyIterableProvider(Provider[LazyIterable[InjectedT]]):
+    def __init__(self, list_provider: ListProvider[InjectedT]) -> None:
+        self._list_provider = list_provider
+
+    def get(self) -> LazyIterable[InjectedT]:
+        return LazyIterable(self._list_provider.item_providers)
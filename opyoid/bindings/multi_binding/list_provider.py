@@ -8,5 +8,9 @@ class ListProvider(Provider[List[InjectedT]]):
     def __init__(self, item_providers: List[Provider[InjectedT]]) -> None:
         self._item_providers = item_providers
 
+    @property
+    def item_providers(self) -> List[Provider[InjectedT]]:
+        return self._item_providers
+
     def get(self) -> List[InjectedT]:
         return [provider.get() for provider in self._item_providers]
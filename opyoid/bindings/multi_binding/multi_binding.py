@@ -15,6 +15,7 @@ class MultiBinding(Binding[List[InjectedT]]):
     scope: Type[Scope] = attr.ib(default=SingletonScope, kw_only=True)
     _named: Optional[str] = attr.ib(default=None, kw_only=True)
     override_bindings: bool = attr.ib(default=False, kw_only=True)
+    parallel: bool = attr.ib(default=False, kw_only=True)
 
     @property
     def target_type(self) -> Union[Type[List[InjectedT]], TypeVar]:
@@ -27,4 +28,5 @@ class MultiBinding(Binding[List[InjectedT]]):
     def __repr__(self) -> str:
         items_string = ", ".join(f"{item!r}" for item in self.item_bindings)
         scope_string = f", scope={self.scope}" if self.scope != SingletonScope else ""
-        return f"{self.__class__.__name__}({self.target!r} -> [{items_string}]{scope_string})"
+        parallel_string = ", parallel=True" if self.parallel else ""
+        return f"{self.__class__.__name__}({self.target!r} -> [{items_string}]{scope_string}{parallel_string})"
@@ -0,0 +1,44 @@
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from threading import local, Lock
+from typing import List, Optional
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .list_provider import ListProvider
+
+
+class ParallelListProvider(ListProvider[InjectedT]):
+    """Creates the items concurrently on an executor shared by all parallel multi bindings.
+
+    Items are returned in the binding order. If some items cannot be created, all items are waited for and the error of
+    the first failing item is raised. Parallel lists created while creating an item are created sequentially, so that
+    workers never wait for other tasks of the same executor.
+    """
+
+    _executor: Optional[Executor] = None
+    _executor_lock = Lock()
+    _worker_state = local()
+
+    def get(self) -> List[InjectedT]:
+        if len(self._item_providers) < 2 or getattr(self._worker_state, "is_worker", False):
+            return super().get()
+        executor = self._get_executor()
+        futures = [executor.submit(self._get_item, provider) for provider in self._item_providers]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(thread_name_prefix="opyoid")
+        return cls._executor
+
+    @classmethod
+    def _get_item(cls, provider: Provider[InjectedT]) -> InjectedT:
+        cls._worker_state.is_worker = True
+        try:
+            return provider.get()
+        finally:
+            cls._worker_state.is_worker = False
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ProviderCacheKey(Enum):
+    """Cache keys of the providers registered next to the provider of a target."""
+
+    # Unscoped provider of a multi binding or a map binding, giving access to its item providers
+    ITEM_PROVIDERS = "item_providers"
@@ -0,0 +1,12 @@
+from typing import Any, Dict, TypeVar
+
+import attr
+
+from .registered_binding import RegisteredBinding
+
+InjectedItemT = TypeVar("InjectedItemT", bound=Any)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RegisteredMapBinding(RegisteredBinding[Dict[Any, InjectedItemT]]):
+    item_bindings: Dict[Any, RegisteredBinding[InjectedItemT]] = attr.Factory(dict)
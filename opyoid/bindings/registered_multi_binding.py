@@ -1,4 +1,4 @@
-from typing import Any, List, TypeVar
+from typing import Any, List, Set, TypeVar
 
 import attr
 
@@ -7,6 +7,32 @@ from .registered_binding import RegisteredBinding
 InjectedItemT = TypeVar("InjectedItemT", bound=Any)
 
 
+class _ItemBindingIndex:
+    """Membership index of item bindings, kept in sync lazily as item bindings are only appended to their list."""
+
+    def __init__(self) -> None:
+        self._hashable_item_bindings: Set[RegisteredBinding[Any]] = set()
+        self._unhashable_item_bindings: List[RegisteredBinding[Any]] = []
+        self._indexed_count = 0
+
+    def contains(self, item_bindings: List[RegisteredBinding[Any]], item_binding: RegisteredBinding[Any]) -> bool:
+        for indexed_item_binding in item_bindings[self._indexed_count :]:
+            try:
+                self._hashable_item_bindings.add(indexed_item_binding)
+            except TypeError:
+                self._unhashable_item_bindings.append(indexed_item_binding)
+        self._indexed_count = len(item_bindings)
+        try:
+            return item_binding in self._hashable_item_bindings
+        except TypeError:
+            return item_binding in self._unhashable_item_bindings
+
+
 @attr.s(auto_attribs=True, frozen=True)
 class RegisteredMultiBinding(RegisteredBinding[List[InjectedItemT]]):
     item_bindings: List[RegisteredBinding[InjectedItemT]] = attr.Factory(list)
+    _item_binding_index: _ItemBindingIndex = attr.ib(factory=_ItemBindingIndex, init=False, eq=False, repr=False)
+
+    def has_item_binding(self, item_binding: RegisteredBinding[InjectedItemT]) -> bool:
+        """Item bindings with unhashable instances are compared with all other unhashable item bindings."""
+        return self._item_binding_index.contains(self.item_bindings, item_binding)
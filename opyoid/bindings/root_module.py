@@ -31,7 +31,12 @@ class RootModule(Module):
         self.bind(SingletonScope, to_instance=SingletonScope())
         self.bind(ThreadScope, to_instance=ThreadScope())
         self.bind(ContextScope, to_instance=ContextScope())
-        for module in self._modules:
+        self.register(self._modules, self._bindings)
+
+    def register(
+        self, modules: List[Union[AbstractModule, Type[AbstractModule]]], bindings: List[Binding[Any]]
+    ) -> None:
+        for module in modules:
             self.install(module)
-        for binding in self._bindings:
+        for binding in bindings:
             self._register(binding)
@@ -1,15 +1,18 @@
 import logging
 from inspect import Parameter, signature
-from typing import Any, Callable, Dict, List, Optional, Type
+from types import MemberDescriptorType
+from typing import Any, Callable, ClassVar, Dict, get_origin, get_type_hints, List, Optional, Tuple, Type
 
 from opyoid.bindings.instance_binding import FromInstanceProvider
 from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
+from opyoid.injected_callable import InjectedCallable
 from opyoid.injection_context import InjectionContext
 from opyoid.provider import Provider
 from opyoid.target import Target
 from opyoid.type_checker import TypeChecker
 from opyoid.utils import EMPTY, get_class_full_name, InjectedT
 from .from_callable_provider import FromCallableProvider
+from .init_parameters import InitParameters
 from ...scopes import Scope
 
 
@@ -30,14 +33,13 @@ class CallableToProviderAdapter:
         if cached_provider:
             return cached_provider
         if isinstance(type_or_function, type):
-            parameters = list(signature(type_or_function.__init__).parameters.values())[1:]  # type: ignore[misc]
+            parameters = list(InitParameters.get(type_or_function))
         else:
             parameters = list(signature(type_or_function).parameters.values())
         positional_providers: List[Provider[Any]] = []
         args_provider: Optional[Provider[List[Any]]] = None
         keyword_providers: Dict[str, Provider[Any]] = {}
         for parameter in parameters:
-            context.current_parameter = parameter
             # Ignore '**kwargs'
             if parameter.kind == Parameter.VAR_KEYWORD:
                 continue
@@ -70,25 +72,54 @@ class CallableToProviderAdapter:
         context.injection_state.provider_registry.set_provider(context.target, provider)
         return provider
 
+    def create_injected_callable(
+        self, function: Callable[..., InjectedT], context: InjectionContext[InjectedT]
+    ) -> InjectedCallable[InjectedT]:
+        """Resolves the parameters of a function, those without a binding or a default value are given when calling."""
+        positional_providers: List[Tuple[str, Optional[Provider[Any]]]] = []
+        args_provider: Optional[Tuple[str, Provider[List[Any]]]] = None
+        keyword_providers: List[Tuple[str, Optional[Provider[Any]]]] = []
+        for parameter in signature(function).parameters.values():
+            if parameter.kind == Parameter.VAR_KEYWORD:
+                continue
+            if parameter.kind == Parameter.VAR_POSITIONAL:
+                args_provider = (parameter.name, self._get_positional_parameter_provider(parameter, function, context))
+                continue
+            parameter_provider = self.get_bound_parameter_provider(parameter, context)
+            if parameter_provider is None and parameter.default is not Parameter.empty:
+                parameter_provider = FromInstanceProvider(parameter.default)
+            if parameter.kind == Parameter.KEYWORD_ONLY:
+                keyword_providers.append((parameter.name, parameter_provider))
+            else:
+                positional_providers.append((parameter.name, parameter_provider))
+        return InjectedCallable(function, tuple(positional_providers), args_provider, tuple(keyword_providers))
+
+    def get_member_providers(
+        self, injected_class: Type[Any], context: InjectionContext[Any]
+    ) -> Tuple[Tuple[str, Provider[Any]], ...]:
+        """Resolves the annotated members of a class without a value in the class, as keyword only parameters."""
+        member_providers = []
+        for member_name, member_type in get_type_hints(injected_class).items():
+            if get_origin(member_type) is ClassVar or self._has_class_value(injected_class, member_name):
+                continue
+            parameter = Parameter(member_name, Parameter.KEYWORD_ONLY, annotation=member_type)
+            member_providers.append((member_name, self._get_parameter_provider(parameter, injected_class, context)))
+        return tuple(member_providers)
+
+    @staticmethod
+    def _has_class_value(injected_class: Type[Any], member_name: str) -> bool:
+        """Slots are class attributes, but they have no value until they are set on an instance."""
+        for parent_class in injected_class.__mro__:
+            if member_name in vars(parent_class):
+                return not isinstance(vars(parent_class)[member_name], MemberDescriptorType)
+        return False
+
     def _get_parameter_provider(
         self, parameter: Parameter, type_or_function: Callable[..., InjectedT], context: InjectionContext[InjectedT]
     ) -> Provider[InjectedT]:
-        default_value = parameter.default if parameter.default is not Parameter.empty else EMPTY
-        if parameter.annotation is not Parameter.empty:
-            if TypeChecker.is_named(parameter.annotation):
-                provider: Optional[Provider[InjectedT]] = self._get_provider(
-                    [Target(parameter.annotation.original_type, parameter.annotation.name, default_value)], context
-                )
-            else:
-                provider = self._get_provider(
-                    [
-                        Target(parameter.annotation, parameter.name, default_value),
-                        Target(parameter.annotation, None, default_value),
-                    ],
-                    context,
-                )
-            if provider:
-                return provider
+        provider = self.get_bound_parameter_provider(parameter, context)
+        if provider:
+            return provider
         if parameter.default is not Parameter.empty:
             return FromInstanceProvider(parameter.default)
         raise NonInjectableTypeError(
@@ -96,6 +127,30 @@ class CallableToProviderAdapter:
             f"{get_class_full_name(parameter.annotation)} required by {type_or_function}"
         )
 
+    def get_bound_parameter_provider(
+        self, parameter: Parameter, context: InjectionContext[Any], allow_jit_provider: bool = True
+    ) -> Optional[Provider[Any]]:
+        """Returns the provider of a typed parameter, looked up with its name first, or None if it cannot be found."""
+        if parameter.annotation is Parameter.empty:
+            return None
+        default_value = parameter.default if parameter.default is not Parameter.empty else EMPTY
+        if TypeChecker.is_named(parameter.annotation):
+            return self._get_provider(
+                [Target(parameter.annotation.original_type, parameter.annotation.name, default_value)],
+                parameter,
+                context,
+                allow_jit_provider,
+            )
+        return self._get_provider(
+            [
+                Target(parameter.annotation, parameter.name, default_value),
+                Target(parameter.annotation, None, default_value),
+            ],
+            parameter,
+            context,
+            allow_jit_provider,
+        )
+
     def _get_positional_parameter_provider(
         self, parameter: Parameter, type_or_function: Callable[..., InjectedT], context: InjectionContext[InjectedT]
     ) -> Provider[List[InjectedT]]:
@@ -110,6 +165,7 @@ class CallableToProviderAdapter:
                         default=[],
                     )
                 ],
+                parameter,
                 context,
             )
         else:
@@ -118,6 +174,7 @@ class CallableToProviderAdapter:
                     Target(List[parameter.annotation], parameter.name, default=[]),  # type: ignore[name-defined]
                     Target(List[parameter.annotation], default=[]),  # type: ignore[name-defined]
                 ],
+                parameter,
                 context,
             )
         if provider:
@@ -130,14 +187,18 @@ class CallableToProviderAdapter:
 
     @staticmethod
     def _get_provider(
-        targets: List[Target[InjectedT]], parent_context: InjectionContext[Any]
+        targets: List[Target[InjectedT]],
+        parameter: Parameter,
+        parent_context: InjectionContext[Any],
+        allow_jit_provider: bool = True,
     ) -> Optional[Provider[InjectedT]]:
+        last_target_index = len(targets) - 1
         for target_index, target in enumerate(targets):
             context = parent_context.get_child_context(
                 target,
-                allow_jit_provider=target_index == len(targets) - 1,
+                allow_jit_provider=allow_jit_provider and target_index == last_target_index,
                 current_class=parent_context.current_class,
-                current_parameter=parent_context.current_parameter,
+                current_parameter=parameter,
             )
             try:
                 return context.get_provider()
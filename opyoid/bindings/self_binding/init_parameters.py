@@ -0,0 +1,137 @@
+import dataclasses
+import sys
+from functools import lru_cache
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, ForwardRef, get_type_hints, Optional, Tuple, Type
+
+import attr
+
+# Code object flags, see the inspect module
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
+
+
+class InitParameters:
+    """Reads the constructor parameters of classes, cached by class.
+
+    The generated constructors of dataclasses, attrs classes and named tuples are read from their fields, with their
+    string annotations resolved once in the module of the class. Other constructors use inspect.signature.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get(injected_class: Type[Any]) -> Tuple[Parameter, ...]:
+        """Returns the parameters of the class constructor, without self."""
+        if InitParameters._is_named_tuple(injected_class):
+            constructor: Callable[..., Any] = injected_class.__new__
+        else:
+            constructor = injected_class.__init__  # type: ignore[misc]
+        annotation_by_name = InitParameters._get_field_annotations(injected_class)
+        if annotation_by_name is not None:
+            parameters = InitParameters._get_generated_parameters(constructor, annotation_by_name)
+            if parameters is not None:
+                return parameters
+        return tuple(signature(constructor).parameters.values())[1:]
+
+    @staticmethod
+    def _is_named_tuple(injected_class: Type[Any]) -> bool:
+        return issubclass(injected_class, tuple) and hasattr(injected_class, "_fields")
+
+    @staticmethod
+    def _get_field_annotations(injected_class: Type[Any]) -> Optional[Dict[str, Any]]:
+        """Returns the annotations of the constructor parameters by parameter name, None if the class has no fields."""
+        if dataclasses.is_dataclass(injected_class):
+            field_annotations = {
+                field.name: (field.name, field.type) for field in dataclasses.fields(injected_class) if field.init
+            }
+        elif attr.has(injected_class):
+            field_annotations = {
+                # attrs removes the leading underscores of private attributes in the constructor
+                getattr(attribute, "alias", None) or attribute.name.lstrip("_"): (attribute.name, attribute.type)
+                for attribute in attr.fields(injected_class)
+                if attribute.init
+            }
+        elif InitParameters._is_named_tuple(injected_class):
+            field_annotations = {
+                field_name: (field_name, getattr(injected_class, "__annotations__", {}).get(field_name))
+                for field_name in injected_class._fields
+            }
+        else:
+            return None
+        # Named tuples store their string annotations as forward references
+        field_annotations = {
+            parameter_name: (field_name, InitParameters._get_forward_arg(field_type))
+            for parameter_name, (field_name, field_type) in field_annotations.items()
+        }
+        if any(isinstance(field_type, str) for _field_name, field_type in field_annotations.values()):
+            type_hints = InitParameters._get_type_hints(injected_class)
+        else:
+            type_hints = {}
+        return {
+            parameter_name: type_hints.get(field_name, field_type)
+            for parameter_name, (field_name, field_type) in field_annotations.items()
+        }
+
+    @staticmethod
+    def _get_forward_arg(annotation: Any) -> Any:
+        if isinstance(annotation, ForwardRef):
+            return annotation.__forward_arg__
+        return annotation
+
+    @staticmethod
+    def _get_type_hints(injected_class: Type[Any]) -> Dict[str, Any]:
+        try:
+            return get_type_hints(injected_class)
+        except Exception:  # pylint: disable=broad-except
+            pass
+        # Resolved one by one, so that only the annotations that cannot be resolved are kept as str, they are resolved
+        # later with the names of the bound classes
+        type_hints = {}
+        for parent_class in reversed(injected_class.__mro__):
+            module = sys.modules.get(parent_class.__module__)
+            global_namespace = vars(module) if module is not None else {}
+            for name, annotation in vars(parent_class).get("__annotations__", {}).items():
+                type_hints[name] = InitParameters._resolve(annotation, global_namespace, dict(vars(parent_class)))
+        return type_hints
+
+    @staticmethod
+    def _resolve(annotation: Any, global_namespace: Dict[str, Any], local_namespace: Dict[str, Any]) -> Any:
+        annotation = InitParameters._get_forward_arg(annotation)
+        if not isinstance(annotation, str):
+            return annotation
+        try:
+            return eval(annotation, global_namespace, local_namespace)  # pylint: disable=eval-used
+        except Exception:  # pylint: disable=broad-except
+            return annotation
+
+    @staticmethod
+    def _get_generated_parameters(
+        constructor: Callable[..., Any], annotation_by_name: Dict[str, Any]
+    ) -> Optional[Tuple[Parameter, ...]]:
+        """Returns None if the constructor was not generated from the fields, e.g. if it was overridden."""
+        code = getattr(constructor, "__code__", None)
+        if (
+            code is None
+            # Generated code has no source file, e.g. <string>
+            or not code.co_filename.startswith("<")
+            or hasattr(constructor, "__signature__")
+            or code.co_posonlyargcount
+            or code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+        ):
+            return None
+        names = code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount]
+        if set(names) != annotation_by_name.keys():
+            return None
+        positional_names = names[: code.co_argcount - 1]
+        defaults = constructor.__defaults__ or ()
+        default_by_name = dict(zip(positional_names[len(positional_names) - len(defaults) :], defaults))
+        default_by_name.update(constructor.__kwdefaults__ or {})
+        return tuple(
+            Parameter(
+                name,
+                Parameter.POSITIONAL_OR_KEYWORD if name in positional_names else Parameter.KEYWORD_ONLY,
+                default=default_by_name.get(name, Parameter.empty),
+                annotation=Parameter.empty if annotation_by_name[name] is None else annotation_by_name[name],
+            )
+            for name in names
+        )
@@ -14,10 +14,10 @@ class EnvVarCondition(Condition):
         self._expected_value = expected_value
 
     def is_valid(self) -> bool:
-        if self._env_var_name not in os.environ:
+        env_value = os.environ.get(self._env_var_name)
+        if env_value is None:
             self.logger.info(f"Disabling {self._module} as environment variable {self._env_var_name} is missing")
             return False
-        env_value = os.getenv(self._env_var_name)
         if self._expected_value is not None and env_value != self._expected_value:
             self.logger.info(
                 f"Disabling {self._module} as environment variable {self._env_var_name} is set to {env_value}"
@@ -0,0 +1,4 @@
+from .config_source import ConfigSource
+from .dict_config_source import DictConfigSource
+from .env_config_source import EnvConfigSource
+from .file_config_source import FileConfigSource
@@ -0,0 +1,36 @@
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional
+
+from opyoid.providers.providers_factories.from_env_var_provider_factory import FromEnvVarProviderFactory
+
+
+class ConfigSource:
+    """Base class of the configuration sources, used to inject the parameters of built-in and collection types.
+
+    Values are loaded once, on the first lookup, and indexed by their environment variable name (e.g. MY_CLASS_MY_PARAM
+    for the parameter my_param of MyClass).
+    """
+
+    def __init__(self) -> None:
+        self._values: Optional[Mapping[str, Any]] = None
+        self._lock = Lock()
+
+    def get_values(self) -> Mapping[str, Any]:
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    self._values = self.load()
+        return self._values
+
+    def load(self) -> Mapping[str, Any]:
+        """Returns all the values of the source indexed by environment variable name, only called once."""
+        raise NotImplementedError
+
+    @staticmethod
+    def index_values(values_by_class_name: Mapping[str, Mapping[str, Any]]) -> Dict[str, Any]:
+        """Indexes values formatted as {"MyClass": {"my_param": value}} by environment variable name."""
+        return {
+            FromEnvVarProviderFactory.get_env_var_name(class_name, parameter_name): value
+            for class_name, values_by_parameter_name in values_by_class_name.items()
+            for parameter_name, value in values_by_parameter_name.items()
+        }
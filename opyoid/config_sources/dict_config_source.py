@@ -0,0 +1,17 @@
+from typing import Any, Mapping
+
+from .config_source import ConfigSource
+
+
+class DictConfigSource(ConfigSource):
+    """Reads values formatted as {"MyClass": {"my_param": value}}."""
+
+    def __init__(self, values_by_class_name: Mapping[str, Mapping[str, Any]]) -> None:
+        super().__init__()
+        self._values_by_class_name = values_by_class_name
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._values_by_class_name)})"
+
+    def load(self) -> Mapping[str, Any]:
+        return self.index_values(self._values_by_class_name)
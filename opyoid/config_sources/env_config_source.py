@@ -0,0 +1,14 @@
+import os
+from typing import Any, Mapping
+
+from .config_source import ConfigSource
+
+
+class EnvConfigSource(ConfigSource):
+    """Reads the environment variables once, to use them in another order than the default environment lookup."""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def load(self) -> Mapping[str, Any]:
+        return dict(os.environ)
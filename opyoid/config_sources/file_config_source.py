@@ -0,0 +1,63 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+from opyoid.exceptions import InjectException
+from .config_source import ConfigSource
+
+
+class FileConfigSource(ConfigSource):
+    """Reads a JSON, TOML or YAML file, the format is read from the file extension.
+
+    The file content is formatted as {"MyClass": {"my_param": value}}. TOML files need the tomli package before python
+    3.11, YAML files need the PyYAML package.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__()
+        self._path = Path(path)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self._path)!r})"
+
+    def load(self) -> Mapping[str, Any]:
+        suffix = self._path.suffix.lower()
+        if suffix == ".json":
+            with self._path.open(encoding="utf-8") as file:
+                values_by_class_name = json.load(file)
+        elif suffix == ".toml":
+            values_by_class_name = self._load_toml()
+        elif suffix in (".yaml", ".yml"):
+            values_by_class_name = self._load_yaml()
+        else:
+            raise InjectException(f"Unsupported configuration file format {suffix!r} for {self._path}")
+        if not isinstance(values_by_class_name, Mapping) or not all(
+            isinstance(values_by_parameter_name, Mapping) for values_by_parameter_name in values_by_class_name.values()
+        ):
+            raise InjectException(
+                f"Invalid configuration file {self._path}, its content should be formatted as "
+                '{"MyClass": {"my_param": value}}'
+            )
+        return self.index_values(values_by_class_name)
+
+    def _load_toml(self) -> Mapping[str, Any]:
+        # pylint: disable=import-outside-toplevel
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:  # pragma: nocover
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise InjectException(f"The tomli package is required to load {self._path}") from None
+        with self._path.open("rb") as file:
+            return tomllib.load(file)
+
+    def _load_yaml(self) -> Mapping[str, Any]:
+        # pylint: disable=import-outside-toplevel
+        try:
+            import yaml
+        except ImportError:
+            raise InjectException(f"The PyYAML package is required to load {self._path}") from None
+        with self._path.open(encoding="utf-8") as file:
+            return yaml.safe_load(file) or {}
@@ -1,3 +1,6 @@
+from typing import Any, Tuple
+
+
 class InjectException(Exception):
     """Base class for all exceptions."""
 
@@ -29,9 +32,14 @@ class NamedError(InjectException):
 
 
 class CyclicDependencyError(InjectException):
-    """Raised when a cyclic dependency is detected."""
+    """Raised when a cyclic dependency is detected.
 
-    pass
+    :param cycle: targets of the cycle, each one depending on the next one and the last one on the first one
+    """
+
+    def __init__(self, message: str, cycle: Tuple[Any, ...] = ()) -> None:
+        super().__init__(message)
+        self.cycle = cycle
 
 
 class IncompatibleProviderFactory(InjectException):
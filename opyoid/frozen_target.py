@@ -2,14 +2,20 @@ from typing import Generic, Optional, Type, TypeVar, Union
 
 import attr
 
+from opyoid.type_checker import TypeChecker
 from opyoid.utils import get_class_full_name, InjectedT
 
 
+def _normalize(target_type: Union[Type[InjectedT], TypeVar, str]) -> Union[Type[InjectedT], TypeVar, str]:
+    """Named function converter so that mypy keeps the type of the field."""
+    return TypeChecker.normalize(target_type)  # type: ignore[no-any-return]
+
+
 @attr.s(auto_attribs=True, frozen=True, repr=False)
 class FrozenTarget(Generic[InjectedT]):
     """Identifies a class being injected, can be used as an index as it is read only."""
 
-    type: Union[Type[InjectedT], TypeVar]
+    type: Union[Type[InjectedT], TypeVar, str] = attr.ib(converter=_normalize)
     named: Optional[str] = None
 
     def __repr__(self) -> str:
@@ -0,0 +1,83 @@
+from typing import Any, cast, List, Optional, Type, TYPE_CHECKING, Union
+
+from .bindings import Binding, InstanceBinding
+from .bindings.abstract_module import AbstractModule
+from .bindings.root_module import RootModule
+from .exceptions import CyclicDependencyError, InjectException
+from .injection_context import InjectionContext
+from .injection_state import InjectionState
+from .injector_options import InjectorOptions
+from .provider import Provider
+from .providers import ProviderCreator
+from .providers.providers_factories import MissingBindingProviderFactory
+from .scopes import Scope
+from .target import Target
+from .utils import InjectedT
+
+if TYPE_CHECKING:
+    from .injector import Injector
+
+
+class _UninstantiatedScope(Scope):
+    """Replaces all scopes while checking, so that nothing is instantiated (e.g. by the ImmediateScope)."""
+
+    def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
+        return inner_provider
+
+
+class GraphChecker:
+    """Checks that all bindings can be injected, without calling any constructor or provider.
+
+    Providers are created as in the Injector, but missing parameters are replaced by placeholders so that all the
+    missing bindings and cyclic dependencies are reported in one pass.
+    """
+
+    def __init__(
+        self,
+        modules: Optional[List[Union[AbstractModule, Type[AbstractModule]]]] = None,
+        bindings: Optional[List[Binding[Any]]] = None,
+        options: Optional[InjectorOptions] = None,
+    ) -> None:
+        self._modules = modules
+        self._bindings = bindings
+        self._options = options or InjectorOptions()
+
+    def check(self) -> List[str]:
+        """Returns the error messages of all targets that cannot be injected.
+
+        Invalid bindings still raise an InjectException when configuring the modules.
+        """
+        # No injector exists while checking, classes depending on it can still be resolved
+        root_module = RootModule(cast("Injector", None), self._modules, self._bindings)
+        root_module.configure_once()
+        binding_registry = root_module.binding_registry
+        uninstantiated_scope = _UninstantiatedScope()
+        root_module.register(
+            [],
+            [
+                InstanceBinding(target.type, uninstantiated_scope, named=target.named)
+                for target in binding_registry.get_bindings_by_target()
+                if isinstance(target.type, type) and issubclass(target.type, Scope)
+            ],
+        )
+        missing_binding_provider_factory = MissingBindingProviderFactory()
+        state = InjectionState(ProviderCreator(missing_binding_provider_factory), binding_registry, self._options)
+        error_messages = []
+        for target in list(binding_registry.get_bindings_by_target()):
+            context: InjectionContext[Any] = InjectionContext(Target(target.type, target.named), state)
+            try:
+                context.get_provider()
+            except CyclicDependencyError as error:
+                error_messages.append(self._get_cycle_error_message(error) if error.cycle else str(error))
+            except InjectException as error:
+                error_messages.append(str(error))
+        return list(dict.fromkeys(missing_binding_provider_factory.error_messages + error_messages))
+
+    @staticmethod
+    def _get_cycle_error_message(error: CyclicDependencyError) -> str:
+        """Cycles start with their first target in alphabetical order, so that each cycle is reported once."""
+        target_names = [repr(target) for target in error.cycle]
+        start_index = target_names.index(min(target_names))
+        target_names = target_names[start_index:] + target_names[: start_index + 1]
+        dependency_chain = "\n".join(f"-> {target_name}" for target_name in target_names)
+        return f"Cyclic dependency detected, injection graph: \n{dependency_chain}"
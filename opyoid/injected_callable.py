@@ -0,0 +1,59 @@
+from typing import Any, Callable, Generic, List, Optional, Tuple
+
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class InjectedCallable(Generic[InjectedT]):
+    """Calls a function with its parameters injected, the providers of its parameters are resolved only once.
+
+    Arguments given when calling override the injected parameters, parameters without a binding or a default value
+    must be given. Other keyword arguments are passed to the function.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., InjectedT],
+        positional_providers: Tuple[Tuple[str, Optional[Provider[Any]]], ...],
+        args_provider: Optional[Tuple[str, Provider[List[Any]]]],
+        keyword_providers: Tuple[Tuple[str, Optional[Provider[Any]]], ...],
+    ) -> None:
+        self._function = function
+        self._positional_providers = positional_providers
+        self._args_provider = args_provider
+        self._keyword_providers = keyword_providers
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._function!r})"
+
+    def __call__(self, *args: Any, **overrides: Any) -> InjectedT:
+        positional_parameter_count = len(self._positional_providers)
+        if len(args) > positional_parameter_count and self._args_provider is None:
+            raise TypeError(
+                f"{self!r} takes {positional_parameter_count} positional arguments but {len(args)} were given"
+            )
+        for parameter_name, _provider in self._positional_providers[: len(args)]:
+            if parameter_name in overrides:
+                raise TypeError(f"{self!r} got multiple values for argument {parameter_name!r}")
+        all_args = list(args[:positional_parameter_count]) + [
+            overrides.pop(parameter_name) if parameter_name in overrides else self._get(parameter_name, provider)
+            for parameter_name, provider in self._positional_providers[len(args) :]
+        ]
+        if len(args) > positional_parameter_count:
+            all_args += args[positional_parameter_count:]
+        elif self._args_provider is not None:
+            args_name, args_provider = self._args_provider
+            all_args += overrides.pop(args_name) if args_name in overrides else args_provider.get()
+        for parameter_name, provider in self._keyword_providers:
+            if parameter_name not in overrides:
+                overrides[parameter_name] = self._get(parameter_name, provider)
+        return self._function(*all_args, **overrides)
+
+    def _get(self, parameter_name: str, provider: Optional[Provider[Any]]) -> Any:
+        if provider is None:
+            raise NonInjectableTypeError(
+                f"Could not find a binding or a default value for {parameter_name} required by {self._function!r}, it"
+                " should be given when calling"
+            )
+        return provider.get()
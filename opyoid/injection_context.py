@@ -2,8 +2,6 @@ import logging
 from inspect import Parameter
 from typing import Any, Generic, List, Optional, Type, TYPE_CHECKING, TypeVar
 
-import attr
-
 from .exceptions import CyclicDependencyError
 from .provider import Provider
 from .target import Target
@@ -17,26 +15,80 @@ if TYPE_CHECKING:
 InjectedSubT = TypeVar("InjectedSubT", bound=Any)
 
 
-@attr.s(auto_attribs=True)
 class InjectionContext(Generic[InjectedT]):
+    """Resolution frame of a single edge of the injection graph.
+
+    Frames are created for every dependency lookup, they only use slots and compare the injection state by identity to
+    keep their creation and the cyclic dependency check cheap.
+    """
+
+    __slots__ = (
+        "target",
+        "injection_state",
+        "parent_context",
+        "allow_jit_provider",
+        "current_class",
+        "current_parameter",
+    )
+
     logger = logging.getLogger(__name__)
 
-    target: Target[InjectedT]
-    injection_state: "InjectionState"
-    parent_context: Optional["InjectionContext[Any]"] = attr.ib(default=None, eq=False)
-    allow_jit_provider: bool = True
-    current_class: Optional[Type[InjectedT]] = None
-    current_parameter: Optional[Parameter] = None
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        target: Target[InjectedT],
+        injection_state: "InjectionState",
+        parent_context: Optional["InjectionContext[Any]"] = None,
+        *,
+        allow_jit_provider: bool = True,
+        current_class: Optional[Type[InjectedT]] = None,
+        current_parameter: Optional[Parameter] = None,
+    ) -> None:
+        self.target = target
+        self.injection_state = injection_state
+        self.parent_context = parent_context
+        self.allow_jit_provider = allow_jit_provider
+        self.current_class = current_class
+        self.current_parameter = current_parameter
+        self._check_cyclic_dependency()
 
-    def __attrs_post_init__(self) -> None:
-        context = self
-        while context.parent_context:
-            if self == context.parent_context:
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InjectionContext):
+            return NotImplemented
+        return (
+            self.target == other.target
+            and self.injection_state is other.injection_state
+            and self.allow_jit_provider == other.allow_jit_provider
+            and self.current_class == other.current_class
+            and self.current_parameter == other.current_parameter
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.target!r})"
+
+    def _check_cyclic_dependency(self) -> None:
+        context = self.parent_context
+        cycle: List[Target[Any]] = []
+        while context is not None:
+            cycle.append(context.target)
+            if self == context or self._is_same_forward_reference(context):
                 dependency_chain = "\n".join(f"-> {target!r}" for target in reversed(self._dependency_chain))
                 self.logger.error(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
-                raise CyclicDependencyError(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
+                raise CyclicDependencyError(
+                    f"Cyclic dependency detected, injection graph: \n{dependency_chain}", tuple(reversed(cycle))
+                )
             context = context.parent_context
 
+    def _is_same_forward_reference(self, other: "InjectionContext[Any]") -> bool:
+        """Forward references are replaced by the class they reference once resolved, new lookups still use a str."""
+        return (
+            isinstance(self.target.type, str)
+            and isinstance(other.target.type, type)
+            and self.target.type == other.target.type.__name__
+            and self.target.named == other.target.named
+            and self.injection_state is other.injection_state
+        )
+
     @property
     def _dependency_chain(self) -> List[Target[Any]]:
         context = self
@@ -55,11 +107,16 @@ class InjectionContext(Generic[InjectedT]):
         current_parameter: Optional[Parameter] = None,
     ) -> "InjectionContext[InjectedSubT]":
         return InjectionContext(
-            new_target, self.injection_state, self, allow_jit_provider, current_class, current_parameter
+            new_target,
+            self.injection_state,
+            self,
+            allow_jit_provider=allow_jit_provider,
+            current_class=current_class,
+            current_parameter=current_parameter,
         )
 
     def get_new_state_context(self, new_state: "InjectionState") -> "InjectionContext[InjectedT]":
-        return InjectionContext(self.target, new_state, self.parent_context, self.allow_jit_provider)
+        return InjectionContext(self.target, new_state, self.parent_context, allow_jit_provider=self.allow_jit_provider)
 
     def get_provider(self) -> Provider[InjectedT]:
         return self.injection_state.provider_creator.get_provider(self)
@@ -1,4 +1,5 @@
-from typing import Dict, Optional, TYPE_CHECKING
+import os
+from typing import Dict, Mapping, Optional, TYPE_CHECKING
 
 import attr
 
@@ -18,3 +19,4 @@ class InjectionState:
     parent_state: Optional["InjectionState"] = None
     provider_registry: ProviderRegistry = attr.Factory(ProviderRegistry)
     state_by_module: Dict[AbstractModule, "InjectionState"] = attr.Factory(dict)
+    env_vars: Mapping[str, str] = os.environ
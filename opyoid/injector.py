@@ -1,12 +1,20 @@
-from typing import Any, List, Optional, Type, TypeVar, Union
+import os
+from functools import wraps
+from types import MethodType
+from typing import Any, Callable, cast, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from .bindings import Binding
 from .bindings.abstract_module import AbstractModule
 from .bindings.root_module import RootModule
+from .bindings.self_binding.callable_to_provider_adapter import CallableToProviderAdapter
+from .frozen_target import FrozenTarget
+from .injected_callable import InjectedCallable
 from .injection_context import InjectionContext
 from .injection_state import InjectionState
 from .injector_options import InjectorOptions
+from .provider import Provider
 from .providers import ProviderCreator
+from .scopes import ImmediateScope
 from .target import Target
 from .utils import InjectedT
 
@@ -23,21 +31,156 @@ class Injector:
         bindings: Optional[List[Binding[Any]]] = None,
         options: Optional[InjectorOptions] = None,
     ) -> None:
-        root_module = RootModule(self, modules, bindings)
-        root_module.configure_once()
+        self._root_module = RootModule(self, modules, bindings)
+        self._root_module.configure_once()
         self._provider_creator = ProviderCreator()
+        options = options or InjectorOptions()
         self._root_state = InjectionState(
             self._provider_creator,
-            root_module.binding_registry,
-            options or InjectorOptions(),
+            self._root_module.binding_registry,
+            options,
+            env_vars=dict(os.environ) if options.snapshot_env_vars else os.environ,
         )
+        self._callable_adapter = CallableToProviderAdapter()
+        self._injected_callable_by_function: Dict[Callable[..., Any], InjectedCallable[Any]] = {}
+        self._member_providers_by_class: Dict[Type[Any], Tuple[Tuple[str, Provider[Any]], ...]] = {}
         # Prepare providers
-        for target in root_module.binding_registry.get_bindings_by_target():
-            injection_context: InjectionContext[Any] = InjectionContext(
-                Target(target.type, target.named), self._root_state
-            )
-            injection_context.get_provider()
+        for target in self._root_module.binding_registry.get_bindings_by_target():
+            self._prepare_provider(target)
 
     def inject(self, target_type: Union[Type[InjectedT], TypeVar, Any], *, named: Optional[str] = None) -> InjectedT:
+        provider: Provider[InjectedT] = self.get_provider(target_type, named=named)
+        return provider.get()
+
+    def inject_many(self, targets: Iterable[Union[Any, Tuple[Any, Optional[str]]]]) -> Tuple[Any, ...]:
+        """Injects several targets, given as types or (type, name) tuples, and returns the instances in the same order.
+
+        Each target is resolved as with get_provider, nothing is shared between them. All the providers are resolved
+        before creating any instance, so that no instance is created if a target cannot be injected.
+        """
+        with ImmediateScope.deferred_instantiation():
+            providers = [
+                (
+                    self.get_provider(target[0], named=target[1])
+                    if isinstance(target, tuple)
+                    else self.get_provider(target)
+                )
+                for target in targets
+            ]
+        return tuple(provider.get() for provider in providers)
+
+    def get_provider(
+        self, target_type: Union[Type[InjectedT], TypeVar, Any], *, named: Optional[str] = None
+    ) -> Provider[InjectedT]:
+        """Returns the scoped provider of a target, to inject it many times without resolving it again.
+
+        The provider is not updated when its bindings are overridden with register, get it again after registering.
+        """
         injection_context: InjectionContext[InjectedT] = InjectionContext(Target(target_type, named), self._root_state)
-        return injection_context.get_provider().get()
+        return injection_context.get_provider()
+
+    def call(self, function: Callable[..., InjectedT], *args: Any, **overrides: Any) -> InjectedT:
+        """Calls a function with its parameters injected, the given arguments override the injected parameters.
+
+        The parameters are resolved on the first call of each function, as for constructors. Parameters without a
+        binding or a default value must be given.
+        """
+        if isinstance(function, MethodType):
+            # Bound methods are cached by their function, so that their instances are not kept
+            return self.call(cast(Callable[..., InjectedT], function.__func__), function.__self__, *args, **overrides)
+        injected_callable: Optional[InjectedCallable[InjectedT]] = self._injected_callable_by_function.get(function)
+        if injected_callable is None:
+            injected_callable = self._get_injected_callable(function)
+        return injected_callable(*args, **overrides)
+
+    def injected(self, function: Callable[..., InjectedT]) -> Callable[..., InjectedT]:
+        """Decorator calling the function with its parameters injected, see call."""
+        self._get_injected_callable(function)
+
+        @wraps(function)
+        def injected_function(*args: Any, **overrides: Any) -> InjectedT:
+            return self.call(function, *args, **overrides)
+
+        return injected_function
+
+    def inject_members(self, instance: InjectedT) -> InjectedT:
+        """Sets the annotated members of an existing instance, and returns it.
+
+        Annotated members without a value in the class are injected as keyword only constructor parameters, they are
+        resolved once for each class.
+        """
+        instance_class = type(instance)
+        member_providers = self._member_providers_by_class.get(instance_class)
+        if member_providers is None:
+            injection_context: InjectionContext[Any] = InjectionContext(
+                Target(instance_class), self._root_state, current_class=instance_class
+            )
+            member_providers = self._member_providers_by_class.setdefault(
+                instance_class, self._callable_adapter.get_member_providers(instance_class, injection_context)
+            )
+        for member_name, provider in member_providers:
+            setattr(instance, member_name, provider.get())
+        return instance
+
+    def register(
+        self,
+        modules: Optional[List[Union[AbstractModule, Type[AbstractModule]]]] = None,
+        bindings: Optional[List[Binding[Any]]] = None,
+    ) -> None:
+        """Adds or overrides bindings after the injector creation.
+
+        Only the providers depending on the changed targets are created again, all other instances are kept.
+        This should not be called while other threads are injecting.
+        """
+        binding_registry = self._root_module.binding_registry
+        generation = binding_registry.generation
+        self._root_module.register(modules or [], bindings or [])
+        changed_targets = binding_registry.get_targets_registered_since(generation)
+        removed_targets = self._remove_dependent_providers(changed_targets)
+        self._injected_callable_by_function.clear()
+        self._member_providers_by_class.clear()
+        # Prepared in registration order, as in __init__
+        for target in binding_registry.get_bindings_by_target():
+            if target in removed_targets:
+                self._prepare_provider(target)
+
+    def _get_injected_callable(self, function: Callable[..., InjectedT]) -> InjectedCallable[InjectedT]:
+        injected_callable = self._injected_callable_by_function.get(function)
+        if injected_callable is None:
+            injection_context: InjectionContext[InjectedT] = InjectionContext(
+                Target(function), self._root_state, current_class=cast(Type[InjectedT], function)
+            )
+            injected_callable = self._injected_callable_by_function.setdefault(
+                function, self._callable_adapter.create_injected_callable(function, injection_context)
+            )
+        return injected_callable
+
+    def _prepare_provider(self, target: FrozenTarget[Any]) -> None:
+        injection_context: InjectionContext[Any] = InjectionContext(Target(target.type, target.named), self._root_state)
+        injection_context.get_provider()
+
+    def _remove_dependent_providers(self, changed_targets: List[FrozenTarget[Any]]) -> Set[FrozenTarget[Any]]:
+        """Removes the providers of the changed targets and of all targets depending on them, in all states."""
+        states = list(self._get_states(self._root_state))
+        removed_targets = set(changed_targets)
+        for target in changed_targets:
+            if isinstance(target.type, type):
+                # Forward references are registered with the class name
+                removed_targets.add(FrozenTarget(target.type.__name__, target.named))
+        targets_to_visit = set(removed_targets)
+        while targets_to_visit:
+            dependents: Set[FrozenTarget[Any]] = set()
+            for state in states:
+                dependents.update(state.provider_registry.get_transitive_dependents(targets_to_visit))
+            targets_to_visit = dependents - removed_targets
+            removed_targets.update(targets_to_visit)
+        for state in states:
+            for target in removed_targets:
+                state.provider_registry.remove_provider(target)
+        return removed_targets
+
+    @classmethod
+    def _get_states(cls, state: InjectionState) -> Iterator[InjectionState]:
+        yield state
+        for child_state in state.state_by_module.values():
+            yield from cls._get_states(child_state)
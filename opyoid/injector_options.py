@@ -1,12 +1,23 @@
+from typing import List, TYPE_CHECKING
+
 import attr
 
+if TYPE_CHECKING:
+    from .config_sources import ConfigSource
+
 
 @attr.s(auto_attribs=True, kw_only=True)
 class InjectorOptions:
     """
     :param auto_bindings: if True, missing bindings will be generated when needed instead of raising an Exception
     :param use_env_vars: if True, environment variables will be loaded to override bindings for built_in types
+    :param snapshot_env_vars: if True, environment variables are read once when creating the injector, later changes
+        are ignored
+    :param config_sources: parameters of built-in and collection types are read from the first source having a value,
+        after environment variables
     """
 
     auto_bindings: bool = False
     use_env_vars: bool = True
+    snapshot_env_vars: bool = False
+    config_sources: List["ConfigSource"] = attr.Factory(list)
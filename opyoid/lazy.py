@@ -0,0 +1,28 @@
+from threading import Lock
+from typing import Callable, cast, Generic, Union
+
+from opyoid.provider import Provider
+from opyoid.utils import EMPTY, InjectedT
+
+
+class Lazy(Generic[InjectedT]):
+    """Injected as Lazy[<type>], resolves the provider of the type and creates the instance on the first call to get.
+
+    The instance is then returned by all the following calls.
+    """
+
+    def __init__(self, provider_getter: Callable[[], Provider[InjectedT]]) -> None:
+        self._provider_getter = provider_getter
+        self._instance: Union[InjectedT, object] = EMPTY
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        state = "created" if self._instance is not EMPTY else "not created"
+        return f"{self.__class__.__name__}({state})"
+
+    def get(self) -> InjectedT:
+        if self._instance is EMPTY:
+            with self._lock:
+                if self._instance is EMPTY:
+                    self._instance = self._provider_getter().get()
+        return cast(InjectedT, self._instance)
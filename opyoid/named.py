@@ -1,7 +1,8 @@
 from inspect import Parameter, Signature, signature
-from typing import Callable, cast, Generic, Mapping, Type, TypeVar, Union
+from typing import Any, Callable, cast, ClassVar, Dict, Generic, Mapping, Tuple, Type, TypeVar, Union
 
 from opyoid.exceptions import NamedError
+from opyoid.type_hint_key import get_type_hint_key
 
 WrappedT = TypeVar("WrappedT")
 
@@ -9,9 +10,23 @@ WrappedT = TypeVar("WrappedT")
 class Named(Generic[WrappedT]):
     name: str
     original_type: Type[WrappedT]
+    _named_class_by_key: ClassVar[Dict[Tuple[type, Any, str], type]] = {}
 
     @classmethod
     def get_named_class(cls, original_type: Union[Type[WrappedT], str], name: str) -> Type["Named[WrappedT]"]:
+        """Returns the Named class of original_type and name, the same class is returned for the same arguments."""
+        key = (cls, get_type_hint_key(original_type), name)
+        try:
+            named_class = cls._named_class_by_key.get(key)
+        except TypeError:
+            # Unhashable annotations cannot be cached
+            return cls._create_named_class(original_type, name)
+        if named_class is None:
+            named_class = cls._named_class_by_key.setdefault(key, cls._create_named_class(original_type, name))
+        return cast(Type[Named[WrappedT]], named_class)
+
+    @classmethod
+    def _create_named_class(cls, original_type: Union[Type[WrappedT], str], name: str) -> Type["Named[WrappedT]"]:
         return cast(
             Type[Named[WrappedT]],
             type(
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .exceptions import InjectException, NonInjectableTypeError
 from .frozen_target import FrozenTarget
@@ -8,18 +8,29 @@ from .utils import InjectedT
 
 
 class ProviderRegistry:
-    """Stores Providers for each Target to create a cache."""
+    """Stores Providers for each Target to create a cache.
+
+    Targets without any binding are also stored, with the binding registries generation at the time of the lookup, so
+    that repeated misses do not go through all provider factories again.
+
+    The targets looked up while creating each provider are recorded as dependency edges in both directions, so that the
+    providers depending on a target can be found and removed when its binding changes.
+    """
 
     def __init__(self) -> None:
         self._provider_by_target: Dict[FrozenTarget[Any], List[Tuple[Any, Provider[Any]]]] = {}
+        self._missing_bindings: Dict[FrozenTarget[Any], Dict[bool, Tuple[int, str]]] = {}
+        self._dependencies_by_target: Dict[FrozenTarget[Any], Set[FrozenTarget[Any]]] = {}
+        self._dependents_by_target: Dict[FrozenTarget[Any], Set[FrozenTarget[Any]]] = {}
 
     def __contains__(self, item: Target[Any]) -> bool:
         return self.get_provider(item) is not None
 
     def set_provider(self, target: Target[InjectedT], provider: Provider[InjectedT]) -> None:
         if isinstance(target.type, str):
-            raise InjectException()
+            raise InjectException(f"Cannot set a provider for {target!r}, its forward reference was not resolved")
         frozen_target = FrozenTarget(target.type, target.named)
+        self._missing_bindings.pop(frozen_target, None)
         if frozen_target not in self._provider_by_target:
             self._provider_by_target[frozen_target] = []
         for index, (cache_key, _existing_provider) in enumerate(self._provider_by_target[frozen_target]):
@@ -28,12 +39,51 @@ class ProviderRegistry:
                 return
         self._provider_by_target[frozen_target].append((target.provider_cache_key, provider))
 
+    def remove_provider(self, target: FrozenTarget[Any]) -> None:
+        """Removes the providers of this target for all cache keys, and the dependencies they looked up."""
+        self._provider_by_target.pop(target, None)
+        for dependency in self._dependencies_by_target.pop(target, set()):
+            dependents = self._dependents_by_target[dependency]
+            dependents.discard(target)
+            if not dependents:
+                del self._dependents_by_target[dependency]
+
+    def add_dependency(self, target: Target[Any], dependency: Target[Any]) -> None:
+        """Records that the provider of target looked up the dependency target."""
+        if isinstance(target.type, str) or isinstance(dependency.type, str):
+            # Forward references that could not be resolved to a type have no provider
+            return
+        frozen_target = FrozenTarget(target.type, target.named)
+        frozen_dependency = FrozenTarget(dependency.type, dependency.named)
+        self._dependencies_by_target.setdefault(frozen_target, set()).add(frozen_dependency)
+        self._dependents_by_target.setdefault(frozen_dependency, set()).add(frozen_target)
+
+    def get_dependencies(self, target: FrozenTarget[Any]) -> Set[FrozenTarget[Any]]:
+        """Returns the targets looked up by the provider of this target."""
+        return set(self._dependencies_by_target.get(target, ()))
+
+    def get_dependents(self, target: FrozenTarget[Any]) -> Set[FrozenTarget[Any]]:
+        """Returns the targets whose provider looked up this target."""
+        return set(self._dependents_by_target.get(target, ()))
+
+    def get_transitive_dependents(self, targets: Iterable[FrozenTarget[Any]]) -> Set[FrozenTarget[Any]]:
+        """Returns the targets depending directly or indirectly on any of these targets, visiting only these ones."""
+        dependents: Set[FrozenTarget[Any]] = set()
+        targets_to_visit = list(targets)
+        while targets_to_visit:
+            for dependent in self._dependents_by_target.get(targets_to_visit.pop(), ()):
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    targets_to_visit.append(dependent)
+        return dependents
+
     def get_provider(self, target: Target[InjectedT]) -> Optional[Provider[InjectedT]]:
         if isinstance(target.type, str):
             possible_target_types = list(
                 set(
                     available_target.type
-                    for available_target in self._provider_by_target
+                    # Copied as other threads can add providers while iterating
+                    for available_target in list(self._provider_by_target)
                     if isinstance(available_target.type, type) and available_target.type.__name__ == target.type
                 )
             )
@@ -54,3 +104,24 @@ class ProviderRegistry:
             if cache_key == target.provider_cache_key:
                 return provider
         return None
+
+    def set_missing_binding(
+        self, target: Target[Any], allow_jit_provider: bool, generation: int, error_message: str
+    ) -> None:
+        """Remembers that no provider could be created for this target at this binding registries generation."""
+        if isinstance(target.type, str):
+            return
+        frozen_target = FrozenTarget(target.type, target.named)
+        self._missing_bindings.setdefault(frozen_target, {})[allow_jit_provider] = (generation, error_message)
+
+    def get_missing_binding(self, target: Target[Any], allow_jit_provider: bool, generation: int) -> Optional[str]:
+        """Returns the error message of a previous miss for this target if no binding was registered since."""
+        if isinstance(target.type, str):
+            return None
+        missing_bindings = self._missing_bindings.get(FrozenTarget(target.type, target.named))
+        if missing_bindings is None or allow_jit_provider not in missing_bindings:
+            return None
+        missing_generation, error_message = missing_bindings[allow_jit_provider]
+        if missing_generation != generation:
+            return None
+        return error_message
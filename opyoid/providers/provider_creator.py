@@ -1,18 +1,26 @@
 import logging
 from threading import RLock
-from typing import List
+from typing import List, Optional
 
 from opyoid.exceptions import IncompatibleProviderFactory, NoBindingFound
 from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
 from opyoid.provider import Provider
-from opyoid.utils import InjectedT
+from opyoid.scopes import ImmediateScope
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import EMPTY, InjectedT
 from .providers_factories import (
+    AssistedFactoryProviderFactory,
     FromBindingProviderFactory,
     FromCacheProviderFactory,
+    FromConfigSourceProviderFactory,
     FromEnvVarProviderFactory,
+    IterableProviderFactory,
     JitProviderFactory,
+    LazyProviderFactory,
     ListFromItemsProviderFactory,
-    ListProviderFactory,
+    MissingBindingProvider,
+    MappingProviderFactory,
     ProviderFactory,
     ProviderProviderFactory,
     SetProviderFactory,
@@ -23,36 +31,124 @@ from .providers_factories import (
 
 
 class ProviderCreator:
-    """Creates Providers and saves them in the ProviderRegistry."""
+    """Creates Providers and saves them in the ProviderRegistry.
+
+    :param missing_binding_provider_factory: if set, used when no other provider factory could create a provider
+    """
 
     logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
+    def __init__(self, missing_binding_provider_factory: Optional[ProviderFactory] = None) -> None:
         self._provider_factories: List[ProviderFactory] = [
             FromCacheProviderFactory(),
-            FromEnvVarProviderFactory(),
             FromBindingProviderFactory(),
-            ListProviderFactory(),
             ListFromItemsProviderFactory(),
             SetProviderFactory(),
             TupleProviderFactory(),
+            IterableProviderFactory(),
+            MappingProviderFactory(),
             UnionProviderFactory(),
             TypeProviderFactory(),
+            LazyProviderFactory(),
+            AssistedFactoryProviderFactory(),
             ProviderProviderFactory(),
             JitProviderFactory(),
         ]
+        # Parameter values depend on the class of the parameter, which is not part of the target, so their providers
+        # are looked up before the cache and never cached
+        self._parameter_value_provider_factories: List[ProviderFactory] = [
+            FromEnvVarProviderFactory(),
+            FromConfigSourceProviderFactory(),
+        ]
+        self._missing_binding_provider_factory = missing_binding_provider_factory
         self._lock = RLock()
 
     def get_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        # The lock only protects the resolution of the graph, instances are created after it is released
+        with ImmediateScope.deferred_instantiation():
+            try:
+                provider = self._get_parameter_value_provider(context)
+                if provider is None:
+                    provider = self._get_cached_or_new_provider(context)
+            finally:
+                if context.parent_context is not None:
+                    context.parent_context.injection_state.provider_registry.add_dependency(
+                        context.parent_context.target, context.target
+                    )
+            return provider
+
+    def _get_cached_or_new_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        provider_registry = context.injection_state.provider_registry
+        provider = provider_registry.get_provider(context.target)
+        if provider is not None:
+            return provider
+        # Cached providers are returned without locking, the cache is checked again by the first provider factory
         with self._lock:
             provider = self._get_provider(context)
-            context.injection_state.provider_registry.set_provider(context.target, provider)
-            return provider
+            # Placeholders of missing bindings and forward references they leave unresolved when checking the graph
+            # are not stored, so that each parameter requiring them is reported
+            if not isinstance(context.target.type, str) and not isinstance(provider, MissingBindingProvider):
+                provider_registry.set_provider(context.target, provider)
+        return provider
+
+    def _get_parameter_value_provider(self, context: InjectionContext[InjectedT]) -> Optional[Provider[InjectedT]]:
+        if context.current_parameter is None:
+            return None
+        for provider_factory in self._parameter_value_provider_factories:
+            try:
+                return provider_factory.create(context)
+            except IncompatibleProviderFactory:
+                pass
+        return None
 
     def _get_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        # Misses are not cached when checking the graph, they are reported for each parameter
+        if self._missing_binding_provider_factory is not None or not self._is_missing_binding_cacheable(context):
+            return self._create_provider(context)
+        provider_registry = context.injection_state.provider_registry
+        allow_jit_provider = context.allow_jit_provider and context.target.default is EMPTY
+        generation = self._get_generation(context.injection_state)
+        error_message = provider_registry.get_missing_binding(context.target, allow_jit_provider, generation)
+        if error_message is not None:
+            raise NoBindingFound(error_message)
+        try:
+            return self._create_provider(context)
+        except NoBindingFound as error:
+            provider_registry.set_missing_binding(context.target, allow_jit_provider, generation, str(error))
+            raise
+
+    @staticmethod
+    def _get_generation(injection_state: InjectionState) -> int:
+        """Bindings can also be found in the parent states, so a miss is only valid until any of them changes."""
+        generation = injection_state.binding_registry.generation
+        while injection_state.parent_state is not None:
+            injection_state = injection_state.parent_state
+            generation = max(generation, injection_state.binding_registry.generation)
+        return generation
+
+    @staticmethod
+    def _is_missing_binding_cacheable(context: InjectionContext[InjectedT]) -> bool:
+        """Misses can be cached unless they depend on a provider cache key or on environment variables."""
+        target = context.target
+        if target.provider_cache_key is not None or isinstance(target.type, str):
+            return False
+        return context.current_parameter is None or not (
+            target.type in FromEnvVarProviderFactory.supported_types or TypeChecker.is_union(target.type)
+        )
+
+    def _create_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
         for provider_factory in self._provider_factories:
             try:
                 return provider_factory.create(context)
             except IncompatibleProviderFactory:
                 pass
+            except NoBindingFound:
+                if self._missing_binding_provider_factory is None:
+                    raise
+                break
+        if self._missing_binding_provider_factory is not None:
+            try:
+                return self._missing_binding_provider_factory.create(context)
+            except IncompatibleProviderFactory:
+                pass
         raise NoBindingFound(f"Could not find any bindings for {context.target!r}")
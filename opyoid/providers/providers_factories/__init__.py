@@ -1,9 +1,15 @@
+from .assisted_factory_provider_factory import AssistedFactoryProviderFactory
 from .from_binding_provider_factory import FromBindingProviderFactory
 from .from_cache_provider_factory import FromCacheProviderFactory
+from .from_config_source_provider_factory import FromConfigSourceProviderFactory
 from .from_env_var_provider_factory import FromEnvVarProviderFactory
+from .iterable_provider_factory import IterableProviderFactory
 from .jit_provider_factory import JitProviderFactory
+from .lazy_items_provider_factory import LazyItemsProviderFactory
+from .lazy_provider_factory import LazyProvider, LazyProviderFactory
 from .list_from_items_provider_factory import ListFromItemsProviderFactory
-from .list_provider_factory import ListProviderFactory
+from .mapping_provider_factory import MappingProviderFactory
+from .missing_binding_provider_factory import MissingBindingProvider, MissingBindingProviderFactory
 from .provider_factory import ProviderFactory
 from .provider_provider_factory import ProviderProviderFactory
 from .set_provider_factory import SetProviderFactory
@@ -0,0 +1,54 @@
+from inspect import Parameter
+from typing import Any, cast, List, Tuple, Type
+
+from opyoid.assisted_factory import AssistedFactory
+from opyoid.bindings import FromInstanceProvider
+from opyoid.bindings.self_binding.callable_to_provider_adapter import CallableToProviderAdapter
+from opyoid.bindings.self_binding.init_parameters import InitParameters
+from opyoid.exceptions import IncompatibleProviderFactory, NonInjectableTypeError
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import get_class_full_name, InjectedT
+from .provider_factory import ProviderFactory
+
+
+class AssistedFactoryProviderFactory(ProviderFactory):
+    """Creates the AssistedFactory of a class, the providers of its injected parameters are resolved only once.
+
+    Parameters are looked up without just in time bindings, so that runtime parameters are never created by the
+    injector.
+    """
+
+    def __init__(self) -> None:
+        self._adapter = CallableToProviderAdapter()
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        if not TypeChecker.is_assisted_factory(context.target.type):
+            raise IncompatibleProviderFactory
+        injected_class = context.target.type.__args__[0]  # type: ignore[union-attr]
+        if not isinstance(injected_class, type):
+            raise NonInjectableTypeError(f"Could not create {context.target!r}: {injected_class!r} is not a class")
+        # Parameters are looked up as parameters of the injected class, e.g. for their environment variables
+        class_context = context.get_child_context(context.target, current_class=cast(Type[InjectedT], injected_class))
+        parameter_providers: List[Tuple[str, Provider[Any]]] = []
+        assisted_parameter_names = []
+        for parameter in InitParameters.get(injected_class):
+            if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+                continue
+            if parameter.kind == Parameter.POSITIONAL_ONLY:
+                raise NonInjectableTypeError(
+                    f"Could not create {context.target!r}: positional only parameter {parameter.name!r} required by"
+                    f" {get_class_full_name(injected_class)} cannot be given to a factory"
+                )
+            provider = self._adapter.get_bound_parameter_provider(parameter, class_context, allow_jit_provider=False)
+            if provider is not None:
+                parameter_providers.append((parameter.name, provider))
+            elif parameter.default is Parameter.empty:
+                assisted_parameter_names.append(parameter.name)
+        return FromInstanceProvider(
+            cast(
+                InjectedT,
+                AssistedFactory(injected_class, tuple(parameter_providers), frozenset(assisted_parameter_names)),
+            )
+        )
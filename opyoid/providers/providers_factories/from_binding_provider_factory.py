@@ -3,7 +3,6 @@ from typing import cast
 
 from opyoid.exceptions import IncompatibleProviderFactory
 from opyoid.injection_context import InjectionContext
-from opyoid.injection_state import InjectionState
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 from .from_registered_binding_provider_factory import FromRegisteredBindingProviderFactory
@@ -20,15 +19,15 @@ class FromBindingProviderFactory(ProviderFactory):
         self._from_registered_binding_provider_factory = FromRegisteredBindingProviderFactory()
 
     def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
-        parent_context = context
-        while not parent_context.has_binding():
-            parent_state = parent_context.injection_state.parent_state
-            if parent_state is None:
-                raise IncompatibleProviderFactory
-            parent_context = parent_context.get_new_state_context(parent_state)
+        if context.has_binding():
+            binding = cast(RegisteredBinding[InjectedT], context.get_binding())
+            return self._from_registered_binding_provider_factory.create(binding, context)
 
-        if not context.has_binding():
-            new_context = context.get_new_state_context(cast(InjectionState, context.injection_state.parent_state))
-            return new_context.get_provider()
-        binding = cast(RegisteredBinding[InjectedT], context.get_binding())
-        return self._from_registered_binding_provider_factory.create(binding, context)
+        parent_state = context.injection_state.parent_state
+        while parent_state is not None and context.target not in parent_state.binding_registry:
+            parent_state = parent_state.parent_state
+        if parent_state is None:
+            raise IncompatibleProviderFactory
+        # Created directly in the state of the binding, the states in between are not walked again
+        new_context = context.get_new_state_context(parent_state)
+        return new_context.get_provider()
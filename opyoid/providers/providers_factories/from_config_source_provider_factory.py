@@ -0,0 +1,78 @@
+from typing import Any, Dict, Iterable
+
+from opyoid.bindings import FromInstanceProvider
+from opyoid.exceptions import IncompatibleProviderFactory
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import InjectedT
+from .from_env_var_provider_factory import FromEnvVarProviderFactory
+from .provider_factory import ProviderFactory
+
+
+class FromConfigSourceProviderFactory(ProviderFactory):
+    """Creates a Provider from the first configuration source of the injector options having a value for the parameter.
+
+    Supported types are str, int, float, bool, and lists, sets, tuples and dicts of them. Strings are converted as
+    environment variables, other values must match the parameter type. Tuples with a type for each position must have
+    a value for each of them.
+    """
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        config_sources = context.injection_state.options.config_sources
+        if (
+            config_sources
+            and context.current_parameter is not None
+            and context.current_class is not None
+            and self._is_supported(context.target.type)
+        ):
+            name = FromEnvVarProviderFactory.get_env_var_name(
+                context.current_class.__name__, context.target.named or context.current_parameter.name
+            )
+            for config_source in config_sources:
+                values = config_source.get_values()
+                if name in values:
+                    return FromInstanceProvider(self._convert(name, values[name], context.target.type))
+        raise IncompatibleProviderFactory
+
+    def _is_supported(self, target_type: Any) -> bool:
+        if target_type in FromEnvVarProviderFactory.supported_types:
+            return True
+        if self._is_collection(target_type) or self._is_dict(target_type):
+            return all(self._is_supported(arg_type) for arg_type in target_type.__args__ if arg_type is not Ellipsis)
+        return False
+
+    def _convert(self, name: str, value: Any, target_type: Any) -> Any:
+        if self._is_collection(target_type):
+            if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+                raise ValueError(f"Could not convert {value!r} from {name} into {target_type}")
+            item_types = target_type.__args__
+            if TypeChecker.is_tuple(target_type) and item_types[-1] is not Ellipsis:
+                items = list(value)
+                if len(items) != len(item_types):
+                    raise ValueError(f"Could not convert {value!r} from {name} into {target_type}")
+                return tuple(self._convert(name, item, item_type) for item, item_type in zip(items, item_types))
+            return target_type.__origin__(self._convert(name, item, item_types[0]) for item in value)
+        if self._is_dict(target_type):
+            if not isinstance(value, dict):
+                raise ValueError(f"Could not convert {value!r} from {name} into {target_type}")
+            key_type, value_type = target_type.__args__
+            converted_dict: Dict[Any, Any] = {
+                self._convert(name, key, key_type): self._convert(name, item, value_type) for key, item in value.items()
+            }
+            return converted_dict
+        if isinstance(value, str):
+            return FromEnvVarProviderFactory.convert_value(name, value, target_type)
+        if target_type is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        if type(value) is not target_type:  # pylint: disable=unidiomatic-typecheck
+            raise ValueError(f"Could not convert {value!r} from {name} into {target_type.__name__}")
+        return value
+
+    @staticmethod
+    def _is_collection(target_type: Any) -> bool:
+        return TypeChecker.is_list(target_type) or TypeChecker.is_set(target_type) or TypeChecker.is_tuple(target_type)
+
+    @staticmethod
+    def _is_dict(target_type: Any) -> bool:
+        return getattr(target_type, "__origin__", None) is dict
@@ -1,7 +1,7 @@
 import logging
-import os
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, cast, Optional
 
 from opyoid.bindings import FromInstanceProvider
 from opyoid.exceptions import IncompatibleProviderFactory
@@ -10,47 +10,60 @@ from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 from .provider_factory import ProviderFactory
 
+_WORD_BOUNDARY_PATTERN = re.compile(r"([A-Z])([A-Z][a-z])|([a-z])([A-Z])|(\d)([A-Za-z])|([A-Za-z])(\d)")
+
+
+def _to_upper_case(string: str) -> str:
+    return _WORD_BOUNDARY_PATTERN.sub(r"\1\3\5\7_\2\4\6\8", string).upper()
+
 
 class FromEnvVarProviderFactory(ProviderFactory):
-    """Creates a Provider from an environment variable."""
+    """Creates a Provider from an environment variable.
+
+    Environment variables are read from the injection state, either os.environ or a snapshot taken when creating the
+    injector. Variable names and converted values are memoized, as the same parameters are looked up for each class.
+    """
 
     logger = logging.getLogger(__name__)
+    supported_types = (str, int, float, bool)
 
     def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
         if (
             context.injection_state.options.use_env_vars
             and context.current_parameter is not None
             and context.current_class is not None
-            and context.target.type in (str, int, float, bool)
+            and context.target.type in self.supported_types
         ):
             env_var_name = self._get_matching_env_var_name(context)
             if env_var_name is not None:
-                converted_value = self._get_converted_value(env_var_name, context)
+                # Only supported types reach this point, they can be used as cache keys
+                converted_value = self.convert_value(
+                    env_var_name, context.injection_state.env_vars[env_var_name], cast(type, context.target.type)
+                )
                 return FromInstanceProvider(converted_value)
         raise IncompatibleProviderFactory
 
     def _get_matching_env_var_name(self, context: InjectionContext[InjectedT]) -> Optional[str]:
-        expected_env_var = (
-            f"{self._to_upper_case(context.current_class.__name__)}_"  # type: ignore[union-attr]
-            f"{self._to_upper_case(context.target.named or context.current_parameter.name)}"  # type: ignore[union-attr]
+        expected_env_var = self.get_env_var_name(
+            context.current_class.__name__,  # type: ignore[union-attr]
+            context.target.named or context.current_parameter.name,  # type: ignore[union-attr]
         )
-        return expected_env_var if expected_env_var in os.environ else None
+        return expected_env_var if expected_env_var in context.injection_state.env_vars else None
 
     @staticmethod
-    def _to_upper_case(string: str) -> str:
-        return re.sub(
-            r"([A-Z])([A-Z][a-z])|([a-z])([A-Z])|(\d)([A-Za-z])|([A-Za-z])(\d)",
-            r"\1\3\5\7_\2\4\6\8",
-            string,
-        ).upper()
+    @lru_cache(maxsize=None)
+    def get_env_var_name(class_name: str, parameter_name: str) -> str:
+        """Returns the environment variable name of a parameter, e.g. MY_CLASS_MY_PARAM for MyClass and myParam."""
+        return f"{_to_upper_case(class_name)}_{_to_upper_case(parameter_name)}"
 
     @staticmethod
-    def _get_converted_value(env_var_name: str, context: InjectionContext[InjectedT]) -> Any:
-        value: str = os.environ[env_var_name]
-        if context.target.type == bool:
+    @lru_cache(maxsize=1024)
+    def convert_value(env_var_name: str, value: str, target_type: type) -> Any:
+        """Converts a string to one of the supported types, booleans are read from true/false/1/0."""
+        if target_type == bool:
             if value.lower() in ["true", "false", "0"]:
                 return value.lower() == "true"
             if value == "1":
                 return True
             raise ValueError(f"Could not coerce {value} from environment variable {env_var_name} into a boolean")
-        return context.target.type(value)  # type: ignore[operator]
+        return target_type(value)
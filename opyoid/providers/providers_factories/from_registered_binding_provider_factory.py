@@ -5,6 +5,7 @@ from opyoid.bindings import (
     BindingToProviderAdapter,
     ClassBindingToProviderAdapter,
     InstanceBindingToProviderAdapter,
+    MapBindingToProviderAdapter,
     MultiBindingToProviderAdapter,
     ProviderBindingToProviderAdapter,
     SelfBindingToProviderAdapter,
@@ -29,6 +30,7 @@ class FromRegisteredBindingProviderFactory:
             ClassBindingToProviderAdapter(),
             ProviderBindingToProviderAdapter(),
             MultiBindingToProviderAdapter(self),
+            MapBindingToProviderAdapter(self),
         ]
 
     def create(
@@ -41,11 +43,16 @@ class FromRegisteredBindingProviderFactory:
         while module_path:
             state = context.injection_state
             if module_path[0] not in state.state_by_module:
-                state.state_by_module[module_path[0]] = InjectionState(
-                    state.provider_creator,
-                    module_path[0].binding_registry,
-                    state.options,
-                    state,
+                # Two threads can create the state of the same module, only the first one is kept
+                state.state_by_module.setdefault(
+                    module_path[0],
+                    InjectionState(
+                        state.provider_creator,
+                        module_path[0].binding_registry,
+                        state.options,
+                        state,
+                        env_vars=state.env_vars,
+                    ),
                 )
             context = context.get_new_state_context(state.state_by_module[module_path[0]])
             module_path = module_path[1:]
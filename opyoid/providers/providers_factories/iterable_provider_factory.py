@@ -0,0 +1,18 @@
+from typing import Any, List
+
+from opyoid.bindings import LazyIterableProvider, ListProvider
+from opyoid.exceptions import IncompatibleProviderFactory
+from opyoid.type_checker import TypeChecker
+from .lazy_items_provider_factory import LazyItemsProviderFactory
+
+
+class IterableProviderFactory(LazyItemsProviderFactory):
+    """Creates a Provider of lazy iterables, the items are only created when iterating."""
+
+    items_provider_type = ListProvider
+    lazy_provider_type = LazyIterableProvider
+
+    def _get_collection_type(self, target_type: Any) -> Any:
+        if not TypeChecker.is_iterable(target_type):
+            raise IncompatibleProviderFactory
+        return List[target_type.__args__[0]]  # type: ignore[name-defined]
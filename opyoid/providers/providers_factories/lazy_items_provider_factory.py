@@ -0,0 +1,34 @@
+from typing import Any, Callable, Type
+
+from opyoid.bindings import ProviderCacheKey
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.utils import InjectedT
+from .provider_factory import ProviderFactory
+
+
+class LazyItemsProviderFactory(ProviderFactory):
+    """Base class of the factories of lazy collections, created from the item providers of a collection binding.
+
+    The unscoped collection provider is requested with ProviderCacheKey.ITEM_PROVIDERS to access the item providers, if
+    the collection is not created from item providers (e.g. bound to an instance), the collection itself is injected.
+    """
+
+    items_provider_type: Type[Provider[Any]]
+    lazy_provider_type: Callable[[Any], Provider[Any]]
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        new_target: Target[Any] = Target(
+            self._get_collection_type(context.target.type),
+            context.target.named,
+            provider_cache_key=ProviderCacheKey.ITEM_PROVIDERS,
+        )
+        collection_provider: Provider[Any] = context.get_child_context(new_target).get_provider()
+        if isinstance(collection_provider, self.items_provider_type):
+            return self.lazy_provider_type(collection_provider)
+        return collection_provider
+
+    def _get_collection_type(self, target_type: Any) -> Any:
+        """Returns the type of the collection binding or raises IncompatibleProviderFactory."""
+        raise NotImplementedError
@@ -0,0 +1,56 @@
+from typing import Any, ForwardRef, Optional
+
+from opyoid.exceptions import IncompatibleProviderFactory, NoBindingFound
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.lazy import Lazy
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import InjectedT
+from .provider_factory import ProviderFactory
+
+
+class LazyProvider(Provider[Lazy[InjectedT]]):
+    """Provides Lazy instances, the provider of the wrapped type is only resolved by their first get."""
+
+    def __init__(self, target: Target[InjectedT], injection_state: InjectionState) -> None:
+        self._target = target
+        self._injection_state = injection_state
+
+    def get(self) -> Lazy[InjectedT]:
+        return Lazy(self._get_provider)
+
+    def _get_provider(self) -> Provider[InjectedT]:
+        # Resolved without the parent contexts, as the instance is not needed to create its dependents
+        context = InjectionContext(Target(self._target.type, self._target.named), self._injection_state)
+        return context.get_provider()
+
+
+class LazyProviderFactory(ProviderFactory):
+    """Creates a Provider of Lazy instances, without resolving the provider of the wrapped type.
+
+    Lookups that are not the last option of a parameter (e.g. the named lookup before the unnamed one) need an explicit
+    binding of the wrapped type, otherwise the unnamed binding would never be used.
+    """
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        if not TypeChecker.is_lazy(context.target.type):
+            raise IncompatibleProviderFactory
+        wrapped_type = context.target.type.__args__[0]  # type: ignore[union-attr]
+        if isinstance(wrapped_type, ForwardRef):
+            # Lazy is used to break cycles, the wrapped class is often defined after the class using it
+            wrapped_type = wrapped_type.__forward_arg__
+        new_target: Target[Any] = Target(wrapped_type, context.target.named)
+        if not context.allow_jit_provider and not self._has_binding(new_target, context.injection_state):
+            raise NoBindingFound(f"Could not find any bindings for {new_target!r}")
+        context.injection_state.provider_registry.add_dependency(context.target, new_target)
+        return LazyProvider(new_target, context.injection_state)  # type: ignore[return-value]
+
+    @staticmethod
+    def _has_binding(target: Target[Any], injection_state: Optional[InjectionState]) -> bool:
+        while injection_state is not None:
+            if target in injection_state.binding_registry:
+                return True
+            injection_state = injection_state.parent_state
+        return False
@@ -0,0 +1,49 @@
+from typing import Any, Callable, cast, List, Optional, Type
+
+from opyoid.bindings import FromCallableProvider, MultiBinding
+from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.provider import Provider
+from opyoid.scopes import Scope
+from opyoid.target import Target
+from opyoid.utils import InjectedT
+from .provider_factory import ProviderFactory
+
+
+class ListConversionProviderFactory(ProviderFactory):
+    """Base class for the factories of Providers converting the list of the target items to another collection.
+
+    When the list comes from a multi binding, the converted collection has the same scope as the multi binding.
+    """
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        raise NotImplementedError
+
+    @classmethod
+    def _create_conversion_provider(
+        cls, context: InjectionContext[InjectedT], collection_type: Callable[..., InjectedT]
+    ) -> Provider[InjectedT]:
+        list_target: Target[List[Any]] = Target(
+            List[context.target.type.__args__[0]],  # type: ignore[name-defined, union-attr]
+            context.target.named,
+        )
+        list_provider = context.get_child_context(list_target).get_provider()
+        unscoped_provider = FromCallableProvider(collection_type, [list_provider], None, {})
+        scope = cls._get_multi_binding_scope(context, list_target)
+        if scope is None:
+            return unscoped_provider
+        scope_context: InjectionContext[Scope] = context.get_child_context(Target(scope))
+        return scope_context.get_provider().get().get_scoped_provider(unscoped_provider)
+
+    @staticmethod
+    def _get_multi_binding_scope(context: InjectionContext[Any], list_target: Target[Any]) -> Optional[Type[Scope]]:
+        state: Optional[InjectionState] = context.injection_state
+        while state is not None:
+            binding = state.binding_registry.get_binding(list_target)
+            if binding is not None:
+                if isinstance(binding, RegisteredMultiBinding):
+                    return cast(MultiBinding[Any], binding.raw_binding).scope
+                return None
+            state = state.parent_state
+        return None
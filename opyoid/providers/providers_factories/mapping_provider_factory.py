@@ -0,0 +1,19 @@
+from typing import Any, Dict
+
+from opyoid.bindings import DictProvider, LazyMappingProvider
+from opyoid.exceptions import IncompatibleProviderFactory
+from opyoid.type_checker import TypeChecker
+from .lazy_items_provider_factory import LazyItemsProviderFactory
+
+
+class MappingProviderFactory(LazyItemsProviderFactory):
+    """Creates a Provider of lazy mappings, each value is only created when its key is first accessed."""
+
+    items_provider_type = DictProvider
+    lazy_provider_type = LazyMappingProvider
+
+    def _get_collection_type(self, target_type: Any) -> Any:
+        if not TypeChecker.is_mapping(target_type):
+            raise IncompatibleProviderFactory
+        key_type, value_type = target_type.__args__
+        return Dict[key_type, value_type]  # type: ignore[valid-type]
@@ -0,0 +1,56 @@
+from inspect import Parameter
+from typing import Any, cast, List
+
+from opyoid.exceptions import IncompatibleProviderFactory, NoBindingFound
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.utils import EMPTY, get_class_full_name, InjectedT
+from .provider_factory import ProviderFactory
+
+
+class MissingBindingProvider(Provider[InjectedT]):
+    """Placeholder for a target without binding, raises an error if used."""
+
+    def __init__(self, error_message: str) -> None:
+        self.error_message = error_message
+
+    def get(self) -> InjectedT:
+        raise NoBindingFound(self.error_message)
+
+
+class MissingBindingProviderFactory(ProviderFactory):
+    """Records the parameters that cannot be injected and returns a placeholder so that the resolution can continue.
+
+    Only used when checking an injection graph, after all other provider factories failed. Parameters with a default
+    value and alternative lookups (named parameters, Union items, List items) are not recorded as they are allowed to
+    fail.
+    """
+
+    def __init__(self) -> None:
+        self.missing_targets: List[Target[Any]] = []
+        self.error_messages: List[str] = []
+
+    def create(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+        if not self._is_required_parameter(context):
+            raise IncompatibleProviderFactory
+        if context.current_class is not None:
+            required_by = get_class_full_name(context.current_class)
+        else:
+            required_by = repr(cast(InjectionContext[Any], context.parent_context).target)
+        parameter = cast(Parameter, context.current_parameter)
+        error_message = f"Could not find a binding for {parameter.name}: {context.target!r} required by {required_by}"
+        self.missing_targets.append(context.target)
+        self.error_messages.append(error_message)
+        return MissingBindingProvider(error_message)
+
+    @staticmethod
+    def _is_required_parameter(context: InjectionContext[Any]) -> bool:
+        parent_context = context.parent_context
+        return (
+            context.allow_jit_provider
+            and context.target.default is EMPTY
+            and context.current_parameter is not None
+            and parent_context is not None
+            and parent_context.current_parameter is not context.current_parameter
+        )
@@ -1,23 +1,30 @@
-from typing import cast
+from threading import Lock
+from typing import cast, Union
 
 from opyoid.provider import Provider
 from opyoid.utils import EMPTY, InjectedT
 
 
 class ContextScopedProvider(Provider[InjectedT]):
-    """Always provides the same instance in the same context, a new instance in each context."""
+    """Always provides the same instance in the same context, a new instance in each context.
+
+    The instance can be requested from several threads in the same context, e.g. by parallel multi binding items.
+    """
 
     def __init__(self, unscoped_provider: Provider[InjectedT]):
         self._unscoped_provider = unscoped_provider
-        self._cached_instance = EMPTY
+        self._cached_instance: Union[InjectedT, object] = EMPTY
         self._is_scope_activated = False
+        self._lock = Lock()
 
     def get(self) -> InjectedT:
         if not self._is_scope_activated:
             return self._unscoped_provider.get()
 
         if self._cached_instance is EMPTY:
-            self._cached_instance = self._unscoped_provider.get()
+            with self._lock:
+                if self._cached_instance is EMPTY:
+                    self._cached_instance = self._unscoped_provider.get()
 
         return cast(InjectedT, self._cached_instance)
 
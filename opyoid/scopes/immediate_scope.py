@@ -1,12 +1,42 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 from .singleton_scope import SingletonScope
 
 
 class ImmediateScope(SingletonScope):
-    """Always provides the same instance, objects are instantiated immediately."""
+    """Always provides the same instance, objects are instantiated immediately.
+
+    While providers are being resolved, instantiation is deferred until the outermost resolution is done, so that
+    constructors are not called while the resolution lock is held.
+    """
+
+    _local = threading.local()
 
     def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
         provider = SingletonScope.get_scoped_provider(self, inner_provider)
-        provider.get()
+        pending_providers = getattr(self._local, "pending_providers", None)
+        if pending_providers is None:
+            provider.get()
+        else:
+            pending_providers.append(provider)
         return provider
+
+    @classmethod
+    @contextmanager
+    def deferred_instantiation(cls) -> Iterator[None]:
+        """Providers scoped in this context are instantiated when leaving the outermost one, in the same thread."""
+        if getattr(cls._local, "pending_providers", None) is not None:
+            yield
+            return
+        pending_providers: List[Provider[object]] = []
+        cls._local.pending_providers = pending_providers
+        try:
+            yield
+        finally:
+            cls._local.pending_providers = None
+        for provider in pending_providers:
+            provider.get()
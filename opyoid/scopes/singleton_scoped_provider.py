@@ -14,6 +14,8 @@ class SingletonScopedProvider(Provider[InjectedT]):
         self._lock = Lock()
 
     def get(self) -> InjectedT:
+        if self._cached_instance is not EMPTY:
+            return cast(InjectedT, self._cached_instance)
         with self._lock:
             if self._cached_instance is EMPTY:
                 injected_instance = self._inner_provider.get()
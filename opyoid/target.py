@@ -2,14 +2,20 @@ from typing import Any, Generic, Optional, Type, TypeVar, Union
 
 import attr
 
+from opyoid.type_checker import TypeChecker
 from opyoid.utils import EMPTY, get_class_full_name, InjectedT
 
 
+def _normalize(target_type: Union[Type[InjectedT], TypeVar, str, Any]) -> Union[Type[InjectedT], TypeVar, str, Any]:
+    """Named function converter so that mypy keeps the type of the field."""
+    return TypeChecker.normalize(target_type)  # type: ignore[no-any-return]
+
+
 @attr.s(auto_attribs=True, repr=False)
 class Target(Generic[InjectedT]):
     """Identifies a class being injected."""
 
-    type: Union[Type[InjectedT], TypeVar, str, Any]
+    type: Union[Type[InjectedT], TypeVar, str, Any] = attr.ib(converter=_normalize)
     named: Optional[str] = None
     default: Union[InjectedT, object] = attr.ib(default=EMPTY, eq=False)
     provider_cache_key: Optional[Any] = None
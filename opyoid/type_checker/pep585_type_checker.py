@@ -1,25 +1,80 @@
+import collections.abc
+from functools import lru_cache
 from types import GenericAlias
 
 # noinspection PyProtectedMember
-from typing import _GenericAlias, Any, Union  # type: ignore[attr-defined]
+from typing import (  # type: ignore[attr-defined]
+    _GenericAlias,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
+from opyoid.assisted_factory import AssistedFactory
+from opyoid.lazy import Lazy
 from opyoid.named import Named
 from opyoid.provider import Provider
+from opyoid.type_hint_key import get_type_hint_key
+
+
+_TYPING_ALIAS_BY_ORIGIN: Dict[Any, Any] = {
+    list: List,
+    set: Set,
+    frozenset: FrozenSet,
+    tuple: Tuple,
+    dict: Dict,
+    type: Type,
+    collections.abc.Iterable: Iterable,
+    collections.abc.Mapping: Mapping,
+    collections.abc.Sequence: Sequence,
+}
 
 
 class Pep585TypeChecker:
     """Various helpers to check type hints."""
 
+    @classmethod
+    def normalize(cls, target_type: Any) -> Any:
+        """Returns the canonical form of target_type, so that equivalent type hints are equal.
+
+        Builtin generics are replaced by their typing equivalent, in target_type and in its arguments, e.g. list[str]
+        becomes List[str] and Optional[dict[str, int]] becomes Optional[Dict[str, int]].
+        """
+        if isinstance(target_type, (type, str)):
+            return target_type
+        try:
+            return cls._normalize(get_type_hint_key(target_type), target_type)
+        except TypeError:
+            # Unhashable type hints, e.g. with unhashable Annotated metadata, are kept as is
+            return target_type
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _normalize(cls, _cache_key: Any, target_type: Any) -> Any:
+        if isinstance(target_type, GenericAlias):
+            typing_alias = _TYPING_ALIAS_BY_ORIGIN.get(target_type.__origin__)
+            if typing_alias is None:
+                return target_type
+            return typing_alias[tuple(cls.normalize(argument) for argument in target_type.__args__)]
+        if isinstance(target_type, _GenericAlias):
+            arguments = tuple(cls.normalize(argument) for argument in target_type.__args__)
+            if any(argument is not original for argument, original in zip(arguments, target_type.__args__)):
+                return target_type.copy_with(arguments)
+        return target_type
+
     @staticmethod
     def is_list(target_type: Any) -> bool:
         """Returns True if target_type is List[<Any>] or list[Any]"""
         return isinstance(target_type, (_GenericAlias, GenericAlias)) and bool(target_type.__origin__ == list)
 
-    @staticmethod
-    def is_pep585_list(target_type: Any) -> bool:
-        """Returns True if target_type is list[<Any>]"""
-        return isinstance(target_type, GenericAlias) and bool(target_type.__origin__ == list)
-
     @staticmethod
     def is_set(target_type: Any) -> bool:
         """Returns True if target_type is Set[<Any>]"""
@@ -30,11 +85,35 @@ class Pep585TypeChecker:
         """Returns True if target_type is Tuple[<Any>]"""
         return isinstance(target_type, (_GenericAlias, GenericAlias)) and bool(target_type.__origin__ == tuple)
 
+    @staticmethod
+    def is_iterable(target_type: Any) -> bool:
+        """Returns True if target_type is Iterable[<Any>]"""
+        return isinstance(target_type, (_GenericAlias, GenericAlias)) and bool(
+            target_type.__origin__ == collections.abc.Iterable
+        )
+
+    @staticmethod
+    def is_mapping(target_type: Any) -> bool:
+        """Returns True if target_type is Mapping[<Any>, <Any>]"""
+        return isinstance(target_type, (_GenericAlias, GenericAlias)) and bool(
+            target_type.__origin__ == collections.abc.Mapping
+        )
+
     @staticmethod
     def is_provider(target_type: Any) -> bool:
         """Returns True if target_type is Provider[<Any>]"""
         return isinstance(target_type, _GenericAlias) and target_type.__origin__ == Provider
 
+    @staticmethod
+    def is_assisted_factory(target_type: Any) -> bool:
+        """Returns True if target_type is AssistedFactory[<Any>]"""
+        return isinstance(target_type, _GenericAlias) and target_type.__origin__ == AssistedFactory
+
+    @staticmethod
+    def is_lazy(target_type: Any) -> bool:
+        """Returns True if target_type is Lazy[<Any>]"""
+        return isinstance(target_type, _GenericAlias) and target_type.__origin__ == Lazy
+
     @staticmethod
     def is_named(target_type: Any) -> bool:
         """Returns True if target_type is Named[<Any>]"""
@@ -1,5 +1,5 @@
 import types
-from typing import Any
+from typing import Any, Union
 
 from opyoid.type_checker.pep585_type_checker import Pep585TypeChecker
 
@@ -10,7 +10,17 @@ class Pep604TypeChecker(Pep585TypeChecker):
     @staticmethod
     def is_union(target_type: Any) -> bool:
         """Returns True if target_type is Union[<Any>, <Any>...] or Optional[<Any>] or <Any> | <Any>..."""
-        # pylint: disable=no-member
         return Pep585TypeChecker.is_union(target_type) or isinstance(
             target_type, types.UnionType  # type: ignore[attr-defined]
         )
+
+    @classmethod
+    def normalize(cls, target_type: Any) -> Any:
+        """Returns the canonical form of target_type, so that equivalent type hints are equal.
+
+        Builtin generics are replaced by their typing equivalent, in target_type and in its arguments, e.g. list[str]
+        becomes List[str], and <Any> | <Any> unions become Union[<Any>, <Any>].
+        """
+        if isinstance(target_type, types.UnionType):  # type: ignore[attr-defined]
+            target_type = Union[target_type.__args__]
+        return super().normalize(target_type)
@@ -0,0 +1,15 @@
+from typing import Any, get_args, get_origin
+
+
+def get_type_hint_key(type_hint: Any) -> Any:
+    """Returns a key identifying type_hint in caches.
+
+    Unions are equal whatever the order of their members, the key keeps the order of the arguments of type_hint and of
+    its nested type hints.
+    """
+    if isinstance(type_hint, list):
+        return list, tuple(get_type_hint_key(argument) for argument in type_hint)
+    arguments = get_args(type_hint)
+    if not arguments:
+        return type(type_hint), type_hint
+    return type(type_hint), get_origin(type_hint), tuple(get_type_hint_key(argument) for argument in arguments)
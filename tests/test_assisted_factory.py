@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import AssistedFactory, Provider
+
+
+class MyType:
+    def __init__(self, dependency: str, runtime_arg: int, optional_arg: bool = False):
+        self.dependency = dependency
+        self.runtime_arg = runtime_arg
+        self.optional_arg = optional_arg
+
+
+class TestAssistedFactory(unittest.TestCase):
+    def setUp(self):
+        self.provider = create_autospec(Provider, spec_set=True)
+        self.provider.get.return_value = "injected"
+        self.factory = AssistedFactory(MyType, (("dependency", self.provider),), frozenset(["runtime_arg"]))
+
+    def test_call_injects_parameters(self):
+        instance = self.factory(runtime_arg=3)
+
+        self.assertEqual("injected", instance.dependency)
+        self.assertEqual(3, instance.runtime_arg)
+        self.assertFalse(instance.optional_arg)
+
+    def test_call_overrides_injected_parameters(self):
+        instance = self.factory(runtime_arg=3, dependency="overridden", optional_arg=True)
+
+        self.assertEqual("overridden", instance.dependency)
+        self.assertTrue(instance.optional_arg)
+        self.provider.get.assert_not_called()
+
+    def test_missing_assisted_parameter_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            self.factory()
+        self.provider.get.assert_not_called()
+
+    def test_repr(self):
+        self.assertEqual(f"AssistedFactory({__name__}.MyType)", repr(self.factory))
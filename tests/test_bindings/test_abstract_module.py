@@ -1,11 +1,12 @@
 import unittest
-from typing import List
+from typing import cast, Dict, List
 from unittest.mock import ANY
 
 from opyoid import AbstractModule, Module, PerLookupScope, PrivateModule, Provider, SelfBinding, SingletonScope
-from opyoid.bindings import ClassBinding, InstanceBinding, MultiBinding, ProviderBinding
+from opyoid.bindings import ClassBinding, InstanceBinding, MapBinding, MultiBinding, ProviderBinding
 from opyoid.bindings.multi_binding import ItemBinding
 from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.registered_map_binding import RegisteredMapBinding
 from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
 from opyoid.exceptions import BindingError
 from opyoid.frozen_target import FrozenTarget
@@ -259,6 +260,14 @@ class TestAbstractModule(unittest.TestCase):
             self.module.binding_registry.get_bindings_by_target(),
         )
 
+    def test_parallel_multi_binding(self):
+        self.module.multi_bind(MyType, [self.module.bind_item(to_class=MyType)], parallel=True)
+
+        binding = cast(
+            RegisteredBinding[List[MyType]], self.module.binding_registry.get_binding(FrozenTarget(List[MyType]))
+        )
+        self.assertTrue(cast(MultiBinding[MyType], binding.raw_binding).parallel)
+
     def test_multi_binding_with_empty_item_raises_exception(self):
         with self.assertRaises(BindingError):
             self.module.multi_bind(
@@ -267,3 +276,74 @@ class TestAbstractModule(unittest.TestCase):
                     self.module.bind_item(),
                 ],
             )
+
+    def test_map_binding(self):
+        self.module.map_bind(
+            str,
+            MyType,
+            {
+                "class": self.module.bind_item(to_class=OtherType),
+                "instance": self.module.bind_item(to_instance=self.my_instance),
+                "provider": self.module.bind_item(to_provider=MyProvider, scope=SingletonScope),
+            },
+            scope=PerLookupScope,
+            named="my_name",
+        )
+
+        self.assertEqual(
+            {
+                FrozenTarget(Dict[str, MyType], "my_name"): RegisteredMapBinding(
+                    MapBinding(
+                        str,
+                        MyType,
+                        {
+                            "class": ItemBinding(bound_class=OtherType),
+                            "instance": ItemBinding(bound_instance=self.my_instance),
+                            "provider": ItemBinding(bound_provider=MyProvider, scope=SingletonScope),
+                        },
+                        scope=PerLookupScope,
+                        named="my_name",
+                    ),
+                    self.module,
+                    item_bindings={
+                        "class": RegisteredBinding(
+                            SelfBinding(OtherType, scope=PerLookupScope, named="my_name"), self.module
+                        ),
+                        "instance": RegisteredBinding(
+                            InstanceBinding(MyType, self.my_instance, named="my_name"), self.module
+                        ),
+                        "provider": RegisteredBinding(
+                            ProviderBinding(MyType, MyProvider, scope=SingletonScope, named="my_name"), self.module
+                        ),
+                    },
+                ),
+                FrozenTarget(OtherType, "my_name"): RegisteredBinding(
+                    SelfBinding(OtherType, scope=PerLookupScope, named="my_name"), self.module
+                ),
+                FrozenTarget(MyType, "my_name"): RegisteredBinding(
+                    InstanceBinding(MyType, self.my_instance, named="my_name"), self.module
+                ),
+                FrozenTarget(MyProvider, "my_name"): RegisteredBinding(
+                    SelfBinding(MyProvider, scope=SingletonScope, named="my_name"), self.module
+                ),
+            },
+            self.module.binding_registry.get_bindings_by_target(),
+        )
+
+    def test_map_binding_with_empty_item_raises_exception(self):
+        with self.assertRaises(BindingError):
+            self.module.map_bind(str, MyType, {"key": self.module.bind_item()})
+
+    def test_install_private_module_with_map_binding(self):
+        class OtherModule(PrivateModule):
+            def configure(self) -> None:
+                self.expose(self.map_bind(str, MyType, {"key": self.bind_item(to_class=MyType)}))
+
+        self.module.install(OtherModule)
+
+        binding = self.module.binding_registry.get_bindings_by_target()[FrozenTarget(Dict[str, MyType])]
+        self.assertIsInstance(binding, RegisteredMapBinding)
+        self.assertEqual(
+            {"key": RegisteredBinding(SelfBinding(MyType), ANY, source_path=(ANY,))},
+            cast(RegisteredMapBinding[MyType], binding).item_bindings,
+        )
@@ -1,10 +1,19 @@
 import unittest
-from typing import cast, List
+from typing import cast, Dict, List
 from unittest.mock import create_autospec
 
-from opyoid import AbstractModule, ClassBinding, PerLookupScope, Provider, SelfBinding
-from opyoid.bindings import Binding, BindingRegistry, InstanceBinding, ItemBinding, MultiBinding, ProviderBinding
+from opyoid import AbstractModule, ClassBinding, PerLookupScope, PrivateModule, Provider, SelfBinding
+from opyoid.bindings import (
+    Binding,
+    BindingRegistry,
+    InstanceBinding,
+    ItemBinding,
+    MapBinding,
+    MultiBinding,
+    ProviderBinding,
+)
 from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.registered_map_binding import RegisteredMapBinding
 from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
 from opyoid.exceptions import NonInjectableTypeError
 from opyoid.frozen_target import FrozenTarget
@@ -19,6 +28,10 @@ class OtherType:
     pass
 
 
+class UnhashableType(MyType):
+    __hash__ = None  # type: ignore[assignment]
+
+
 class TestBindingRegistry(unittest.TestCase):
     def setUp(self) -> None:
         self.binding_registry = BindingRegistry()
@@ -77,6 +90,32 @@ class TestBindingRegistry(unittest.TestCase):
         self.assertIsInstance(registered_binding.raw_binding, MultiBinding)
         self.assertEqual([registered_item_binding_1, registered_item_binding_2], registered_binding.item_bindings)
 
+    def test_register_multi_binding_skips_known_items(self):
+        unhashable_instance = UnhashableType()
+        registered_item_binding_1 = RegisteredBinding(SelfBinding(MyType), self.module)
+        registered_item_binding_2: RegisteredBinding[MyType] = RegisteredBinding(
+            InstanceBinding(MyType, unhashable_instance), self.module
+        )
+        binding_1 = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_class=MyType), ItemBinding(bound_instance=unhashable_instance)]),
+            self.module,
+            item_bindings=[registered_item_binding_1, registered_item_binding_2],
+        )
+        binding_2 = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_instance=unhashable_instance), ItemBinding(bound_class=MyType)]),
+            self.module,
+            item_bindings=[
+                RegisteredBinding(InstanceBinding(MyType, unhashable_instance), self.module),
+                RegisteredBinding(SelfBinding(MyType), self.module),
+            ],
+        )
+
+        self.binding_registry.register(binding_1)
+        self.binding_registry.register(binding_2)
+
+        self.assertEqual([registered_item_binding_1, registered_item_binding_2], binding_1.item_bindings)
+        self.assertEqual(2, len(cast(MultiBinding[MyType], binding_1.raw_binding).item_bindings))
+
     def test_register_multi_binding_with_override(self):
         item_binding_1 = ItemBinding(bound_class=MyType)
         item_binding_2 = ItemBinding(bound_instance=MyType())
@@ -223,3 +262,176 @@ class TestBindingRegistry(unittest.TestCase):
         self.binding_registry.register(class_binding)
         self.assertIs(class_binding, self.binding_registry.get_binding(Target(MyType)))
         self.assertIs(instance_binding, self.binding_registry.get_binding(Target(MySubType)))
+
+    def test_register_map_binding_extends_previous_map_binding(self):
+        instance_1 = MyType()
+        instance_2 = MyType()
+        registered_item_binding_1 = RegisteredBinding(InstanceBinding(MyType, instance_1), self.module)
+        registered_item_binding_2 = RegisteredBinding(InstanceBinding(MyType, instance_2), self.module)
+        binding_1 = RegisteredMapBinding(
+            MapBinding(str, MyType, {"key_1": ItemBinding(bound_instance=instance_1)}),
+            self.module,
+            item_bindings={"key_1": registered_item_binding_1},
+        )
+        binding_2 = RegisteredMapBinding(
+            MapBinding(str, MyType, {"key_1": ItemBinding(bound_instance=instance_2)}),
+            self.module,
+            item_bindings={"key_1": registered_item_binding_2},
+        )
+        binding_3 = RegisteredMapBinding(
+            MapBinding(str, MyType, {"key_2": ItemBinding(bound_instance=instance_1)}),
+            self.module,
+            item_bindings={"key_2": registered_item_binding_1},
+        )
+
+        self.binding_registry.register(binding_1)
+        self.binding_registry.register(binding_2)
+        self.binding_registry.register(binding_3)
+
+        binding = cast(RegisteredMapBinding[MyType], self.binding_registry.get_binding(Target(Dict[str, MyType])))
+        self.assertIs(binding_1, binding)
+        self.assertEqual(
+            {"key_1": registered_item_binding_2, "key_2": registered_item_binding_1}, binding.item_bindings
+        )
+        self.assertEqual(
+            {"key_1": ItemBinding(bound_instance=instance_2), "key_2": ItemBinding(bound_instance=instance_1)},
+            cast(MapBinding[MyType], binding.raw_binding).item_bindings,
+        )
+
+    def test_register_map_binding_with_override(self):
+        binding_1 = RegisteredMapBinding(
+            MapBinding(str, MyType, {"key_1": ItemBinding(bound_class=MyType)}),
+            self.module,
+            item_bindings={"key_1": RegisteredBinding(SelfBinding(MyType), self.module)},
+        )
+        binding_2 = RegisteredMapBinding(
+            MapBinding(str, MyType, {"key_2": ItemBinding(bound_class=MyType)}, override_bindings=True),
+            self.module,
+            item_bindings={"key_2": RegisteredBinding(SelfBinding(MyType), self.module)},
+        )
+
+        self.binding_registry.register(binding_1)
+        self.binding_registry.register(binding_2)
+
+        self.assertIs(binding_2, self.binding_registry.get_binding(Target(Dict[str, MyType])))
+        self.assertIn(FrozenTarget(MyType), self.binding_registry.get_bindings_by_target())
+
+    def test_install_layers_bindings_in_registration_order(self):
+        installed_registry = BindingRegistry()
+        installed_registry.register(self.my_type_binding)
+        installed_registry.register(self.other_type_binding)
+        self.binding_registry.register(self.my_type_named_binding)
+        self.binding_registry.install(installed_registry)
+        self.binding_registry.register(self.my_type_binding_2)
+
+        self.assertEqual(
+            {
+                FrozenTarget(MyType): self.my_type_binding_2,
+                FrozenTarget(MyType, "my_name"): self.my_type_named_binding,
+                FrozenTarget(OtherType): self.other_type_binding,
+            },
+            self.binding_registry.get_bindings_by_target(),
+        )
+
+    def test_install_overrides_previous_bindings(self):
+        installed_registry = BindingRegistry()
+        installed_registry.register(self.my_type_binding_2)
+        self.binding_registry.register(self.my_type_binding)
+        self.binding_registry.install(installed_registry)
+
+        self.assertIs(self.my_type_binding_2, self.binding_registry.get_binding(Target(MyType)))
+
+    def test_bindings_registered_after_install_are_visible(self):
+        installed_registry = BindingRegistry()
+        self.binding_registry.install(installed_registry)
+        self.assertIsNone(self.binding_registry.get_binding(Target(MyType)))
+
+        installed_registry.register(self.my_type_binding)
+
+        self.assertIs(self.my_type_binding, self.binding_registry.get_binding(Target(MyType)))
+        self.assertEqual([FrozenTarget(MyType)], self.binding_registry.get_targets_registered_since(0))
+
+    def test_install_extends_multi_binding_without_modifying_installed_binding(self):
+        item_binding_1 = RegisteredBinding(SelfBinding(MyType), self.module)
+        instance = MyType()
+        item_binding_2 = RegisteredBinding(InstanceBinding(MyType, instance), self.module)
+        binding_1 = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_class=MyType)]), self.module, item_bindings=[item_binding_1]
+        )
+        binding_2 = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_instance=instance)]),
+            self.module,
+            item_bindings=[item_binding_2],
+        )
+        installed_registry = BindingRegistry()
+        installed_registry.register(binding_1)
+        self.binding_registry.install(installed_registry)
+        self.binding_registry.register(binding_2)
+
+        binding = cast(RegisteredMultiBinding[MyType], self.binding_registry.get_binding(Target(List[MyType])))
+        self.assertEqual([item_binding_1, item_binding_2], binding.item_bindings)
+        self.assertEqual([item_binding_1], binding_1.item_bindings)
+        self.assertIs(binding_1, installed_registry.get_binding(Target(List[MyType])))
+
+    def test_self_binding_does_not_override_installed_binding(self):
+        installed_registry = BindingRegistry()
+        installed_registry.register(self.my_type_binding_2)
+        self.binding_registry.install(installed_registry)
+        class_binding = RegisteredBinding(ClassBinding(OtherType, MyType), self.module)
+        self.binding_registry.register(class_binding)
+
+        self.assertIs(self.my_type_binding_2, self.binding_registry.get_binding(Target(MyType)))
+        self.assertIs(class_binding, self.binding_registry.get_binding(Target(OtherType)))
+
+    def test_install_private_registry_only_adds_exposed_bindings(self):
+        private_module = PrivateModule()
+        private_module.expose(self.my_type_binding_2)
+        installed_registry = BindingRegistry()
+        installed_registry.register(self.my_type_binding_2)
+        installed_registry.register(self.other_type_binding)
+        self.binding_registry.install(installed_registry, private_module)
+
+        self.assertEqual(
+            {
+                FrozenTarget(MyType): RegisteredBinding(
+                    self.my_type_binding_2.raw_binding, private_module, source_path=(private_module,)
+                ),
+            },
+            self.binding_registry.get_bindings_by_target(),
+        )
+        self.assertIsNone(self.binding_registry.get_binding(Target(OtherType)))
+        self.assertEqual([FrozenTarget(MyType)], self.binding_registry.get_targets_registered_since(0))
+
+    def test_install_registry_containing_this_one_copies_its_bindings(self):
+        installed_registry = BindingRegistry()
+        installed_registry.install(self.binding_registry)
+        installed_registry.register(self.other_type_binding)
+        self.binding_registry.install(installed_registry)
+        installed_registry.register(self.my_type_binding)
+
+        self.assertIs(self.other_type_binding, self.binding_registry.get_binding(Target(OtherType)))
+        self.assertIsNone(self.binding_registry.get_binding(Target(MyType)))
+        self.assertIs(self.other_type_binding, installed_registry.get_binding(Target(OtherType)))
+
+    def test_install_with_copy_bindings_copies_the_current_bindings(self):
+        installed_registry = BindingRegistry()
+        installed_registry.register(self.other_type_binding)
+        self.binding_registry.install(installed_registry, copy_bindings=True)
+        installed_registry.register(self.my_type_binding)
+
+        self.assertEqual(
+            {FrozenTarget(OtherType): self.other_type_binding}, self.binding_registry.get_bindings_by_target()
+        )
+
+    def test_registration_in_installed_registry_updates_generation(self):
+        installed_registry = BindingRegistry()
+        other_registry = BindingRegistry()
+        self.binding_registry.install(installed_registry)
+        generation = self.binding_registry.generation
+
+        other_registry.register(self.other_type_binding)
+        self.assertEqual(generation, self.binding_registry.generation)
+
+        installed_registry.register(self.my_type_binding)
+        self.assertGreater(self.binding_registry.generation, generation)
+        self.assertEqual(installed_registry.generation, self.binding_registry.generation)
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Provider
+from opyoid.bindings import LazyMapping
+
+
+class TestLazyMapping(unittest.TestCase):
+    def setUp(self):
+        self.provider_1 = create_autospec(Provider, spec_set=True)
+        self.provider_1.get.return_value = "value_1"
+        self.provider_2 = create_autospec(Provider, spec_set=True)
+        self.provider_2.get.return_value = "value_2"
+        self.lazy_mapping = LazyMapping({"key_1": self.provider_1, "key_2": self.provider_2})
+
+    def test_values_are_created_on_first_access(self):
+        self.assertEqual("value_2", self.lazy_mapping["key_2"])
+        self.assertEqual("value_2", self.lazy_mapping["key_2"])
+
+        self.provider_1.get.assert_not_called()
+        self.provider_2.get.assert_called_once_with()
+
+    def test_unknown_key_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            _ = self.lazy_mapping["unknown_key"]
+        self.assertIsNone(self.lazy_mapping.get("unknown_key"))
+
+    def test_keys_do_not_create_values(self):
+        self.assertEqual(["key_1", "key_2"], list(self.lazy_mapping))
+        self.assertEqual(2, len(self.lazy_mapping))
+        self.assertIn("key_1", self.lazy_mapping)
+        self.assertNotIn("unknown_key", self.lazy_mapping)
+
+        self.provider_1.get.assert_not_called()
+        self.provider_2.get.assert_not_called()
+
+    def test_items_create_all_values(self):
+        self.assertEqual({"key_1": "value_1", "key_2": "value_2"}, dict(self.lazy_mapping.items()))
@@ -0,0 +1,25 @@
+import unittest
+from typing import Dict
+
+from opyoid import PerLookupScope
+from opyoid.bindings import ItemBinding, MapBinding
+from opyoid.frozen_target import FrozenTarget
+
+
+class MyType:
+    pass
+
+
+class TestMapBinding(unittest.TestCase):
+    def test_target_is_dict_of_key_and_value_types(self):
+        binding = MapBinding(str, MyType, {"key": ItemBinding(bound_class=MyType)}, named="my_name")
+
+        self.assertEqual(FrozenTarget(Dict[str, MyType], "my_name"), binding.target)
+
+    def test_repr(self):
+        binding = MapBinding(str, MyType, {"key": ItemBinding(bound_class=MyType)}, scope=PerLookupScope)
+
+        self.assertEqual(
+            f"MapBinding(typing.Dict[str, {__name__}.MyType] -> {{'key': {__name__}.MyType}}, scope={PerLookupScope})",
+            repr(binding),
+        )
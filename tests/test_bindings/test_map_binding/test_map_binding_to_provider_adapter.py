@@ -0,0 +1,93 @@
+import unittest
+from typing import cast, Dict
+from unittest.mock import create_autospec
+
+from opyoid import AbstractModule, ImmediateScope, InstanceBinding, SelfBinding, SingletonScope, Target
+from opyoid.bindings import (
+    BindingRegistry,
+    DictProvider,
+    MapBinding,
+    MapBindingToProviderAdapter,
+    MultiBinding,
+    ProviderCacheKey,
+)
+from opyoid.bindings.multi_binding import ItemBinding
+from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.registered_map_binding import RegisteredMapBinding
+from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
+from opyoid.exceptions import IncompatibleAdapter, NonInjectableTypeError
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.providers.providers_factories.from_registered_binding_provider_factory import (
+    FromRegisteredBindingProviderFactory,
+)
+from opyoid.scopes import SingletonScopedProvider
+
+
+class MyType:
+    pass
+
+
+class TestMapBindingToProviderAdapter(unittest.TestCase):
+    def setUp(self):
+        self.binding_registry = BindingRegistry()
+        self.module = create_autospec(AbstractModule, spec_set=True)
+        self.binding_registry.register(
+            RegisteredBinding(InstanceBinding(SingletonScope, SingletonScope()), self.module)
+        )
+        self.adapter = MapBindingToProviderAdapter(FromRegisteredBindingProviderFactory())
+        self.my_instance = MyType()
+        self.state = InjectionState(ProviderCreator(), self.binding_registry)
+        self.context = InjectionContext(Target(Dict[str, MyType]), self.state)
+
+    def test_create_from_instance_and_class_bindings(self):
+        binding = RegisteredMapBinding(
+            MapBinding(
+                str,
+                MyType,
+                {"instance": ItemBinding(bound_instance=self.my_instance), "class": ItemBinding(bound_class=MyType)},
+            ),
+            self.module,
+            item_bindings={
+                "instance": RegisteredBinding(InstanceBinding(MyType, self.my_instance), self.module),
+                "class": RegisteredBinding(SelfBinding(MyType), self.module),
+            },
+        )
+
+        provider = self.adapter.create(binding, self.context)
+
+        self.assertIsInstance(provider, SingletonScopedProvider)
+        instance = provider.get()
+        self.assertEqual(["instance", "class"], list(instance))
+        self.assertIs(self.my_instance, instance["instance"])
+        self.assertIsInstance(instance["class"], MyType)
+        self.assertIs(instance, provider.get())
+
+    def test_create_with_item_providers_cache_key_returns_unscoped_provider(self):
+        binding = RegisteredMapBinding(
+            MapBinding(str, MyType, {"class": ItemBinding(bound_class=MyType)}),
+            self.module,
+            item_bindings={"class": RegisteredBinding(SelfBinding(MyType), self.module)},
+        )
+        scoped_provider = self.adapter.create(binding, self.context)
+        context = InjectionContext(
+            Target(Dict[str, MyType], provider_cache_key=ProviderCacheKey.ITEM_PROVIDERS), self.state
+        )
+
+        unscoped_provider = self.adapter.create(binding, context)
+
+        self.assertIsInstance(unscoped_provider, DictProvider)
+        self.assertIs(
+            scoped_provider.get()["class"], cast(DictProvider[MyType], unscoped_provider).item_providers["class"].get()
+        )
+
+    def test_non_injectable_scope_raises_exception(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.adapter.create(
+                RegisteredMapBinding(MapBinding(str, MyType, {}, scope=ImmediateScope), self.module), self.context
+            )
+
+    def test_non_map_binding_raises_incompatible_adapter(self):
+        with self.assertRaises(IncompatibleAdapter):
+            self.adapter.create(RegisteredMultiBinding(MultiBinding(MyType, []), self.module), self.context)
@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Provider
+from opyoid.bindings import LazyIterable
+
+
+class TestLazyIterable(unittest.TestCase):
+    def setUp(self):
+        self.provider_1 = create_autospec(Provider, spec_set=True)
+        self.provider_1.get.return_value = "item_1"
+        self.provider_2 = create_autospec(Provider, spec_set=True)
+        self.provider_2.get.return_value = "item_2"
+        self.lazy_iterable = LazyIterable([self.provider_1, self.provider_2])
+
+    def test_items_are_created_on_demand(self):
+        iterator = iter(self.lazy_iterable)
+
+        self.provider_1.get.assert_not_called()
+        self.assertEqual("item_1", next(iterator))
+        self.provider_1.get.assert_called_once_with()
+        self.provider_2.get.assert_not_called()
+        self.assertEqual("item_2", next(iterator))
+        self.provider_2.get.assert_called_once_with()
+
+    def test_items_are_created_once(self):
+        self.assertEqual(["item_1", "item_2"], list(self.lazy_iterable))
+        self.assertEqual(["item_1", "item_2"], list(self.lazy_iterable))
+
+        self.provider_1.get.assert_called_once_with()
+        self.provider_2.get.assert_called_once_with()
+
+    def test_len_does_not_create_items(self):
+        self.assertEqual(2, len(self.lazy_iterable))
+
+        self.provider_1.get.assert_not_called()
@@ -1,5 +1,5 @@
 import unittest
-from typing import List
+from typing import cast, List
 from unittest.mock import create_autospec
 
 from opyoid import (
@@ -13,7 +13,14 @@ from opyoid import (
     Target,
     ThreadScope,
 )
-from opyoid.bindings import BindingRegistry, MultiBinding, MultiBindingToProviderAdapter
+from opyoid.bindings import (
+    BindingRegistry,
+    ListProvider,
+    MultiBinding,
+    MultiBindingToProviderAdapter,
+    ParallelListProvider,
+    ProviderCacheKey,
+)
 from opyoid.bindings.multi_binding import ItemBinding
 from opyoid.bindings.registered_binding import RegisteredBinding
 from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
@@ -107,3 +114,31 @@ class TestMultiBindingToProviderAdapter(unittest.TestCase):
             self.adapter.create(
                 RegisteredMultiBinding(MultiBinding(MyType, [], scope=ImmediateScope), self.module), self.context
             )
+
+    def test_create_with_item_providers_cache_key_returns_unscoped_provider(self):
+        binding = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_class=MyType)]),
+            self.module,
+            item_bindings=[RegisteredBinding(SelfBinding(MyType), self.module)],
+        )
+        scoped_provider = self.adapter.create(binding, self.context)
+        context = InjectionContext(Target(List[MyType], provider_cache_key=ProviderCacheKey.ITEM_PROVIDERS), self.state)
+
+        unscoped_provider = self.adapter.create(binding, context)
+
+        self.assertIsInstance(unscoped_provider, ListProvider)
+        self.assertIsNot(scoped_provider, unscoped_provider)
+        self.assertIs(scoped_provider.get()[0], cast(ListProvider[MyType], unscoped_provider).item_providers[0].get())
+
+    def test_create_parallel_multi_binding(self):
+        binding = RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(bound_instance=self.my_instance)], parallel=True),
+            self.module,
+            item_bindings=[RegisteredBinding(InstanceBinding(MyType, self.my_instance), self.module)],
+        )
+        context = InjectionContext(Target(List[MyType], provider_cache_key=ProviderCacheKey.ITEM_PROVIDERS), self.state)
+
+        provider = self.adapter.create(binding, context)
+
+        self.assertIsInstance(provider, ParallelListProvider)
+        self.assertEqual([self.my_instance], provider.get())
@@ -0,0 +1,54 @@
+import threading
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Provider
+from opyoid.bindings import ParallelListProvider
+
+
+class MyProvider(Provider[str]):
+    def __init__(self, value: str, barrier: threading.Barrier) -> None:
+        self.value = value
+        self.barrier = barrier
+
+    def get(self) -> str:
+        self.barrier.wait(timeout=5)
+        return self.value
+
+
+class TestParallelListProvider(unittest.TestCase):
+    def test_items_are_created_concurrently_in_order(self):
+        barrier = threading.Barrier(3)
+        provider = ParallelListProvider([MyProvider(f"value_{index}", barrier) for index in range(3)])
+
+        self.assertEqual(["value_0", "value_1", "value_2"], provider.get())
+
+    def test_first_error_in_order_is_raised(self):
+        provider_1 = create_autospec(Provider, spec_set=True)
+        provider_1.get.return_value = "value"
+        provider_2 = create_autospec(Provider, spec_set=True)
+        provider_2.get.side_effect = KeyError("key")
+        provider_3 = create_autospec(Provider, spec_set=True)
+        provider_3.get.side_effect = ValueError("value")
+        provider = ParallelListProvider([provider_1, provider_2, provider_3])
+
+        with self.assertRaises(KeyError):
+            provider.get()
+        provider_3.get.assert_called_once_with()
+
+    def test_nested_parallel_lists_are_created_sequentially(self):
+        thread_names = []
+
+        class MyNestedProvider(Provider[str]):
+            def get(self) -> str:
+                thread_names.append(threading.current_thread().name)
+                return "nested"
+
+        nested_provider = ParallelListProvider([MyNestedProvider(), MyNestedProvider()])
+        outer_provider = create_autospec(Provider, spec_set=True)
+        outer_provider.get.return_value = "outer"
+        provider = ParallelListProvider([nested_provider, outer_provider])
+
+        self.assertEqual([["nested", "nested"], "outer"], provider.get())
+        self.assertEqual(1, len(set(thread_names)))
+        self.assertTrue(thread_names[0].startswith("opyoid"))
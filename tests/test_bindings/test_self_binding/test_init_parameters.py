@@ -0,0 +1,142 @@
+import unittest
+from dataclasses import dataclass, field, InitVar
+from inspect import Parameter
+from typing import List, NamedTuple
+
+import attr
+
+from opyoid import named_arg
+from opyoid.bindings.self_binding.init_parameters import InitParameters
+from opyoid.named import Named
+
+
+class MyType:
+    pass
+
+
+@dataclass
+class MyDataclass:
+    my_param: MyType
+    my_list: "List[MyType]"
+    my_unresolved: "MyUnknownType"  # type: ignore[name-defined]
+    my_factory: List[str] = field(default_factory=list)
+    my_default: str = "default"
+    my_field: int = field(default=0, init=False)
+
+
+@dataclass
+class MyInitVarDataclass:
+    my_param: MyType
+    my_init_var: InitVar[int]
+
+
+@dataclass
+class MyOverriddenDataclass:
+    my_param: MyType
+
+    def __init__(self, my_param: str) -> None:
+        self.my_param = MyType()
+        self.my_name = my_param
+
+
+@dataclass
+class MyNamedDataclass:
+    my_param: MyType
+
+    @named_arg("my_param", "my_name")
+    def __init__(self, my_param: MyType) -> None:
+        self.my_param = my_param
+
+
+@attr.s(auto_attribs=True)
+class MyAttrsClass:
+    _my_private: MyType
+    my_factory: List[str] = attr.Factory(list)
+    my_keyword: str = attr.ib(default="default", kw_only=True)
+    my_field: int = attr.ib(default=0, init=False)
+
+
+class MyNamedTuple(NamedTuple):
+    my_param: MyType
+    my_default: str = "default"
+
+
+MyForwardReferenceNamedTuple = NamedTuple(
+    "MyForwardReferenceNamedTuple", [("my_param", "MyType"), ("my_list", "List[MyType]")]
+)
+
+
+class MyClass:
+    def __init__(self, my_param: MyType, *args: str, my_keyword: "MyType", **kwargs: int) -> None:
+        pass
+
+
+class TestInitParameters(unittest.TestCase):
+    def test_dataclass_parameters_are_read_from_fields(self):
+        parameters = InitParameters.get(MyDataclass)
+
+        self.assertEqual(
+            ["my_param", "my_list", "my_unresolved", "my_factory", "my_default"],
+            [parameter.name for parameter in parameters],
+        )
+        self.assertEqual(MyType, parameters[0].annotation)
+        self.assertEqual(List[MyType], parameters[1].annotation)
+        self.assertEqual("MyUnknownType", parameters[2].annotation)
+        self.assertIs(Parameter.empty, parameters[0].default)
+        self.assertIsNot(Parameter.empty, parameters[3].default)
+        self.assertEqual("default", parameters[4].default)
+        self.assertEqual({Parameter.POSITIONAL_OR_KEYWORD}, {parameter.kind for parameter in parameters})
+
+    def test_attrs_parameters_are_read_from_fields(self):
+        parameters = InitParameters.get(MyAttrsClass)
+
+        self.assertEqual(["my_private", "my_factory", "my_keyword"], [parameter.name for parameter in parameters])
+        self.assertEqual(MyType, parameters[0].annotation)
+        self.assertIs(attr.NOTHING, parameters[1].default)
+        self.assertEqual(Parameter.KEYWORD_ONLY, parameters[2].kind)
+        self.assertEqual("default", parameters[2].default)
+
+    def test_named_tuple_parameters_are_read_from_fields(self):
+        parameters = InitParameters.get(MyNamedTuple)
+
+        self.assertEqual(["my_param", "my_default"], [parameter.name for parameter in parameters])
+        self.assertEqual(MyType, parameters[0].annotation)
+        self.assertEqual("default", parameters[1].default)
+
+    def test_named_tuple_forward_references_are_resolved(self):
+        parameters = InitParameters.get(MyForwardReferenceNamedTuple)
+
+        self.assertEqual([MyType, List[MyType]], [parameter.annotation for parameter in parameters])
+
+    def test_dataclass_with_init_var_uses_signature(self):
+        parameters = InitParameters.get(MyInitVarDataclass)
+
+        self.assertEqual(["my_param", "my_init_var"], [parameter.name for parameter in parameters])
+
+    def test_overridden_dataclass_constructor_uses_signature(self):
+        parameters = InitParameters.get(MyOverriddenDataclass)
+
+        self.assertEqual([str], [parameter.annotation for parameter in parameters])
+
+    def test_named_arguments_use_signature(self):
+        parameter = InitParameters.get(MyNamedDataclass)[0]
+
+        self.assertTrue(issubclass(parameter.annotation, Named))
+        self.assertEqual("my_name", parameter.annotation.name)
+
+    def test_other_classes_use_signature(self):
+        parameters = InitParameters.get(MyClass)
+
+        self.assertEqual(
+            [
+                Parameter.POSITIONAL_OR_KEYWORD,
+                Parameter.VAR_POSITIONAL,
+                Parameter.KEYWORD_ONLY,
+                Parameter.VAR_KEYWORD,
+            ],
+            [parameter.kind for parameter in parameters],
+        )
+        self.assertEqual("MyType", parameters[2].annotation)
+
+    def test_parameters_are_cached(self):
+        self.assertIs(InitParameters.get(MyDataclass), InitParameters.get(MyDataclass))
@@ -0,0 +1,29 @@
+import unittest
+from typing import Any, Mapping
+
+from opyoid import ConfigSource
+
+
+class MyConfigSource(ConfigSource):
+    def __init__(self) -> None:
+        super().__init__()
+        self.load_count = 0
+
+    def load(self) -> Mapping[str, Any]:
+        self.load_count += 1
+        return {"MY_CLASS_MY_PARAM": 1}
+
+
+class TestConfigSource(unittest.TestCase):
+    def test_values_are_loaded_once(self):
+        config_source = MyConfigSource()
+
+        self.assertEqual({"MY_CLASS_MY_PARAM": 1}, config_source.get_values())
+        self.assertEqual({"MY_CLASS_MY_PARAM": 1}, config_source.get_values())
+        self.assertEqual(1, config_source.load_count)
+
+    def test_index_values_uses_env_var_names(self):
+        self.assertEqual(
+            {"MY_CLASS_MY_PARAM": 1, "MY_CLASS_OTHER_PARAM": 2, "HTTP_CLIENT_PORT": 3},
+            ConfigSource.index_values({"MyClass": {"my_param": 1, "otherParam": 2}, "HTTPClient": {"port": 3}}),
+        )
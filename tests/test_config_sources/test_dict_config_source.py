@@ -0,0 +1,10 @@
+import unittest
+
+from opyoid import DictConfigSource
+
+
+class TestDictConfigSource(unittest.TestCase):
+    def test_load_indexes_values(self):
+        config_source = DictConfigSource({"MyClass": {"my_param": [1, 2]}})
+
+        self.assertEqual({"MY_CLASS_MY_PARAM": [1, 2]}, config_source.load())
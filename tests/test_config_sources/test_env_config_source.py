@@ -0,0 +1,14 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from opyoid import EnvConfigSource
+
+
+class TestEnvConfigSource(unittest.TestCase):
+    def test_environment_is_read_once(self):
+        config_source = EnvConfigSource()
+        with patch.dict(os.environ, {"MY_CLASS_MY_PARAM": "value"}):
+            config_source.get_values()
+
+        self.assertEqual("value", config_source.get_values()["MY_CLASS_MY_PARAM"])
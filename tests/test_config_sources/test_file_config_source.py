@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from opyoid import FileConfigSource
+from opyoid.exceptions import InjectException
+
+try:
+    import yaml
+except ImportError:  # pragma: nocover
+    yaml = None  # type: ignore[assignment]
+
+
+class TestFileConfigSource(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_json_file(self):
+        (self.path / "config.json").write_text('{"MyClass": {"my_param": [1, 2]}}', encoding="utf-8")
+
+        config_source = FileConfigSource(self.path / "config.json")
+
+        self.assertEqual({"MY_CLASS_MY_PARAM": [1, 2]}, config_source.load())
+
+    def test_load_toml_file(self):
+        (self.path / "config.toml").write_text('[MyClass]\nmy_param = "value"\n', encoding="utf-8")
+
+        config_source = FileConfigSource(str(self.path / "config.toml"))
+
+        self.assertEqual({"MY_CLASS_MY_PARAM": "value"}, config_source.load())
+
+    @unittest.skipIf(yaml is None, "PyYAML is not installed")
+    def test_load_yaml_file(self):
+        (self.path / "config.yaml").write_text("MyClass:\n  my_param: 3\n", encoding="utf-8")
+
+        config_source = FileConfigSource(self.path / "config.yaml")
+
+        self.assertEqual({"MY_CLASS_MY_PARAM": 3}, config_source.load())
+
+    @unittest.skipIf(yaml is not None, "PyYAML is installed")
+    def test_load_yaml_file_without_yaml_package_raises_exception(self):
+        (self.path / "config.yml").write_text("MyClass:\n  my_param: 3\n", encoding="utf-8")
+
+        with self.assertRaises(InjectException):
+            FileConfigSource(self.path / "config.yml").load()
+
+    def test_json_file_without_mapping_raises_exception(self):
+        (self.path / "config.json").write_text("[1, 2]", encoding="utf-8")
+
+        with self.assertRaises(InjectException) as context:
+            FileConfigSource(self.path / "config.json").load()
+
+        self.assertIn(str(self.path / "config.json"), str(context.exception))
+
+    def test_json_file_without_parameter_mapping_raises_exception(self):
+        (self.path / "config.json").write_text('{"MyClass": 3}', encoding="utf-8")
+
+        with self.assertRaises(InjectException):
+            FileConfigSource(self.path / "config.json").load()
+
+    @unittest.skipIf(yaml is None, "PyYAML is not installed")
+    def test_yaml_file_with_scalar_raises_exception(self):
+        (self.path / "config.yaml").write_text("3\n", encoding="utf-8")
+
+        with self.assertRaises(InjectException):
+            FileConfigSource(self.path / "config.yaml").load()
+
+    def test_unsupported_format_raises_exception(self):
+        with self.assertRaises(InjectException):
+            FileConfigSource(self.path / "config.ini").load()
+
+    def test_repr(self):
+        path = self.path / "config.json"
+
+        self.assertEqual(f"FileConfigSource({str(path)!r})", repr(FileConfigSource(path)))
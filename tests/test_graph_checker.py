@@ -0,0 +1,136 @@
+import unittest
+from typing import Any, List
+
+from opyoid import BindingError, ImmediateScope, Injector, Module, SelfBinding
+from opyoid.bindings import Binding
+from opyoid.graph_checker import GraphChecker
+from opyoid.injector_options import InjectorOptions
+
+
+class MyType:
+    def __init__(self):
+        raise AssertionError("MyType should not be instantiated")
+
+
+class MyParentType:
+    def __init__(self, my_param: MyType, my_int: int, my_list: List[str]):
+        raise AssertionError("MyParentType should not be instantiated")
+
+
+class MyCyclicType:
+    def __init__(self, my_param: "MyOtherCyclicType"):
+        pass
+
+
+class MyOtherCyclicType:
+    def __init__(self, my_param: MyCyclicType):
+        pass
+
+
+class MyInjectorUser:
+    def __init__(self, injector: Injector):
+        pass
+
+
+class TestGraphChecker(unittest.TestCase):
+    def test_valid_graph_returns_no_errors(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyType, scope=ImmediateScope)
+                self.bind(MyInjectorUser)
+
+        self.assertEqual([], GraphChecker([MyModule]).check())
+
+    def test_all_missing_bindings_are_reported(self):
+        checker = GraphChecker(bindings=[SelfBinding(MyParentType)])
+
+        self.assertEqual(
+            [
+                f"Could not find a binding for my_param: {__name__}.MyType required by {__name__}.MyParentType",
+                f"Could not find a binding for my_int: int required by {__name__}.MyParentType",
+                f"Could not find a binding for my_list: typing.List[str] required by {__name__}.MyParentType",
+            ],
+            checker.check(),
+        )
+
+    def test_missing_forward_reference_is_reported_once(self):
+        class MyForwardReferenceType:
+            def __init__(self, my_param: "MyUnknownType"):  # type: ignore[name-defined]
+                pass
+
+        class MyForwardReferenceParentType:
+            def __init__(self, my_param: MyForwardReferenceType):
+                pass
+
+        checker = GraphChecker(
+            bindings=[SelfBinding(MyForwardReferenceType), SelfBinding(MyForwardReferenceParentType)]
+        )
+
+        self.assertEqual(
+            [
+                "Could not find a binding for my_param: MyUnknownType required by "
+                f"{__name__}.{MyForwardReferenceType.__name__}",
+            ],
+            checker.check(),
+        )
+
+    def test_auto_bindings_option_is_used(self):
+        checker = GraphChecker(bindings=[SelfBinding(MyParentType)], options=InjectorOptions(auto_bindings=True))
+
+        self.assertEqual([], checker.check())
+
+    def test_cyclic_dependencies_are_reported(self):
+        checker = GraphChecker(
+            bindings=[SelfBinding(MyCyclicType), SelfBinding(MyOtherCyclicType), SelfBinding(MyType)]
+        )
+
+        self.assertEqual(
+            [
+                "Cyclic dependency detected, injection graph: \n"
+                f"-> {__name__}.MyCyclicType\n"
+                f"-> {__name__}.MyOtherCyclicType\n"
+                f"-> {__name__}.MyCyclicType"
+            ],
+            checker.check(),
+        )
+
+    def test_cyclic_dependencies_are_reported_in_any_binding_order(self):
+        checker = GraphChecker(bindings=[SelfBinding(MyOtherCyclicType), SelfBinding(MyCyclicType)])
+        reversed_checker = GraphChecker(bindings=[SelfBinding(MyCyclicType), SelfBinding(MyOtherCyclicType)])
+
+        self.assertEqual(reversed_checker.check(), checker.check())
+
+    def test_missing_bindings_are_reported_for_each_parameter_in_any_binding_order(self):
+        class MyListParentType:
+            def __init__(self, my_list: List[MyType]):
+                pass
+
+        class MyOtherParentType:
+            def __init__(self, my_other_param: MyType):
+                pass
+
+        bindings: List[Binding[Any]] = [
+            SelfBinding(MyParentType),
+            SelfBinding(MyListParentType),
+            SelfBinding(MyOtherParentType),
+        ]
+        error_messages = [
+            f"Could not find a binding for my_param: {__name__}.MyType required by {__name__}.MyParentType",
+            f"Could not find a binding for my_int: int required by {__name__}.MyParentType",
+            f"Could not find a binding for my_list: typing.List[str] required by {__name__}.MyParentType",
+            f"Could not find a binding for my_list: typing.List[{__name__}.MyType] required by "
+            f"{__name__}.{MyListParentType.__name__}",
+            f"Could not find a binding for my_other_param: {__name__}.MyType required by "
+            f"{__name__}.{MyOtherParentType.__name__}",
+        ]
+
+        self.assertEqual(sorted(error_messages), sorted(GraphChecker(bindings=bindings).check()))
+        self.assertEqual(sorted(error_messages), sorted(GraphChecker(bindings=bindings[::-1]).check()))
+
+    def test_invalid_binding_raises_exception(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MyType, [self.bind_item()])
+
+        with self.assertRaises(BindingError):
+            GraphChecker([MyModule]).check()
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+
+import opyoid
+from opyoid.bindings import SelfBinding
+
+
+class TestInit(unittest.TestCase):
+    def test_all_names_are_importable(self):
+        for name in opyoid.__all__:
+            self.assertIsNotNone(getattr(opyoid, name))
+        self.assertIn("Injector", dir(opyoid))
+
+    def test_name_is_imported_from_its_module(self):
+        self.assertIs(SelfBinding, opyoid.SelfBinding)
+
+    def test_submodule_is_imported_on_attribute_access(self):
+        result = subprocess.run(
+            [sys.executable, "-c", "import opyoid; print(opyoid.exceptions.NoBindingFound.__name__)"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        self.assertEqual("NoBindingFound", result.stdout.strip())
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            getattr(opyoid, "UnknownName")
+
+    def test_import_does_not_import_submodules(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, opyoid; print(sorted(name for name in sys.modules if name.startswith('opyoid.')))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        self.assertEqual("[]", result.stdout.strip())
@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Provider
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.injected_callable import InjectedCallable
+
+
+def my_function(dependency: str, runtime_arg: int, *items: int, flag: bool = False, **kwargs):
+    return dependency, runtime_arg, items, flag, kwargs
+
+
+class TestInjectedCallable(unittest.TestCase):
+    def setUp(self):
+        self.provider = create_autospec(Provider, spec_set=True)
+        self.provider.get.return_value = "injected"
+        self.args_provider = create_autospec(Provider, spec_set=True)
+        self.args_provider.get.return_value = [1, 2]
+        self.flag_provider = create_autospec(Provider, spec_set=True)
+        self.flag_provider.get.return_value = True
+        self.injected_callable = InjectedCallable(
+            my_function,
+            (("dependency", self.provider), ("runtime_arg", None)),
+            ("items", self.args_provider),
+            (("flag", self.flag_provider),),
+        )
+
+    def test_call_injects_parameters(self):
+        self.assertEqual(("injected", 3, (1, 2), True, {}), self.injected_callable(runtime_arg=3))
+
+    def test_call_overrides_injected_parameters(self):
+        result = self.injected_callable(dependency="overridden", runtime_arg=3, items=[4], flag=False)
+
+        self.assertEqual(("overridden", 3, (4,), False, {}), result)
+        self.provider.get.assert_not_called()
+        self.args_provider.get.assert_not_called()
+        self.flag_provider.get.assert_not_called()
+
+    def test_call_passes_other_keyword_arguments(self):
+        self.assertEqual(("injected", 3, (1, 2), True, {"other": 4}), self.injected_callable(runtime_arg=3, other=4))
+
+    def test_call_accepts_positional_arguments(self):
+        result = self.injected_callable("overridden", 3, 4, 5)
+
+        self.assertEqual(("overridden", 3, (4, 5), True, {}), result)
+        self.provider.get.assert_not_called()
+        self.args_provider.get.assert_not_called()
+
+    def test_positional_arguments_override_leading_parameters(self):
+        self.assertEqual(("overridden", 3, (1, 2), True, {}), self.injected_callable("overridden", runtime_arg=3))
+
+    def test_too_many_positional_arguments_raise_type_error(self):
+        injected_callable = InjectedCallable(my_function, (("dependency", self.provider),), None, ())
+
+        with self.assertRaises(TypeError):
+            injected_callable("first", "second")
+
+    def test_parameter_given_twice_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            self.injected_callable("overridden", dependency="other", runtime_arg=3)
+
+    def test_missing_parameter_raises_non_injectable_type_error(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.injected_callable()
+
+    def test_repr(self):
+        self.assertEqual(f"InjectedCallable({my_function!r})", repr(self.injected_callable))
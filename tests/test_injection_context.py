@@ -0,0 +1,81 @@
+import unittest
+from inspect import signature
+from unittest.mock import create_autospec
+
+from opyoid.bindings import BindingRegistry
+from opyoid.exceptions import CyclicDependencyError
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.target import Target
+
+
+class MyType:
+    def __init__(self, arg: str):
+        self.arg = arg
+
+
+class MyOtherType:
+    pass
+
+
+class TestInjectionContext(unittest.TestCase):
+    def setUp(self):
+        self.state = InjectionState(
+            create_autospec(ProviderCreator, spec_set=True),
+            create_autospec(BindingRegistry, spec_set=True),
+        )
+        self.context = InjectionContext(Target(MyType), self.state)
+
+    def test_contexts_with_same_target_and_state_are_equal(self):
+        self.assertEqual(InjectionContext(Target(MyType), self.state), self.context)
+
+    def test_contexts_with_different_states_are_not_equal(self):
+        other_state = InjectionState(self.state.provider_creator, self.state.binding_registry)
+
+        self.assertNotEqual(InjectionContext(Target(MyType), other_state), self.context)
+
+    def test_get_child_context_sets_parent(self):
+        parameter = signature(MyType).parameters["arg"]
+        child_context = self.context.get_child_context(
+            Target(str, "arg"), allow_jit_provider=False, current_class=MyType, current_parameter=parameter
+        )
+
+        self.assertIs(self.context, child_context.parent_context)
+        self.assertIs(self.state, child_context.injection_state)
+        self.assertFalse(child_context.allow_jit_provider)
+        self.assertIs(MyType, child_context.current_class)
+        self.assertIs(parameter, child_context.current_parameter)
+        self.assertIsNone(self.context.current_parameter)
+
+    def test_get_new_state_context_keeps_parent(self):
+        child_context = self.context.get_child_context(Target(MyOtherType))
+        new_state = InjectionState(self.state.provider_creator, self.state.binding_registry, parent_state=self.state)
+
+        new_context = child_context.get_new_state_context(new_state)
+
+        self.assertIs(self.context, new_context.parent_context)
+        self.assertIs(new_state, new_context.injection_state)
+        self.assertEqual(child_context.target, new_context.target)
+
+    def test_cyclic_dependency_raises_exception(self):
+        child_context = self.context.get_child_context(Target(MyOtherType))
+
+        with self.assertRaises(CyclicDependencyError):
+            child_context.get_child_context(Target(MyType))
+
+    def test_same_target_in_other_state_is_not_a_cycle(self):
+        other_state = InjectionState(self.state.provider_creator, self.state.binding_registry)
+        new_context = self.context.get_child_context(Target(MyOtherType)).get_new_state_context(other_state)
+
+        child_context = new_context.get_child_context(Target(MyType))
+
+        self.assertIs(other_state, child_context.injection_state)
+
+    def test_resolved_forward_reference_cycle_raises_exception(self):
+        resolved_context = self.context.get_child_context(Target("MyOtherType"))
+        resolved_context.target.type = MyOtherType
+        child_context = resolved_context.get_child_context(Target(MyType, "arg"))
+
+        with self.assertRaises(CyclicDependencyError):
+            child_context.get_child_context(Target("MyOtherType"))
@@ -1,7 +1,13 @@
+import gc
+import os
 import unittest
+import weakref
+from typing import ClassVar
+from unittest.mock import patch
 
-from opyoid import Injector, Module
-from opyoid.bindings import InstanceBinding
+from opyoid import Injector, Module, named_arg, PerLookupScope
+from opyoid.bindings import InstanceBinding, SelfBinding
+from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
 
 
 class MyType:
@@ -34,3 +40,247 @@ class TestInjector(unittest.TestCase):
             ]
         )
         self.assertIs(my_instance_2, injector.inject(MyType))
+
+    def test_get_provider_returns_scoped_provider(self):
+        injector = Injector(bindings=[SelfBinding(MyType, scope=PerLookupScope)])
+
+        provider = injector.get_provider(MyType)
+
+        self.assertIs(provider, injector.get_provider(MyType))
+        self.assertIsInstance(provider.get(), MyType)
+        self.assertIsNot(provider.get(), provider.get())
+
+    def test_get_provider_with_name(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance, named="my_name")])
+
+        self.assertIs(my_instance, injector.get_provider(MyType, named="my_name").get())
+
+    def test_get_provider_without_binding_raises_error(self):
+        injector = Injector()
+
+        with self.assertRaises(NoBindingFound):
+            injector.get_provider(MyType)
+
+    def test_inject_many_returns_instances_in_order(self):
+        my_instance = MyType()
+        my_named_instance = MyType()
+        injector = Injector(
+            bindings=[
+                InstanceBinding(MyType, my_instance),
+                InstanceBinding(MyType, my_named_instance, named="my_name"),
+                InstanceBinding(str, "my_value"),
+            ]
+        )
+
+        instances = injector.inject_many([str, MyType, (MyType, "my_name"), (str, None)])
+
+        self.assertEqual(("my_value", my_instance, my_named_instance, "my_value"), instances)
+
+    def test_inject_many_without_targets_returns_empty_tuple(self):
+        self.assertEqual((), Injector().inject_many([]))
+
+    def test_inject_many_resolves_all_targets_before_creating_instances(self):
+        created = []
+
+        class MyCreatedType:
+            def __init__(self):
+                created.append(self)
+
+        injector = Injector(bindings=[SelfBinding(MyCreatedType)])
+
+        with self.assertRaises(NoBindingFound):
+            injector.inject_many([MyCreatedType, MyType])
+        self.assertEqual([], created)
+
+    def test_call_injects_parameters(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance)])
+
+        def my_function(my_param: MyType, runtime_arg: int, default_arg: str = "default"):
+            return my_param, runtime_arg, default_arg
+
+        self.assertEqual((my_instance, 3, "default"), injector.call(my_function, runtime_arg=3))
+        self.assertEqual((my_instance, 4, "value"), injector.call(my_function, runtime_arg=4, default_arg="value"))
+
+    def test_call_uses_named_arguments(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance, named="my_name")])
+
+        @named_arg("my_param", "my_name")
+        def my_function(my_param: MyType):
+            return my_param
+
+        self.assertIs(my_instance, injector.call(my_function))
+
+    def test_call_injects_bound_method_parameters(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance)])
+
+        class MyHandler:
+            def handle(self, my_param: MyType, runtime_arg: int):
+                return self, my_param, runtime_arg
+
+        handler = MyHandler()
+        other_instance = MyType()
+
+        self.assertEqual((handler, my_instance, 3), injector.call(handler.handle, runtime_arg=3))
+        self.assertEqual((handler, other_instance, 4), injector.call(handler.handle, other_instance, 4))
+
+    def test_call_does_not_keep_bound_method_instances(self):
+        injector = Injector(bindings=[SelfBinding(MyType)])
+
+        class MyHandler:
+            def handle(self, my_param: MyType):
+                return my_param
+
+        handler = MyHandler()
+        handler_reference = weakref.ref(handler)
+        injector.call(handler.handle)
+        del handler
+        gc.collect()
+
+        self.assertIsNone(handler_reference())
+
+    def test_call_without_required_parameter_raises_error(self):
+        injector = Injector()
+
+        def my_function(my_param: MyType):
+            return my_param
+
+        with self.assertRaises(NonInjectableTypeError):
+            injector.call(my_function)
+
+    @patch.dict(os.environ, {"MY_FUNCTION_MY_PARAM": "3"})
+    def test_call_injects_env_vars(self):
+        def my_function(my_param: int):
+            return my_param
+
+        self.assertEqual(3, Injector().call(my_function))
+
+    def test_register_updates_call_parameters(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[SelfBinding(MyType)])
+
+        def my_function(my_param: MyType):
+            return my_param
+
+        injector.call(my_function)
+        injector.register(bindings=[InstanceBinding(MyType, my_instance)])
+
+        self.assertIs(my_instance, injector.call(my_function))
+
+    def test_injected_decorator(self):
+        my_instance = MyType()
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance)])
+
+        @injector.injected
+        def my_function(my_param: MyType, runtime_arg: int):
+            return my_param, runtime_arg
+
+        other_instance = MyType()
+        self.assertEqual((my_instance, 3), my_function(runtime_arg=3))  # pylint: disable=no-value-for-parameter
+        self.assertEqual((other_instance, 4), my_function(other_instance, 4))
+        self.assertEqual("my_function", my_function.__name__)
+
+    def test_inject_members_sets_annotated_members(self):
+        my_instance = MyType()
+
+        class MyParentClass:
+            my_parent_param: MyType
+
+        class MyClass(MyParentClass):
+            my_param: MyType
+            my_value: str = "default"
+            my_class_value: ClassVar[MyType]
+
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance), InstanceBinding(str, "value")])
+        instance = MyClass()
+
+        self.assertIs(instance, injector.inject_members(instance))
+        self.assertEqual({"my_param": my_instance, "my_parent_param": my_instance}, vars(instance))
+
+    def test_inject_members_sets_slots(self):
+        my_instance = MyType()
+
+        class MyClass:
+            __slots__ = ("my_param",)
+            my_param: MyType
+
+        injector = Injector(bindings=[InstanceBinding(MyType, my_instance)])
+
+        self.assertIs(my_instance, injector.inject_members(MyClass()).my_param)
+
+    def test_inject_members_without_binding_raises_error(self):
+        class MyClass:
+            my_param: MyType
+
+        with self.assertRaises(NonInjectableTypeError):
+            Injector().inject_members(MyClass())
+
+    def test_register_updates_injected_members(self):
+        my_instance = MyType()
+
+        class MyClass:
+            my_param: MyType
+
+        injector = Injector(bindings=[SelfBinding(MyType)])
+        injector.inject_members(MyClass())
+        injector.register(bindings=[InstanceBinding(MyType, my_instance)])
+
+        self.assertIs(my_instance, injector.inject_members(MyClass()).my_param)
+
+    def test_register_adds_binding(self):
+        my_instance = MyType()
+        injector = Injector()
+
+        injector.register(bindings=[InstanceBinding(MyType, my_instance)])
+
+        self.assertIs(my_instance, injector.inject(MyType))
+
+    def test_register_adds_module(self):
+        my_instance = MyType()
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyType, to_instance=my_instance)
+
+        injector = Injector()
+        injector.register([MyModule])
+
+        self.assertIs(my_instance, injector.inject(MyType))
+
+    def test_register_overrides_binding_and_dependents(self):
+        class MyParentType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        class MyOtherType:
+            pass
+
+        my_instance = MyType()
+        injector = Injector(
+            bindings=[InstanceBinding(MyType, MyType()), SelfBinding(MyParentType), SelfBinding(MyOtherType)]
+        )
+        parent_instance = injector.inject(MyParentType)
+        other_instance = injector.inject(MyOtherType)
+
+        injector.register(bindings=[InstanceBinding(MyType, my_instance)])
+
+        new_parent_instance = injector.inject(MyParentType)
+        self.assertIsNot(parent_instance, new_parent_instance)
+        self.assertIs(my_instance, new_parent_instance.my_param)
+        self.assertIs(other_instance, injector.inject(MyOtherType))
+
+    def test_register_named_binding_replaces_unnamed_parameter(self):
+        class MyParentType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        my_instance = MyType()
+        injector = Injector(bindings=[SelfBinding(MyType), SelfBinding(MyParentType)])
+        self.assertIsNot(my_instance, injector.inject(MyParentType).my_param)
+
+        injector.register(bindings=[InstanceBinding(MyType, my_instance, named="my_param")])
+
+        self.assertIs(my_instance, injector.inject(MyParentType).my_param)
@@ -0,0 +1,47 @@
+import threading
+import unittest
+from unittest.mock import create_autospec, Mock
+
+from opyoid import Lazy, Provider
+
+
+class MyType:
+    pass
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        self.provider = create_autospec(Provider, spec_set=True)
+        self.provider.get.side_effect = MyType
+        self.provider_getter = Mock(return_value=self.provider)
+        self.lazy = Lazy(self.provider_getter)
+
+    def test_provider_is_resolved_on_first_get(self):
+        self.provider_getter.assert_not_called()
+
+        instance = self.lazy.get()
+
+        self.assertIsInstance(instance, MyType)
+        self.provider_getter.assert_called_once_with()
+
+    def test_instance_is_memoized(self):
+        self.assertIs(self.lazy.get(), self.lazy.get())
+        self.provider_getter.assert_called_once_with()
+        self.provider.get.assert_called_once_with()
+
+    def test_concurrent_gets_create_one_instance(self):
+        instances = []
+        threads = [threading.Thread(target=lambda: instances.append(self.lazy.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(5, len(instances))
+        self.assertEqual(1, len({id(instance) for instance in instances}))
+        self.provider.get.assert_called_once_with()
+
+    def test_repr(self):
+        self.assertEqual("Lazy(not created)", repr(self.lazy))
+        self.lazy.get()
+        self.assertEqual("Lazy(created)", repr(self.lazy))
@@ -0,0 +1,75 @@
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from opyoid import Module, SelfBinding
+from opyoid.__main__ import main
+
+
+class MyType:
+    pass
+
+
+class MyParentType:
+    def __init__(self, my_param: MyType):
+        self.my_param = my_param
+
+
+class MyForwardReferenceType:
+    def __init__(self, my_param: "MyUnknownType"):  # type: ignore[name-defined]
+        self.my_param = my_param
+
+
+class MyModule(Module):
+    def configure(self) -> None:
+        self.bind(MyParentType)
+
+
+class MyForwardReferenceModule(Module):
+    def configure(self) -> None:
+        self.bind(MyForwardReferenceType)
+
+
+my_bindings = [SelfBinding(MyType)]
+MY_INVALID_VALUE = 3
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.stdout = StringIO()
+        self.stderr = StringIO()
+
+    def run_main(self, *arguments: str) -> int:
+        with redirect_stdout(self.stdout), redirect_stderr(self.stderr):
+            return main(arguments)
+
+    def test_check_valid_graph(self):
+        self.assertEqual(0, self.run_main("check", f"{__name__}:MyModule", f"{__name__}:my_bindings"))
+        self.assertEqual("No errors found\n", self.stdout.getvalue())
+        self.assertEqual("", self.stderr.getvalue())
+
+    def test_check_reports_missing_bindings(self):
+        self.assertEqual(1, self.run_main("check", f"{__name__}:MyModule"))
+        self.assertEqual(
+            f"error: Could not find a binding for my_param: {__name__}.MyType required by {__name__}.MyParentType\n"
+            "1 error(s) found\n",
+            self.stderr.getvalue(),
+        )
+
+    def test_check_with_auto_bindings(self):
+        self.assertEqual(0, self.run_main("check", "--auto-bindings", "--no-env-vars", f"{__name__}:MyModule"))
+
+    def test_check_with_invalid_path(self):
+        self.assertEqual(2, self.run_main("check", __name__))
+        self.assertEqual(2, self.run_main("check", f"{__name__}:MyUnknownModule"))
+        self.assertEqual(2, self.run_main("check", f"{__name__}:MY_INVALID_VALUE"))
+        self.assertEqual(3, len(self.stderr.getvalue().splitlines()))
+
+    def test_check_reports_missing_forward_reference(self):
+        self.assertEqual(1, self.run_main("check", f"{__name__}:MyForwardReferenceModule"))
+        self.assertEqual(
+            "error: Could not find a binding for my_param: MyUnknownType required by "
+            f"{__name__}.MyForwardReferenceType\n"
+            "1 error(s) found\n",
+            self.stderr.getvalue(),
+        )
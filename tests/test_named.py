@@ -1,5 +1,6 @@
 import unittest
 from inspect import signature
+from typing import Union
 
 from opyoid.exceptions import NamedError
 from opyoid.named import Named, named_arg
@@ -61,3 +62,47 @@ class TestNamed(unittest.TestCase):
                 @named_arg("my_param", "my_name")
                 def __init__(self, my_param):
                     self.my_param = my_param
+
+    def test_same_named_class_is_reused(self):
+        class MyClass:
+            @named_arg("my_param", "my_name")
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        class MyOtherClass:
+            @named_arg("my_param", "my_name")
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        self.assertIs(
+            signature(MyClass.__init__).parameters["my_param"].annotation,
+            signature(MyOtherClass.__init__).parameters["my_param"].annotation,
+        )
+
+    def test_get_named_class_by_type_and_name(self):
+        named_class = Named.get_named_class(MyType, "my_name")
+
+        self.assertIs(named_class, Named.get_named_class(MyType, "my_name"))
+        self.assertIsNot(named_class, Named.get_named_class(MyType, "my_other_name"))
+        self.assertIsNot(named_class, Named.get_named_class(MyOtherType, "my_name"))
+        self.assertIsNot(named_class, Named.get_named_class("MyType", "my_name"))
+
+    def test_named_union_classes_keep_the_member_order(self):
+        class MyClass:
+            @named_arg("my_param", "my_name")
+            def __init__(self, my_param: Union[MyType, MyOtherType]):
+                self.my_param = my_param
+
+        class MyOtherClass:
+            @named_arg("my_param", "my_name")
+            def __init__(self, my_param: Union[MyOtherType, MyType]):
+                self.my_param = my_param
+
+        self.assertEqual(
+            (MyOtherType, MyType),
+            signature(MyOtherClass.__init__).parameters["my_param"].annotation.original_type.__args__,
+        )
+        self.assertIsNot(
+            signature(MyClass.__init__).parameters["my_param"].annotation,
+            signature(MyOtherClass.__init__).parameters["my_param"].annotation,
+        )
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import create_autospec
 
 from opyoid import InjectException, NonInjectableTypeError, Provider, Target
+from opyoid.frozen_target import FrozenTarget
 from opyoid.provider_registry import ProviderRegistry
 
 
@@ -74,3 +75,65 @@ class TestProviderRegistry(unittest.TestCase):
 
         with self.assertRaises(NonInjectableTypeError):
             self.registry.get_provider(Target("MyNewType"))
+
+    def test_get_missing_binding_returns_error_message(self):
+        self.registry.set_missing_binding(self.target, True, 3, "my error")
+
+        self.assertEqual("my error", self.registry.get_missing_binding(self.target, True, 3))
+
+    def test_get_missing_binding_for_unknown_target_returns_none(self):
+        self.registry.set_missing_binding(self.target, True, 3, "my error")
+
+        self.assertIsNone(self.registry.get_missing_binding(self.named_target, True, 3))
+        self.assertIsNone(self.registry.get_missing_binding(self.target, False, 3))
+
+    def test_get_missing_binding_from_other_generation_returns_none(self):
+        self.registry.set_missing_binding(self.target, True, 3, "my error")
+
+        self.assertIsNone(self.registry.get_missing_binding(self.target, True, 4))
+
+    def test_set_provider_removes_missing_binding(self):
+        self.registry.set_missing_binding(self.target, False, 3, "my error")
+        self.registry.set_missing_binding(self.target, True, 3, "my error")
+
+        self.registry.set_provider(self.target, self.provider_1)
+
+        self.assertIsNone(self.registry.get_missing_binding(self.target, False, 3))
+        self.assertIsNone(self.registry.get_missing_binding(self.target, True, 3))
+
+    def test_add_dependency_records_both_directions(self):
+        self.registry.add_dependency(self.target, self.other_target)
+        self.registry.add_dependency(self.named_target, self.other_target)
+
+        self.assertEqual(
+            {FrozenTarget(MyType), FrozenTarget(MyType, "my_name")},
+            self.registry.get_dependents(FrozenTarget(MyOtherType)),
+        )
+        self.assertEqual({FrozenTarget(MyOtherType)}, self.registry.get_dependencies(FrozenTarget(MyType)))
+        self.assertEqual(set(), self.registry.get_dependencies(FrozenTarget(MyOtherType)))
+        self.assertEqual(set(), self.registry.get_dependents(FrozenTarget(MyType)))
+
+    def test_get_transitive_dependents(self):
+        self.registry.add_dependency(self.named_target, self.target)
+        self.registry.add_dependency(self.target, self.other_target)
+        self.registry.add_dependency(Target(str), self.named_target)
+
+        self.assertEqual(
+            {FrozenTarget(MyType), FrozenTarget(MyType, "my_name"), FrozenTarget(str)},
+            self.registry.get_transitive_dependents([FrozenTarget(MyOtherType)]),
+        )
+        self.assertEqual(
+            {FrozenTarget(str)}, self.registry.get_transitive_dependents([FrozenTarget(MyType, "my_name")])
+        )
+
+    def test_remove_provider_removes_its_dependencies(self):
+        self.registry.set_provider(self.target, self.provider_1)
+        self.registry.add_dependency(self.target, self.other_target)
+        self.registry.add_dependency(self.named_target, self.target)
+
+        self.registry.remove_provider(FrozenTarget(MyType))
+
+        self.assertIsNone(self.registry.get_provider(self.target))
+        self.assertEqual(set(), self.registry.get_dependencies(FrozenTarget(MyType)))
+        self.assertEqual(set(), self.registry.get_dependents(FrozenTarget(MyOtherType)))
+        self.assertEqual({FrozenTarget(MyType, "my_name")}, self.registry.get_dependents(FrozenTarget(MyType)))
@@ -1,6 +1,9 @@
+import os
+import threading
 import unittest
-from typing import List, Optional, Set, Tuple, Type
-from unittest.mock import ANY, create_autospec
+from inspect import signature
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type
+from unittest.mock import ANY, create_autospec, patch
 
 from opyoid import AbstractModule, Provider, SelfBinding
 from opyoid.bindings import (
@@ -9,18 +12,26 @@ from opyoid.bindings import (
     FromCallableProvider,
     FromInstanceProvider,
     InstanceBinding,
+    LazyIterable,
+    LazyIterableProvider,
+    LazyMapping,
+    LazyMappingProvider,
     ListProvider,
+    MapBinding,
     MultiBinding,
     ProviderBinding,
 )
 from opyoid.bindings.multi_binding import ItemBinding
 from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.registered_map_binding import RegisteredMapBinding
 from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
 from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
+from opyoid.frozen_target import FrozenTarget
 from opyoid.injection_context import InjectionContext
 from opyoid.injection_state import InjectionState
 from opyoid.providers import ProviderCreator
-from opyoid.scopes import SingletonScope
+from opyoid.providers.providers_factories import MissingBindingProviderFactory
+from opyoid.scopes import ImmediateScope, PerLookupScope, SingletonScope, SingletonScopedProvider
 from opyoid.target import Target
 
 
@@ -86,6 +97,101 @@ class TestProviderCreator(unittest.TestCase):
         instance = provider.get()
         self.assertIs(self.named_instance, instance)
 
+    def test_get_provider_records_dependencies(self):
+        class MyParentClass:
+            def __init__(self, my_param: List[MyType]):
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding, self.module))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentClass), self.module))
+        context = InjectionContext(Target(MyParentClass), self.state)
+
+        self.provider_creator.get_provider(context)
+
+        provider_registry = self.state.provider_registry
+        self.assertEqual(
+            {FrozenTarget(List[MyType], "my_param"), FrozenTarget(List[MyType]), FrozenTarget(SingletonScope)},
+            provider_registry.get_dependencies(FrozenTarget(MyParentClass)),
+        )
+        self.assertIn(FrozenTarget(MyType), provider_registry.get_dependencies(FrozenTarget(List[MyType])))
+        self.assertIn(FrozenTarget(MyParentClass), provider_registry.get_transitive_dependents([FrozenTarget(MyType)]))
+
+    def test_missing_binding_provider_factory_is_used_last(self):
+        class MyParentClass:
+            def __init__(self, my_param: Optional[MyType], my_other_param: MyOtherType):
+                self.my_param = my_param
+                self.my_other_param = my_other_param
+
+        missing_binding_provider_factory = MissingBindingProviderFactory()
+        provider_creator = ProviderCreator(missing_binding_provider_factory)
+        self.binding_registry.register(RegisteredBinding(self.my_other_instance_binding, self.module))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentClass), self.module))
+        context = InjectionContext(Target(MyParentClass), InjectionState(provider_creator, self.binding_registry))
+
+        provider_creator.get_provider(context)
+
+        self.assertEqual([Target(Optional[MyType])], missing_binding_provider_factory.missing_targets)
+
+    def test_missing_binding_is_cached(self):
+        with self.assertRaises(NoBindingFound):
+            self.provider_creator.get_provider(self.context)
+
+        with patch.object(self.binding_registry, "get_binding", wraps=self.binding_registry.get_binding) as get_binding:
+            with self.assertRaises(NoBindingFound):
+                self.provider_creator.get_provider(InjectionContext(Target(MyType), self.state))
+
+        get_binding.assert_not_called()
+
+    def test_missing_binding_cache_is_invalidated_by_registration(self):
+        with self.assertRaises(NoBindingFound):
+            self.provider_creator.get_provider(self.context)
+
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding, self.module))
+
+        provider = self.provider_creator.get_provider(InjectionContext(Target(MyType), self.state))
+        self.assertIs(self.my_instance, provider.get())
+
+    def test_missing_binding_cache_is_not_invalidated_by_other_registries(self):
+        with self.assertRaises(NoBindingFound):
+            self.provider_creator.get_provider(self.context)
+
+        BindingRegistry().register(RegisteredBinding(self.my_instance_binding, self.module))
+
+        with patch.object(self.binding_registry, "get_binding", wraps=self.binding_registry.get_binding) as get_binding:
+            with self.assertRaises(NoBindingFound):
+                self.provider_creator.get_provider(InjectionContext(Target(MyType), self.state))
+
+        get_binding.assert_not_called()
+
+    def test_missing_binding_cache_is_invalidated_by_parent_state_registration(self):
+        child_state = InjectionState(self.provider_creator, BindingRegistry(), parent_state=self.state)
+        with self.assertRaises(NoBindingFound):
+            self.provider_creator.get_provider(InjectionContext(Target(MyType), child_state))
+
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding, self.module))
+
+        provider = self.provider_creator.get_provider(InjectionContext(Target(MyType), child_state))
+        self.assertIs(self.my_instance, provider.get())
+
+    def test_missing_binding_is_not_cached_for_env_var_parameters(self):
+        class MyParentClass:
+            def __init__(self, my_param: str):
+                self.my_param = my_param
+
+        parameter_context = self.context.get_child_context(
+            Target(str, "my_param"),
+            allow_jit_provider=False,
+            current_class=MyParentClass,
+            current_parameter=signature(MyParentClass).parameters["my_param"],
+        )
+        with self.assertRaises(NoBindingFound):
+            self.provider_creator.get_provider(parameter_context)
+
+        with patch.dict(os.environ, {"MY_PARENT_CLASS_MY_PARAM": "my_value"}):
+            provider = self.provider_creator.get_provider(parameter_context)
+
+        self.assertEqual("my_value", provider.get())
+
     def test_missing_binding_raises_exception(self):
         class MyParentClass:
             def __init__(self, my_param: MyType):
@@ -176,10 +282,11 @@ class TestProviderCreator(unittest.TestCase):
         )
         context = InjectionContext(Target(Set[MyType]), self.state)
         provider = self.provider_creator.get_provider(context)
-        self.assertIsInstance(provider, FromCallableProvider)
+        self.assertIsInstance(provider, SingletonScopedProvider)
         set_instance = provider.get()
         self.assertIn(self.my_instance, set_instance)
         self.assertEqual(2, len(set_instance))
+        self.assertIs(set_instance, provider.get())
 
     def test_tuple_binding_with_multi_binding(self):
         self.binding_registry.register(
@@ -200,10 +307,95 @@ class TestProviderCreator(unittest.TestCase):
         )
         context = InjectionContext(Target(Tuple[MyType]), self.state)
         provider = self.provider_creator.get_provider(context)
-        self.assertIsInstance(provider, FromCallableProvider)
+        self.assertIsInstance(provider, SingletonScopedProvider)
         tuple_instance = provider.get()
         self.assertEqual((self.my_instance, ANY), tuple_instance)
         self.assertIsInstance(tuple_instance[1], MyType)
+        self.assertIs(tuple_instance, provider.get())
+
+    def test_tuple_binding_with_per_lookup_multi_binding(self):
+        self.binding_registry.register(
+            RegisteredBinding(InstanceBinding(PerLookupScope, PerLookupScope()), self.module)
+        )
+        self.binding_registry.register(
+            RegisteredMultiBinding(
+                MultiBinding(MyType, [ItemBinding(bound_class=MyType)], scope=PerLookupScope),
+                self.module,
+                item_bindings=[RegisteredBinding(SelfBinding(MyType, scope=PerLookupScope), self.module)],
+            )
+        )
+        context = InjectionContext(Target(Tuple[MyType]), self.state)
+        provider = self.provider_creator.get_provider(context)
+        self.assertIsInstance(provider, FromCallableProvider)
+        self.assertIsNot(provider.get()[0], provider.get()[0])
+
+    def test_tuple_binding_without_multi_binding_is_not_scoped(self):
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding, self.module))
+        context = InjectionContext(Target(Tuple[MyType]), self.state)
+        provider = self.provider_creator.get_provider(context)
+        self.assertIsInstance(provider, FromCallableProvider)
+        self.assertEqual((self.my_instance,), provider.get())
+
+    def test_iterable_binding_with_multi_binding(self):
+        self.binding_registry.register(
+            RegisteredMultiBinding(
+                MultiBinding(MyType, [ItemBinding(bound_class=MyType), ItemBinding(bound_instance=self.my_instance)]),
+                self.module,
+                item_bindings=[
+                    RegisteredBinding(SelfBinding(MyType), self.module),
+                    RegisteredBinding(InstanceBinding(MyType, self.my_instance), self.module),
+                ],
+            )
+        )
+        context = InjectionContext(Target(Iterable[MyType]), self.state)
+
+        provider = self.provider_creator.get_provider(context)
+
+        self.assertIsInstance(provider, LazyIterableProvider)
+        iterable = provider.get()
+        self.assertIsInstance(iterable, LazyIterable)
+        items = list(iterable)
+        self.assertEqual(2, len(items))
+        self.assertIs(self.my_instance, items[1])
+
+    def test_iterable_binding_with_list_instance_binding(self):
+        self.binding_registry.register(
+            RegisteredBinding(InstanceBinding(List[MyType], [self.my_instance]), self.module)
+        )
+        context = InjectionContext(Target(Iterable[MyType]), self.state)
+
+        provider = self.provider_creator.get_provider(context)
+
+        self.assertEqual([self.my_instance], provider.get())
+
+    def test_mapping_binding_with_map_binding(self):
+        self.binding_registry.register(
+            RegisteredMapBinding(
+                MapBinding(str, MyType, {"class": ItemBinding(bound_class=MyType)}),
+                self.module,
+                item_bindings={"class": RegisteredBinding(SelfBinding(MyType), self.module)},
+            )
+        )
+        context = InjectionContext(Target(Mapping[str, MyType]), self.state)
+
+        provider = self.provider_creator.get_provider(context)
+
+        self.assertIsInstance(provider, LazyMappingProvider)
+        mapping = provider.get()
+        self.assertIsInstance(mapping, LazyMapping)
+        self.assertIsInstance(mapping["class"], MyType)
+        dict_provider = self.provider_creator.get_provider(InjectionContext(Target(Dict[str, MyType]), self.state))
+        self.assertIs(mapping["class"], dict_provider.get()["class"])
+
+    def test_mapping_binding_with_dict_instance_binding(self):
+        self.binding_registry.register(
+            RegisteredBinding(InstanceBinding(Dict[str, MyType], {"key": self.my_instance}), self.module)
+        )
+        context = InjectionContext(Target(Mapping[str, MyType]), self.state)
+
+        provider = self.provider_creator.get_provider(context)
+
+        self.assertEqual({"key": self.my_instance}, provider.get())
 
     def test_optional_binding(self):
         self.binding_registry.register(RegisteredBinding(self.my_instance_binding, self.module))
@@ -279,3 +471,27 @@ class TestProviderCreator(unittest.TestCase):
         self.assertIsInstance(provider, ListProvider)
         list_instance = provider.get()
         self.assertEqual([instance], list_instance)
+
+    def test_immediate_scoped_instances_are_created_after_releasing_the_lock(self):
+        other_thread_providers = []
+
+        class MyImmediateType:
+            def __init__(inner_self):  # pylint: disable=no-self-argument
+                thread = threading.Thread(
+                    target=lambda: other_thread_providers.append(self.provider_creator.get_provider(self.other_context))
+                )
+                thread.start()
+                thread.join(5)
+
+        self.binding_registry.register(
+            RegisteredBinding(InstanceBinding(ImmediateScope, ImmediateScope()), self.module)
+        )
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyOtherType), self.module))
+        self.binding_registry.register(
+            RegisteredBinding(SelfBinding(MyImmediateType, scope=ImmediateScope), self.module)
+        )
+        context = InjectionContext(Target(MyImmediateType), self.state)
+
+        self.provider_creator.get_provider(context)
+
+        self.assertEqual(1, len(other_thread_providers))
@@ -0,0 +1,88 @@
+import unittest
+from inspect import signature
+from typing import Any
+
+from opyoid import AssistedFactory, InjectorOptions, SelfBinding, SingletonScope
+from opyoid.bindings import BindingRegistry, InstanceBinding, RegisteredBinding
+from opyoid.exceptions import IncompatibleProviderFactory, NonInjectableTypeError
+from opyoid.frozen_target import FrozenTarget
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.providers.providers_factories import AssistedFactoryProviderFactory
+from opyoid.target import Target
+
+
+class MyDependency:
+    pass
+
+
+class MyType:
+    def __init__(self, dependency: MyDependency, name: str, runtime_arg: float, *args, optional_arg: int = 0):
+        self.dependency = dependency
+        self.name = name
+        self.runtime_arg = runtime_arg
+        self.args = args
+        self.optional_arg = optional_arg
+
+
+class MyParentType:
+    def __init__(self, my_factory: AssistedFactory[MyType]):
+        self.my_factory = my_factory
+
+
+class MyPositionalOnlyType:
+    def __init__(self, arg: int, /):
+        self.arg = arg
+
+
+class TestAssistedFactoryProviderFactory(unittest.TestCase):
+    def setUp(self):
+        self.provider_factory = AssistedFactoryProviderFactory()
+        self.binding_registry = BindingRegistry()
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(SingletonScope, SingletonScope()), None))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyDependency), None))
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(str, "my_name", named="name"), None))
+        self.state = InjectionState(ProviderCreator(), self.binding_registry, InjectorOptions(auto_bindings=True))
+
+    def test_create_returns_factory_with_injected_parameters(self):
+        context = InjectionContext(Target(AssistedFactory[MyType]), self.state)
+
+        factory = self.provider_factory.create(context).get()
+
+        self.assertIsInstance(factory, AssistedFactory)
+        self.assertEqual(frozenset(["runtime_arg"]), factory.assisted_parameter_names)
+        instance = factory(runtime_arg=1.5)
+        self.assertIsInstance(instance.dependency, MyDependency)
+        self.assertEqual("my_name", instance.name)
+        self.assertEqual(1.5, instance.runtime_arg)
+        self.assertEqual((), instance.args)
+        self.assertEqual(0, instance.optional_arg)
+        self.assertIn(
+            FrozenTarget(MyDependency),
+            self.state.provider_registry.get_dependencies(FrozenTarget(AssistedFactory[MyType])),
+        )
+
+    def test_env_vars_are_looked_up_for_the_injected_class(self):
+        self.state.env_vars = {"MY_PARENT_TYPE_RUNTIME_ARG": "2.5", "MY_TYPE_OPTIONAL_ARG": "3"}
+        parent_context = InjectionContext(Target(MyParentType), self.state, current_class=MyParentType)
+        context: InjectionContext[Any] = parent_context.get_child_context(
+            Target(AssistedFactory[MyType]),
+            current_class=MyParentType,
+            current_parameter=signature(MyParentType).parameters["my_factory"],
+        )
+
+        factory = self.provider_factory.create(context).get()
+
+        self.assertEqual(frozenset(["runtime_arg"]), factory.assisted_parameter_names)
+        self.assertEqual(3, factory(runtime_arg=1.5).optional_arg)
+
+    def test_positional_only_parameter_raises_exception(self):
+        context = InjectionContext(Target(AssistedFactory[MyPositionalOnlyType]), self.state)
+
+        with self.assertRaises(NonInjectableTypeError):
+            self.provider_factory.create(context)
+
+    def test_other_type_raises_incompatible_provider_factory(self):
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(InjectionContext(Target(MyType), self.state))
@@ -49,7 +49,6 @@ class TestFromBindingsProviderFactory(unittest.TestCase):
         self.binding_registry.__contains__.side_effect = [
             False,
             True,
-            False,
         ]
 
         self.assertTrue(self.provider_factory.create(self.str_context))
@@ -57,11 +56,26 @@ class TestFromBindingsProviderFactory(unittest.TestCase):
             [
                 call(Target(str)),
                 call(Target(str)),
-                call(Target(str)),
             ],
             self.binding_registry.__contains__.call_args_list,
         )
 
+    def test_create_with_binding_in_ancestor_state_uses_its_state(self):
+        registry = create_autospec(BindingRegistry, spec_set=True)
+        registry.__contains__.return_value = False
+        middle_provider_creator = create_autospec(ProviderCreator, spec_set=True)
+        top_provider_creator = create_autospec(ProviderCreator, spec_set=True)
+        top_state = InjectionState(top_provider_creator, self.binding_registry)
+        middle_state = InjectionState(middle_provider_creator, registry, parent_state=top_state)
+        state = InjectionState(self.provider_creator, registry, parent_state=middle_state)
+        self.binding_registry.__contains__.return_value = True
+
+        provider = self.provider_factory.create(InjectionContext(Target(str), state))
+
+        self.assertIs(top_provider_creator.get_provider.return_value, provider)
+        self.assertIs(top_state, top_provider_creator.get_provider.call_args[0][0].injection_state)
+        middle_provider_creator.get_provider.assert_not_called()
+
     def test_create_creates_provider_for_instance_binding(self):
         binding = InstanceBinding(MyType, MyType())
         self.binding_registry.get_binding.return_value = RegisteredBinding(binding, self.module)
@@ -0,0 +1,102 @@
+import unittest
+from inspect import signature
+from typing import Any, Dict, List, Optional, Set, Tuple
+from unittest.mock import create_autospec
+
+from opyoid import DictConfigSource, InjectorOptions
+from opyoid.bindings import BindingRegistry
+from opyoid.exceptions import IncompatibleProviderFactory
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.providers.providers_factories import FromConfigSourceProviderFactory
+from opyoid.target import Target
+
+
+class MyType:
+    def __init__(self, arg: int):
+        self.arg = arg
+
+
+class TestFromConfigSourceProviderFactory(unittest.TestCase):
+    def setUp(self):
+        self.provider_factory = FromConfigSourceProviderFactory()
+        self.config_source = DictConfigSource({"MyType": {"arg": 3}})
+        self.other_config_source = DictConfigSource({"MyType": {"arg": 4, "other_arg": 5}})
+        self.state = InjectionState(
+            create_autospec(ProviderCreator, spec_set=True),
+            create_autospec(BindingRegistry, spec_set=True),
+            InjectorOptions(config_sources=[self.config_source, self.other_config_source]),
+        )
+
+    def get_context(self, target: Target[Any], parameter_name: str = "arg") -> InjectionContext[Any]:
+        return InjectionContext(
+            target,
+            self.state,
+            current_class=MyType,
+            current_parameter=signature(MyType).parameters["arg"].replace(name=parameter_name),
+        )
+
+    def test_first_source_with_value_is_used(self):
+        self.assertEqual(3, self.provider_factory.create(self.get_context(Target(int, "arg"))).get())
+        self.assertEqual(5, self.provider_factory.create(self.get_context(Target(int), "other_arg")).get())
+
+    def test_values_are_converted(self):
+        self.state.options.config_sources = [
+            DictConfigSource(
+                {
+                    "MyType": {
+                        "string_int": "3",
+                        "int_float": 2,
+                        "string_bool": "1",
+                        "items": ["1", 2],
+                        "tags": ["a", "a"],
+                        "pairs": [1.5],
+                        "weights": {"a": "1"},
+                    }
+                }
+            )
+        ]
+
+        self.assertEqual(3, self.provider_factory.create(self.get_context(Target(int), "string_int")).get())
+        self.assertEqual(2.0, self.provider_factory.create(self.get_context(Target(float), "int_float")).get())
+        self.assertIs(True, self.provider_factory.create(self.get_context(Target(bool), "string_bool")).get())
+        self.assertEqual([1, 2], self.provider_factory.create(self.get_context(Target(List[int]), "items")).get())
+        self.assertEqual({"a"}, self.provider_factory.create(self.get_context(Target(Set[str]), "tags")).get())
+        self.assertEqual(
+            (1.5,), self.provider_factory.create(self.get_context(Target(Tuple[float, ...]), "pairs")).get()
+        )
+        self.assertEqual(
+            {"a": 1}, self.provider_factory.create(self.get_context(Target(Dict[str, int]), "weights")).get()
+        )
+
+    def test_tuple_items_are_converted_by_position(self):
+        self.state.options.config_sources = [DictConfigSource({"MyType": {"pair": ["1", "a"], "triple": [1, 2, 3]}})]
+
+        self.assertEqual(
+            (1, "a"), self.provider_factory.create(self.get_context(Target(Tuple[int, str]), "pair")).get()
+        )
+        with self.assertRaises(ValueError):
+            self.provider_factory.create(self.get_context(Target(Tuple[int, int]), "triple"))
+
+    def test_invalid_value_raises_value_error(self):
+        self.state.options.config_sources = [DictConfigSource({"MyType": {"arg": [1], "arg_list": 1}})]
+
+        with self.assertRaises(ValueError):
+            self.provider_factory.create(self.get_context(Target(int)))
+        with self.assertRaises(ValueError):
+            self.provider_factory.create(self.get_context(Target(List[int]), "arg_list"))
+
+    def test_unsupported_type_raises_incompatible_provider_factory(self):
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(self.get_context(Target(MyType)))
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(self.get_context(Target(Optional[int])))
+
+    def test_missing_value_raises_incompatible_provider_factory(self):
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(self.get_context(Target(int), "unknown_arg"))
+
+    def test_no_parameter_raises_incompatible_provider_factory(self):
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(InjectionContext(Target(int), self.state))
@@ -4,6 +4,7 @@ from inspect import signature
 from unittest.mock import create_autospec
 
 from opyoid.bindings import BindingRegistry
+from opyoid.exceptions import IncompatibleProviderFactory
 from opyoid.injection_context import InjectionContext
 from opyoid.injection_state import InjectionState
 from opyoid.providers import ProviderCreator
@@ -34,3 +35,23 @@ class TestFromEnvVarProviderFactory(unittest.TestCase):
         os.environ["MY_TYPE_ARG"] = "invalid_value"
         with self.assertRaises(ValueError):
             self.provider_factory.create(self.context)
+
+    def test_env_vars_are_read_from_state(self):
+        self.state.env_vars = {"MY_TYPE_ARG": "true"}
+
+        provider = self.provider_factory.create(self.context)
+
+        self.assertTrue(provider.get())
+
+    def test_missing_env_var_raises_incompatible_provider_factory(self):
+        self.state.env_vars = {}
+
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(self.context)
+
+    def test_get_env_var_name(self):
+        self.assertEqual("MY_TYPE_ARG", FromEnvVarProviderFactory.get_env_var_name("MyType", "arg"))
+        self.assertEqual(
+            "HTTP_CLIENT_MAX_RETRIES", FromEnvVarProviderFactory.get_env_var_name("HTTPClient", "maxRetries")
+        )
+        self.assertEqual("CLIENT_2_PORT_1", FromEnvVarProviderFactory.get_env_var_name("Client2", "port1"))
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Lazy
+from opyoid.bindings import BindingRegistry, FromInstanceProvider, InstanceBinding, RegisteredBinding
+from opyoid.exceptions import IncompatibleProviderFactory, NoBindingFound
+from opyoid.frozen_target import FrozenTarget
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.providers.providers_factories import LazyProvider, LazyProviderFactory
+from opyoid.target import Target
+
+
+class MyType:
+    pass
+
+
+class TestLazyProviderFactory(unittest.TestCase):
+    def setUp(self):
+        self.provider_factory = LazyProviderFactory()
+        self.provider_creator = create_autospec(ProviderCreator, spec_set=True)
+        self.binding_registry = BindingRegistry()
+        self.state = InjectionState(self.provider_creator, self.binding_registry)
+        self.provider = FromInstanceProvider(MyType())
+        self.provider_creator.get_provider.return_value = self.provider
+
+    def test_create_does_not_resolve_wrapped_provider(self):
+        context = InjectionContext(Target(Lazy[MyType]), self.state)
+
+        provider = self.provider_factory.create(context)
+
+        self.assertIsInstance(provider, LazyProvider)
+        self.provider_creator.get_provider.assert_not_called()
+        self.assertEqual(
+            {FrozenTarget(MyType)}, self.state.provider_registry.get_dependencies(FrozenTarget(Lazy[MyType]))
+        )
+
+    def test_lazy_resolves_wrapped_provider_on_first_get(self):
+        provider = self.provider_factory.create(InjectionContext(Target(Lazy[MyType], "my_name"), self.state))
+        lazy = provider.get()
+
+        instance = lazy.get()
+
+        self.assertIs(self.provider.get(), instance)
+        context = self.provider_creator.get_provider.call_args[0][0]
+        self.assertEqual(Target(MyType, "my_name"), context.target)
+        self.assertIsNone(context.parent_context)
+
+    def test_forward_reference_is_resolved_by_name(self):
+        provider = self.provider_factory.create(InjectionContext(Target(Lazy["MyType"]), self.state))
+
+        provider.get().get()
+
+        self.assertEqual(Target("MyType"), self.provider_creator.get_provider.call_args[0][0].target)
+
+    def test_named_lookup_without_binding_raises_no_binding_found(self):
+        context = InjectionContext(Target(Lazy[MyType], "my_name"), self.state, allow_jit_provider=False)
+
+        with self.assertRaises(NoBindingFound):
+            self.provider_factory.create(context)
+
+    def test_named_lookup_with_binding_returns_provider(self):
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(MyType, MyType(), named="my_name"), None))
+        context = InjectionContext(Target(Lazy[MyType], "my_name"), self.state, allow_jit_provider=False)
+
+        self.assertIsInstance(self.provider_factory.create(context), LazyProvider)
+
+    def test_other_type_raises_incompatible_provider_factory(self):
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(InjectionContext(Target(MyType), self.state))
@@ -0,0 +1,88 @@
+import unittest
+from inspect import signature
+from typing import Optional
+from unittest.mock import create_autospec
+
+from opyoid.bindings import BindingRegistry
+from opyoid.exceptions import IncompatibleProviderFactory, NoBindingFound
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator
+from opyoid.providers.providers_factories import MissingBindingProvider, MissingBindingProviderFactory
+from opyoid.target import Target
+
+
+class MyType:
+    def __init__(self, arg: int, optional_arg: Optional[int]):
+        self.arg = arg
+        self.optional_arg = optional_arg
+
+
+class TestMissingBindingProviderFactory(unittest.TestCase):
+    def setUp(self):
+        self.provider_factory = MissingBindingProviderFactory()
+        self.state = InjectionState(
+            create_autospec(ProviderCreator, spec_set=True),
+            create_autospec(BindingRegistry, spec_set=True),
+        )
+        self.parent_context = InjectionContext(Target(MyType), self.state)
+        self.parameter = signature(MyType).parameters["arg"]
+
+    def test_missing_parameter_returns_placeholder(self):
+        context = self.parent_context.get_child_context(
+            Target(int), current_class=MyType, current_parameter=self.parameter
+        )
+
+        provider = self.provider_factory.create(context)
+
+        self.assertIsInstance(provider, MissingBindingProvider)
+        self.assertEqual([Target(int)], self.provider_factory.missing_targets)
+        self.assertEqual(
+            [f"Could not find a binding for arg: int required by {__name__}.MyType"],
+            self.provider_factory.error_messages,
+        )
+        with self.assertRaises(NoBindingFound):
+            provider.get()
+
+    def test_missing_callable_parameter_is_required_by_parent_target(self):
+        context = self.parent_context.get_child_context(Target(int), current_parameter=self.parameter)
+
+        self.provider_factory.create(context)
+
+        self.assertEqual(
+            [f"Could not find a binding for arg: int required by {__name__}.MyType"],
+            self.provider_factory.error_messages,
+        )
+
+    def test_named_lookup_raises_incompatible_provider_factory(self):
+        context = self.parent_context.get_child_context(
+            Target(int, "arg"), allow_jit_provider=False, current_class=MyType, current_parameter=self.parameter
+        )
+
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(context)
+        self.assertEqual([], self.provider_factory.missing_targets)
+
+    def test_parameter_with_default_raises_incompatible_provider_factory(self):
+        context = self.parent_context.get_child_context(
+            Target(int, default=3), current_class=MyType, current_parameter=self.parameter
+        )
+
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(context)
+
+    def test_union_item_raises_incompatible_provider_factory(self):
+        parameter = signature(MyType).parameters["optional_arg"]
+        union_context = self.parent_context.get_child_context(
+            Target(Optional[int]), current_class=MyType, current_parameter=parameter
+        )
+        context = union_context.get_child_context(Target(int), current_class=MyType, current_parameter=parameter)
+
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(context)
+
+    def test_target_without_parameter_raises_incompatible_provider_factory(self):
+        context = self.parent_context.get_child_context(Target(int))
+
+        with self.assertRaises(IncompatibleProviderFactory):
+            self.provider_factory.create(context)
@@ -0,0 +1,57 @@
+import unittest
+from threading import Barrier, BrokenBarrierError, Thread
+
+from opyoid import Provider
+from opyoid.bindings import FromCallableProvider
+from opyoid.scopes.context_scoped_provider import ContextScopedProvider
+
+
+class MyType:
+    pass
+
+
+class TestContextScopedProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.class_provider = FromCallableProvider(MyType, [], None, {})
+        self.provider = ContextScopedProvider(self.class_provider)
+
+    def test_get_outside_context_returns_new_instances(self):
+        self.assertIsNot(self.provider.get(), self.provider.get())
+
+    def test_get_in_context_returns_same_instance(self):
+        self.provider.enter()
+
+        self.assertIs(self.provider.get(), self.provider.get())
+
+    def test_exit_clears_instance(self):
+        self.provider.enter()
+        instance = self.provider.get()
+        self.provider.exit()
+        self.provider.enter()
+
+        self.assertIsNot(instance, self.provider.get())
+
+    def test_different_threads_in_context_return_same_instance(self):
+        thread_count = 3
+        barrier = Barrier(thread_count)
+
+        class SlowProvider(Provider[MyType]):
+            def get(self) -> MyType:
+                # Without lock, all threads would create an instance at the same time
+                try:
+                    barrier.wait(0.2)
+                except BrokenBarrierError:
+                    pass
+                return MyType()
+
+        provider = ContextScopedProvider(SlowProvider())
+        provider.enter()
+        instances = []
+        threads = [Thread(target=lambda: instances.append(provider.get())) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1)
+
+        self.assertEqual(thread_count, len(instances))
+        self.assertEqual(1, len(set(map(id, instances))))
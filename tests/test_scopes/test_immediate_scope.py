@@ -31,3 +31,46 @@ class TestImmediateScope(unittest.TestCase):
         class_provider = FromCallableProvider(MyOtherType, [], None, {})
         self.scope.get_scoped_provider(class_provider)
         self.assertEqual(1, MyOtherType.created_count)
+
+    def test_deferred_instantiation_instantiates_when_leaving_context(self):
+        instances = []
+
+        class MyOtherType:
+            def __init__(self):
+                instances.append(self)
+
+        with ImmediateScope.deferred_instantiation():
+            scoped_provider = self.scope.get_scoped_provider(FromCallableProvider(MyOtherType, [], None, {}))
+            self.assertEqual([], instances)
+
+        self.assertEqual([scoped_provider.get()], instances)
+
+    def test_nested_deferred_instantiation_instantiates_when_leaving_outermost_context(self):
+        instances = []
+
+        class MyOtherType:
+            def __init__(self):
+                instances.append(self)
+
+        with ImmediateScope.deferred_instantiation():
+            with ImmediateScope.deferred_instantiation():
+                self.scope.get_scoped_provider(FromCallableProvider(MyOtherType, [], None, {}))
+            self.assertEqual([], instances)
+
+        self.assertEqual(1, len(instances))
+
+    def test_deferred_instantiation_is_cancelled_by_exception(self):
+        instances = []
+
+        class MyOtherType:
+            def __init__(self):
+                instances.append(self)
+
+        with self.assertRaises(ValueError):
+            with ImmediateScope.deferred_instantiation():
+                self.scope.get_scoped_provider(FromCallableProvider(MyOtherType, [], None, {}))
+                raise ValueError
+
+        self.assertEqual([], instances)
+        self.scope.get_scoped_provider(FromCallableProvider(MyOtherType, [], None, {}))
+        self.assertEqual(1, len(instances))
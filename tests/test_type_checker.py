@@ -1,7 +1,8 @@
+import collections.abc
 import unittest
-from typing import List, Optional, Set, Tuple, Type, Union
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type, Union
 
-from opyoid import Provider
+from opyoid import AssistedFactory, Lazy, Provider
 from opyoid.named import Named
 from opyoid.type_checker import PEP_604, TypeChecker
 
@@ -91,6 +92,35 @@ class TestTypeChecker(unittest.TestCase):
         self.assertTrue(self.type_checker.is_tuple(Tuple[TestClass]))
         self.assertFalse(self.type_checker.is_tuple(Named[TestClass]))
 
+    def test_is_iterable(self):
+        self.assertFalse(self.type_checker.is_iterable(str))
+        self.assertFalse(self.type_checker.is_iterable(Iterable))
+        self.assertTrue(self.type_checker.is_iterable(Iterable[str]))
+        self.assertTrue(self.type_checker.is_iterable(collections.abc.Iterable[TestClass]))
+        self.assertFalse(self.type_checker.is_iterable(List[TestClass]))
+        self.assertFalse(self.type_checker.is_iterable(Optional[Iterable[TestClass]]))
+
+    def test_is_mapping(self):
+        self.assertFalse(self.type_checker.is_mapping(str))
+        self.assertFalse(self.type_checker.is_mapping(Mapping))
+        self.assertTrue(self.type_checker.is_mapping(Mapping[str, TestClass]))
+        self.assertTrue(self.type_checker.is_mapping(collections.abc.Mapping[str, TestClass]))
+        self.assertFalse(self.type_checker.is_mapping(Dict[str, TestClass]))
+        self.assertFalse(self.type_checker.is_mapping(Optional[Mapping[str, TestClass]]))
+
+    def test_is_assisted_factory(self):
+        self.assertFalse(self.type_checker.is_assisted_factory(TestClass))
+        self.assertFalse(self.type_checker.is_assisted_factory(AssistedFactory))
+        self.assertTrue(self.type_checker.is_assisted_factory(AssistedFactory[TestClass]))
+        self.assertFalse(self.type_checker.is_assisted_factory(Lazy[TestClass]))
+
+    def test_is_lazy(self):
+        self.assertFalse(self.type_checker.is_lazy(str))
+        self.assertFalse(self.type_checker.is_lazy(Lazy))
+        self.assertTrue(self.type_checker.is_lazy(Lazy[TestClass]))
+        self.assertFalse(self.type_checker.is_lazy(Provider[TestClass]))
+        self.assertFalse(self.type_checker.is_lazy(Optional[Lazy[TestClass]]))
+
     def test_is_provider(self):
         self.assertFalse(self.type_checker.is_provider(str))
         self.assertFalse(self.type_checker.is_provider(TestClass))
@@ -145,7 +175,38 @@ class TestTypeChecker(unittest.TestCase):
         self.assertTrue(self.type_checker.is_type(type[str]))
         self.assertFalse(self.type_checker.is_type(type))
 
-    # pylint: disable=unsupported-binary-operation
+    def test_normalize_replaces_builtin_generics(self):
+        self.assertEqual(List[str], self.type_checker.normalize(list[str]))
+        self.assertEqual(Set[str], self.type_checker.normalize(set[str]))
+        self.assertEqual(Tuple[str, ...], self.type_checker.normalize(tuple[str, ...]))
+        self.assertEqual(Dict[str, int], self.type_checker.normalize(dict[str, int]))
+        self.assertEqual(Type[str], self.type_checker.normalize(type[str]))
+        self.assertEqual(Iterable[str], self.type_checker.normalize(collections.abc.Iterable[str]))
+        self.assertEqual(Mapping[str, int], self.type_checker.normalize(collections.abc.Mapping[str, int]))
+
+    def test_normalize_replaces_nested_builtin_generics(self):
+        self.assertEqual(
+            Optional[Dict[str, List[TestClass]]], self.type_checker.normalize(Optional[dict[str, list[TestClass]]])
+        )
+        self.assertEqual(Provider[List[TestClass]], self.type_checker.normalize(Provider[list[TestClass]]))
+        self.assertEqual(List[Set[TestClass]], self.type_checker.normalize(list[set[TestClass]]))
+
+    def test_normalize_keeps_union_member_order(self):
+        self.assertEqual((str, int), self.type_checker.normalize(Union[str, int]).__args__)
+        self.assertEqual((int, str), self.type_checker.normalize(Union[int, str]).__args__)
+
+    def test_normalize_keeps_other_types(self):
+        self.assertIs(TestClass, self.type_checker.normalize(TestClass))
+        self.assertEqual("TestClass", self.type_checker.normalize("TestClass"))
+        self.assertIs(List, self.type_checker.normalize(List))
+        optional_type = Optional[List[TestClass]]
+        self.assertIs(optional_type, self.type_checker.normalize(optional_type))
+
+    @unittest.skipIf(not PEP_604, "Python 3.10 required")
+    def test_normalize_pep604_unions(self):
+        self.assertEqual(Union[str, List[int], None], self.type_checker.normalize(str | list[int] | None))
+        self.assertEqual(List[Optional[str]], self.type_checker.normalize(list[str | None]))
+
     @unittest.skipIf(not PEP_604, "Python 3.10 required")
     def test_pep604_style(self):
         self.assertTrue(self.type_checker.is_union(str | None))
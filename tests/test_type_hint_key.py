@@ -0,0 +1,24 @@
+import unittest
+from typing import Callable, List, Literal, Union
+
+from opyoid.type_hint_key import get_type_hint_key
+
+
+class MyType:
+    pass
+
+
+class TestTypeHintKey(unittest.TestCase):
+    def test_same_type_hints_have_the_same_key(self):
+        self.assertEqual(get_type_hint_key(MyType), get_type_hint_key(MyType))
+        self.assertEqual(get_type_hint_key(List[MyType]), get_type_hint_key(List[MyType]))
+        self.assertEqual(get_type_hint_key(Callable[[int], str]), get_type_hint_key(Callable[[int], str]))
+
+    def test_union_member_order_is_kept(self):
+        self.assertNotEqual(get_type_hint_key(Union[MyType, str]), get_type_hint_key(Union[str, MyType]))
+
+    def test_argument_types_are_kept(self):
+        self.assertNotEqual(get_type_hint_key(Literal[1]), get_type_hint_key(Literal[True]))
+
+    def test_builtin_and_typing_generics_have_different_keys(self):
+        self.assertNotEqual(get_type_hint_key(list[int]), get_type_hint_key(List[int]))
@@ -1,15 +1,24 @@
+import inspect
 import os
+import threading
+import time
 import unittest
-from typing import cast, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
+from dataclasses import dataclass
+from typing import cast, Dict, Generic, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Type, TypeVar, Union
+from unittest.mock import patch
 
 import attr
 
 from opyoid import (
+    AssistedFactory,
     ClassBinding,
+    DictConfigSource,
     ImmediateScope,
     Injector,
     InstanceBinding,
     ItemBinding,
+    Lazy,
+    MapBinding,
     Module,
     MultiBinding,
     named_arg,
@@ -29,6 +38,24 @@ class MyClass:
     pass
 
 
+@dataclass
+class MyDataclass:
+    my_param: "MyClass"
+    my_list: "List[MyClass]"
+    my_default: str = "default"
+
+
+@attr.s(auto_attribs=True)
+class MyAttrsClass:
+    _my_param: MyClass
+    my_keyword: str = attr.ib(default="default", kw_only=True)
+
+
+class MyNamedTuple(NamedTuple):
+    my_param: MyClass
+    my_default: str = "default"
+
+
 class TestInjector(unittest.TestCase):
     @staticmethod
     def get_injector(*classes_to_bind) -> Injector:
@@ -171,6 +198,303 @@ class TestInjector(unittest.TestCase):
         self.assertEqual(1, len(list(parent.param)))
         self.assertIsInstance(parent.param.pop(), MyClass)
 
+    def test_lazy_iterable_injection(self):
+        created = []
+
+        class MyItem:
+            def __init__(self):
+                created.append(self)
+
+        class MyOtherItem(MyItem):
+            pass
+
+        class MyParentClass:
+            def __init__(self, param: Iterable[MyItem]):
+                self.param = param
+
+        injector = Injector(
+            bindings=[
+                MultiBinding(
+                    MyItem,
+                    [ItemBinding(bound_class=MyItem), ItemBinding(bound_class=MyOtherItem)],
+                    scope=PerLookupScope,
+                ),
+                SelfBinding(MyParentClass),
+            ]
+        )
+        parent = injector.inject(MyParentClass)
+        self.assertEqual([], created)
+
+        first_item = next(iter(parent.param))
+        self.assertEqual([first_item], created)
+        items = list(parent.param)
+        self.assertEqual(created, items)
+        self.assertIs(first_item, items[0])
+        self.assertIsInstance(items[1], MyOtherItem)
+
+    def test_lazy_iterable_shares_singleton_items_with_list(self):
+        injector = Injector(bindings=[MultiBinding(MyClass, [ItemBinding(bound_class=MyClass)])])
+
+        self.assertIs(injector.inject(List[MyClass])[0], list(injector.inject(Iterable[MyClass]))[0])
+
+    def test_set_and_tuple_share_multi_binding_scope(self):
+        injector = Injector(
+            bindings=[
+                MultiBinding(MyClass, [ItemBinding(bound_class=MyClass)]),
+                MultiBinding(str, [ItemBinding(bound_instance="value")], scope=PerLookupScope),
+            ]
+        )
+
+        self.assertIs(injector.inject(Set[MyClass]), injector.inject(Set[MyClass]))
+        self.assertIs(injector.inject(Tuple[MyClass]), injector.inject(Tuple[MyClass]))
+        self.assertIsNot(injector.inject(Set[str]), injector.inject(Set[str]))
+
+    def test_parallel_multi_binding_injection(self):
+        barrier = threading.Barrier(2)
+
+        class MyItem:
+            def __init__(self):
+                barrier.wait(timeout=5)
+
+        class MyOtherItem(MyItem):
+            pass
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(
+                    MyItem, [self.bind_item(to_class=MyItem), self.bind_item(to_class=MyOtherItem)], parallel=True
+                )
+
+        items = Injector([MyModule]).inject(List[MyItem])
+
+        self.assertEqual([MyItem, MyOtherItem], [type(item) for item in items])
+
+    def test_parallel_multi_binding_items_share_context_scoped_dependency(self):
+        class MyDependency:
+            def __init__(self):
+                # Lets the other items request the dependency while it is being created
+                time.sleep(0.05)
+
+        class MyItem:
+            def __init__(self, dependency: MyDependency):
+                self.dependency = dependency
+
+        class MyOtherItem(MyItem):
+            pass
+
+        class MyThirdItem(MyItem):
+            pass
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyDependency, scope=ContextScope)
+                self.multi_bind(
+                    MyItem,
+                    [
+                        self.bind_item(to_class=MyItem),
+                        self.bind_item(to_class=MyOtherItem),
+                        self.bind_item(to_class=MyThirdItem),
+                    ],
+                    parallel=True,
+                )
+
+        injector = Injector([MyModule])
+        with injector.inject(ContextScope):
+            items = injector.inject(List[MyItem])
+
+        self.assertEqual(1, len({id(item.dependency) for item in items}))
+
+    def test_concurrent_auto_bindings_injection(self):
+        class MyDependency:
+            pass
+
+        class MyParentClass:
+            def __init__(self, dependency: MyDependency):
+                self.dependency = dependency
+
+        class MyOtherParentClass:
+            def __init__(self, dependency: MyDependency):
+                self.dependency = dependency
+
+        injector = Injector(options=InjectorOptions(auto_bindings=True))
+        barrier = threading.Barrier(16)
+        instances = []
+
+        def inject(target_type: type) -> None:
+            barrier.wait(timeout=5)
+            instances.append(injector.inject(target_type))
+
+        threads = [
+            threading.Thread(target=inject, args=(MyParentClass if index % 2 else MyOtherParentClass,))
+            for index in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(16, len(instances))
+        self.assertEqual(2, len(set(map(id, instances))))
+        self.assertEqual(1, len(set(id(instance.dependency) for instance in instances)))
+
+    def test_lazy_injection(self):
+        created = []
+
+        class MyDependency:
+            def __init__(self):
+                created.append(self)
+
+        class MyParentClass:
+            def __init__(self, dependency: Lazy[MyDependency]):
+                self.dependency = dependency
+
+        injector = Injector(bindings=[SelfBinding(MyParentClass), SelfBinding(MyDependency)])
+
+        parent = injector.inject(MyParentClass)
+        self.assertEqual([], created)
+        self.assertIs(parent.dependency.get(), parent.dependency.get())
+        self.assertEqual([parent.dependency.get()], created)
+        self.assertIs(injector.inject(MyDependency), parent.dependency.get())
+
+    def test_lazy_injection_breaks_cycles(self):
+        class MyParentClass:
+            def __init__(self, child: Lazy["MyChildClass"]):
+                self.child = child
+
+        class MyChildClass:
+            def __init__(self, parent: MyParentClass):
+                self.parent = parent
+
+        injector = Injector(bindings=[SelfBinding(MyParentClass), SelfBinding(MyChildClass)])
+
+        parent = injector.inject(MyParentClass)
+        self.assertIs(parent, parent.child.get().parent)
+
+    def test_named_lazy_injection(self):
+        instance = MyClass()
+
+        class MyParentClass:
+            def __init__(self, my_param: Lazy[MyClass], other_param: Lazy[MyClass]):
+                self.my_param = my_param
+                self.other_param = other_param
+
+        injector = Injector(
+            bindings=[
+                SelfBinding(MyParentClass),
+                SelfBinding(MyClass),
+                InstanceBinding(MyClass, instance, named="my_param"),
+            ]
+        )
+
+        parent = injector.inject(MyParentClass)
+        self.assertIs(instance, parent.my_param.get())
+        self.assertIsNot(instance, parent.other_param.get())
+
+    def test_assisted_factory_injection(self):
+        class MyRequestHandler:
+            def __init__(self, dependency: MyClass, request_id: str, retries: int = 3):
+                self.dependency = dependency
+                self.request_id = request_id
+                self.retries = retries
+
+        class MyParentClass:
+            def __init__(self, handler_factory: AssistedFactory[MyRequestHandler]):
+                self.handler_factory = handler_factory
+
+        injector = Injector(bindings=[SelfBinding(MyParentClass), SelfBinding(MyClass), InstanceBinding(int, 5)])
+
+        handler_factory = injector.inject(MyParentClass).handler_factory
+        handler_1 = handler_factory(request_id="request_1")
+        handler_2 = handler_factory(request_id="request_2", retries=1)
+        self.assertEqual(("request_1", 5), (handler_1.request_id, handler_1.retries))
+        self.assertEqual(("request_2", 1), (handler_2.request_id, handler_2.retries))
+        self.assertIs(injector.inject(MyClass), handler_1.dependency)
+        self.assertIsNot(handler_1, handler_2)
+
+    def test_map_injection(self):
+        class MyOtherClass(MyClass):
+            pass
+
+        class MyParentClass:
+            def __init__(self, param: Dict[str, MyClass]):
+                self.param = param
+
+        injector = Injector(
+            bindings=[
+                MapBinding(
+                    str,
+                    MyClass,
+                    {"first": ItemBinding(bound_class=MyClass), "other": ItemBinding(bound_class=MyOtherClass)},
+                ),
+                SelfBinding(MyParentClass),
+            ]
+        )
+
+        parent = injector.inject(MyParentClass)
+        self.assertEqual(["first", "other"], list(parent.param))
+        self.assertIsInstance(parent.param["other"], MyOtherClass)
+        self.assertIs(parent.param, injector.inject(Dict[str, MyClass]))
+
+    def test_lazy_mapping_injection(self):
+        created = []
+
+        class MyItem:
+            def __init__(self):
+                created.append(self)
+
+        class MyOtherItem(MyItem):
+            pass
+
+        injector = Injector(
+            bindings=[
+                MapBinding(
+                    str,
+                    MyItem,
+                    {"item": ItemBinding(bound_class=MyItem), "other": ItemBinding(bound_class=MyOtherItem)},
+                )
+            ]
+        )
+
+        mapping = injector.inject(Mapping[str, MyItem])
+        self.assertEqual(["item", "other"], list(mapping))
+        self.assertEqual([], created)
+        self.assertIsInstance(mapping["other"], MyOtherItem)
+        self.assertEqual([mapping["other"]], created)
+
+    def test_map_binding_extended_in_other_module(self):
+        class MyOtherClass(MyClass):
+            pass
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.map_bind(str, MyClass, {"first": self.bind_item(to_class=MyClass)})
+
+        class MyOtherModule(Module):
+            def configure(self) -> None:
+                self.install(MyModule)
+                self.map_bind(str, MyClass, {"other": self.bind_item(to_class=MyOtherClass)})
+
+        mapping = Injector([MyOtherModule]).inject(Dict[str, MyClass])
+
+        self.assertEqual(["first", "other"], list(mapping))
+        self.assertIsInstance(mapping["other"], MyOtherClass)
+
+    def test_private_module_exposes_map_binding(self):
+        class MyParentClass:
+            def __init__(self, arg: MyClass):
+                self.arg = arg
+
+        class MyPrivateModule(PrivateModule):
+            def configure(self) -> None:
+                self.expose(self.map_bind(str, MyParentClass, {"parent": self.bind_item(to_class=MyParentClass)}))
+                self.bind(MyClass)
+
+        injector = Injector([MyPrivateModule()])
+
+        self.assertIsInstance(injector.inject(Dict[str, MyParentClass])["parent"].arg, MyClass)
+        with self.assertRaises(NoBindingFound):
+            injector.inject(MyClass)
+
     def test_list_direct_injection(self):
         class_list = Injector(bindings=[MultiBinding(MyClass, [ItemBinding(bound_class=MyClass)])]).inject(
             List[MyClass]
@@ -197,6 +521,14 @@ class TestInjector(unittest.TestCase):
         self.assertIsInstance(parent, MyParentClass)
         self.assertIsInstance(parent.param, MyClass)
 
+    def test_union_member_order_does_not_depend_on_previous_injections(self):
+        injector = Injector(bindings=[InstanceBinding(str, "hello"), InstanceBinding(int, 1)])
+
+        self.assertEqual("hello", injector.inject(Union[str, int]))
+        self.assertEqual(
+            1, Injector(bindings=[InstanceBinding(str, "hello"), InstanceBinding(int, 1)]).inject(Union[int, str])
+        )
+
     def test_list_union_injection(self):
         class MyParentClass:
             def __init__(self, params: List[Union[str, int]]):
@@ -1411,6 +1743,67 @@ class TestInjector(unittest.TestCase):
         instance = injector.inject(MyEnvClass)
         self.assertEqual("renamed_value", instance.key)
 
+    def test_loading_same_parameter_of_different_classes_from_env_vars(self):
+        @attr.s(auto_attribs=True)
+        class MyEnvClass:
+            my_key: str
+
+        @attr.s(auto_attribs=True)
+        class MyOtherEnvClass:
+            my_key: str
+
+        with patch.dict(os.environ, {"MY_ENV_CLASS_MY_KEY": "value", "MY_OTHER_ENV_CLASS_MY_KEY": "other_value"}):
+            injector = Injector(bindings=[SelfBinding(MyEnvClass), SelfBinding(MyOtherEnvClass)])
+
+        self.assertEqual("value", injector.inject(MyEnvClass).my_key)
+        self.assertEqual("other_value", injector.inject(MyOtherEnvClass).my_key)
+
+    def test_env_vars_snapshot(self):
+        @attr.s(auto_attribs=True)
+        class MyEnvClass:
+            my_key: str = "default"
+
+        with patch.dict(os.environ, {"MY_ENV_CLASS_MY_KEY": "value"}):
+            injector = Injector(options=InjectorOptions(auto_bindings=True, snapshot_env_vars=True))
+        with patch.dict(os.environ, {"MY_ENV_CLASS_MY_KEY": "new_value"}):
+            instance = injector.inject(MyEnvClass)
+
+        self.assertEqual("value", instance.my_key)
+
+    def test_loading_from_config_sources(self):
+        @attr.s(auto_attribs=True)
+        class MyConfigClass:
+            port: int
+            hosts: List[str]
+            name: str = "default"
+            debug: bool = False
+
+        injector = Injector(
+            bindings=[SelfBinding(MyConfigClass), InstanceBinding(str, "bound_name", named="name")],
+            options=InjectorOptions(
+                config_sources=[
+                    DictConfigSource({"MyConfigClass": {"port": 8080, "name": "configured_name"}}),
+                    DictConfigSource({"MyConfigClass": {"port": 1234, "hosts": ["host_1", "host_2"]}}),
+                ]
+            ),
+        )
+        instance = injector.inject(MyConfigClass)
+
+        self.assertEqual(MyConfigClass(8080, ["host_1", "host_2"], "configured_name", False), instance)
+
+    def test_env_vars_override_config_sources(self):
+        @attr.s(auto_attribs=True)
+        class MyConfigClass:
+            port: int
+
+        with patch.dict(os.environ, {"MY_CONFIG_CLASS_PORT": "1234"}):
+            injector = Injector(
+                bindings=[SelfBinding(MyConfigClass)],
+                options=InjectorOptions(config_sources=[DictConfigSource({"MyConfigClass": {"port": 8080}})]),
+            )
+
+        self.assertEqual(1234, injector.inject(MyConfigClass).port)
+
     def test_context_scope(self):
         class MyOtherClass:
             pass
@@ -1546,6 +1939,17 @@ class TestInjector(unittest.TestCase):
         self.assertIs(result_1[0], result_2[2])
         self.assertIs(result_1[2], instance)
 
+    def test_equivalent_type_hints_share_providers(self):
+        class MultiModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MyClass, [self.bind_item(to_class=MyClass)])
+
+        injector = Injector([MultiModule()])
+        class_list = injector.inject(List[MyClass])
+        self.assertIs(class_list, injector.inject(list[MyClass]))
+        self.assertIs(class_list, injector.inject(Optional[list[MyClass]]))
+        self.assertIs(injector.get_provider(List[MyClass]), injector.get_provider(list[MyClass]))
+
     def test_multi_bind_with_no_binding(self):
         injector = Injector([])
         with self.assertRaises(NoBindingFound):
@@ -1570,3 +1974,256 @@ class TestInjector(unittest.TestCase):
         )
         result = injector.inject(MyUnequalClass)
         self.assertEqual(2, result.arg)
+
+    def test_register_extends_multi_binding_and_derived_collections(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MyClass, [self.bind_item(to_class=MyClass)])
+
+        class MyOtherModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MyClass, [self.bind_item(to_instance=MyClass())])
+
+        class MyParentClass:
+            def __init__(self, my_param: Set[MyClass]):
+                self.my_param = my_param
+
+        injector = Injector([MyModule], [SelfBinding(MyParentClass)])
+        self.assertEqual(1, len(injector.inject(MyParentClass).my_param))
+
+        injector.register([MyOtherModule])
+
+        self.assertEqual(2, len(injector.inject(List[MyClass])))
+        self.assertEqual(2, len(injector.inject(MyParentClass).my_param))
+
+    def test_register_keeps_unaffected_singletons(self):
+        class MyParentClass:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        class MySubClass(MyClass):
+            pass
+
+        injector = Injector(bindings=[SelfBinding(MyClass), SelfBinding(MyParentClass)])
+        my_instance = injector.inject(MyClass)
+        parent_instance = injector.inject(MyParentClass)
+
+        injector.register(bindings=[ClassBinding(MyParentClass, MySubClass)])
+
+        self.assertIs(my_instance, injector.inject(MyClass))
+        self.assertIsNot(parent_instance, injector.inject(MyParentClass))
+        self.assertIsInstance(injector.inject(MyParentClass), MySubClass)
+
+    def test_get_provider_from_injector(self):
+        class MyParentClass:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        injector = Injector(bindings=[SelfBinding(MyClass), SelfBinding(MyParentClass, scope=PerLookupScope)])
+        provider = injector.get_provider(MyParentClass)
+
+        instances = [provider.get() for _ in range(3)]
+
+        self.assertEqual(3, len(set(map(id, instances))))
+        self.assertEqual({id(injector.inject(MyClass))}, {id(instance.my_param) for instance in instances})
+
+    def test_inject_many(self):
+        class MyParentClass:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        injector = Injector(
+            bindings=[SelfBinding(MyClass), SelfBinding(MyParentClass), InstanceBinding(str, "value", named="my_name")]
+        )
+
+        my_instance, parent_instance, value = injector.inject_many([MyClass, MyParentClass, (str, "my_name")])
+
+        self.assertIs(my_instance, parent_instance.my_param)
+        self.assertEqual("value", value)
+
+    def test_call_function_with_injected_parameters(self):
+        class MyRequest:
+            pass
+
+        class MyService:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        injector = Injector(
+            bindings=[
+                SelfBinding(MyClass),
+                SelfBinding(MyService),
+                MultiBinding(str, [ItemBinding(bound_instance="first"), ItemBinding(bound_instance="second")]),
+            ]
+        )
+
+        @injector.injected
+        def handle(request: MyRequest, service: MyService, *names: str, retries: int = 2):
+            return request, service, names, retries
+
+        request = MyRequest()
+        self.assertEqual(
+            (request, injector.inject(MyService), ("first", "second"), 2),
+            handle(request),  # pylint: disable=no-value-for-parameter
+        )
+        self.assertEqual(5, injector.call(inspect.unwrap(handle), request=request, retries=5)[3])
+
+    @patch.dict(os.environ, {"MY_VIEW_TIMEOUT": "3"})
+    def test_inject_members_into_existing_instance(self):
+        class MyService:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        class MyView:
+            service: MyService
+            timeout: int
+            label: str = "label"
+
+            def __init__(self, request: str):
+                self.request = request
+
+        injector = Injector(bindings=[SelfBinding(MyClass), SelfBinding(MyService)])
+
+        view = injector.inject_members(MyView("request"))
+
+        self.assertIs(injector.inject(MyService), view.service)
+        self.assertEqual(3, view.timeout)
+        self.assertEqual("request", view.request)
+        self.assertEqual("label", view.label)
+
+    def test_inject_classes_with_fields(self):
+        injector = Injector(
+            bindings=[
+                SelfBinding(MyClass),
+                SelfBinding(MyDataclass),
+                SelfBinding(MyAttrsClass),
+                SelfBinding(MyNamedTuple),
+                InstanceBinding(str, "value", named="my_keyword"),
+            ]
+        )
+        my_instance = injector.inject(MyClass)
+
+        self.assertEqual(MyDataclass(my_instance, [my_instance]), injector.inject(MyDataclass))
+        self.assertEqual(MyAttrsClass(my_instance, my_keyword="value"), injector.inject(MyAttrsClass))
+        self.assertEqual(MyNamedTuple(my_instance), injector.inject(MyNamedTuple))
+
+    def test_register_creates_immediate_scoped_instances(self):
+        instances = []
+
+        class MyImmediateClass:
+            def __init__(self, my_param: str):
+                instances.append(my_param)
+
+        injector = Injector(
+            bindings=[InstanceBinding(str, "first"), SelfBinding(MyImmediateClass, scope=ImmediateScope)]
+        )
+        self.assertEqual(["first"], instances)
+
+        injector.register(bindings=[InstanceBinding(str, "second")])
+
+        self.assertEqual(["first", "second"], instances)
+
+    def test_immediate_scoped_constructor_does_not_block_other_threads(self):
+        constructor_started = threading.Event()
+        constructor_released = threading.Event()
+
+        class MySlowClass:
+            def __init__(self):
+                constructor_started.set()
+                constructor_released.wait(5)
+
+        injector = Injector(bindings=[SelfBinding(MyClass)])
+        register_thread = threading.Thread(
+            target=lambda: injector.register(bindings=[SelfBinding(MySlowClass, scope=ImmediateScope)])
+        )
+        register_thread.start()
+        constructor_started.wait(5)
+        injected_lists = []
+        inject_thread = threading.Thread(target=lambda: injected_lists.append(injector.inject(List[MyClass])))
+        inject_thread.start()
+        inject_thread.join(5)
+        inject_thread_is_blocked = inject_thread.is_alive()
+        constructor_released.set()
+        register_thread.join(5)
+
+        self.assertFalse(inject_thread_is_blocked)
+
+        self.assertEqual([[injector.inject(MyClass)]], injected_lists)
+
+    def test_register_invalidates_private_module_providers(self):
+        class MyParentClass:
+            def __init__(self, my_param: MyClass):
+                self.my_param = my_param
+
+        class MyPrivateModule(PrivateModule):
+            def configure(self) -> None:
+                self.expose(self.bind(MyParentClass))
+
+        my_instance = MyClass()
+        injector = Injector([MyPrivateModule()], [SelfBinding(MyClass)])
+        self.assertIsNot(my_instance, injector.inject(MyParentClass).my_param)
+
+        injector.register(bindings=[InstanceBinding(MyClass, my_instance)])
+
+        self.assertIs(my_instance, injector.inject(MyParentClass).my_param)
+
+    def test_deep_module_tree(self):
+        class LeafModule(Module):
+            def configure(self) -> None:
+                self.bind(MyClass)
+                self.multi_bind(MyClass, [self.bind_item(to_class=MyClass)])
+
+        class NodeModule(Module):
+            def __init__(self, depth: int):
+                super().__init__()
+                self.depth = depth
+
+            def configure(self) -> None:
+                self.install(NodeModule(self.depth - 1) if self.depth > 0 else LeafModule())
+                self.multi_bind(MyClass, [self.bind_item(to_class=MyClass)])
+
+        my_instance = MyClass()
+
+        class OverridingModule(Module):
+            def configure(self) -> None:
+                self.install(NodeModule(200))
+                self.bind(MyClass, to_instance=my_instance)
+
+        injector = Injector([OverridingModule()])
+
+        self.assertIs(my_instance, injector.inject(MyClass))
+        self.assertEqual(202, len(injector.inject(List[MyClass])))
+
+    def test_modules_installing_each_other(self):
+        class MyOtherClass:
+            pass
+
+        class MyModuleA(Module):
+            def configure(self) -> None:
+                self.install(MyModuleB)
+                self.bind(MyClass)
+
+        class MyModuleB(Module):
+            def configure(self) -> None:
+                self.install(MyModuleA)
+                self.bind(MyOtherClass)
+
+        injector = Injector([MyModuleA])
+
+        self.assertIsInstance(injector.inject(MyClass), MyClass)
+        self.assertIsInstance(injector.inject(MyOtherClass), MyOtherClass)
+
+    def test_module_installing_itself(self):
+        class MyOtherClass:
+            pass
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyClass)
+                self.install(self)
+                self.bind(MyOtherClass)
+
+        injector = Injector([MyModule])
+
+        self.assertIsInstance(injector.inject(MyClass), MyClass)
+        self.assertIsInstance(injector.inject(MyOtherClass), MyOtherClass)